@@ -0,0 +1,266 @@
+# a_estrella_distribuida.py
+# --------------------------------------------------------
+# A* distribuido por hash (HDA*) entre procesos.
+#
+# Cada estado tiene un dueño: el proceso hash(estado) % procesos
+# (el hash de una tupla de enteros es el mismo en todos los procesos).
+# Cada proceso guarda g, padre y acción sólo de sus estados y tiene
+# su propia cola de prioridad (f, id, estado, g).
+#
+# Ciclo de cada proceso:
+#   1) recibir lotes de (estado, g, padre, accion) de su cola de entrada
+#      y relajarlos (se acepta si mejora g; se reabre si ya salió)
+#   2) expandir hasta 'tamano_lote' nodos con f < incumbente
+#   3) mandar los sucesores ajenos a su dueño, agrupados en un lote por
+#      destino (una operación de cola por lote, no por estado)
+#
+# Incumbente: costo de la mejor solución encontrada, compartido entre
+# todos los procesos. Un objetivo se registra al relajarlo en su dueño
+# y los nodos con f >= incumbente se podan.
+#
+# Terminación (cuatro contadores de Mattern): cada proceso cuenta los
+# lotes enviados y recibidos y marca si está inactivo (sin nodos con
+# f < incumbente y sin lotes por leer). El coordinador lee en una
+# primera pasada los recibidos y en una segunda los enviados; si todos
+# estuvieron inactivos en ambas pasadas y recibidos == enviados, no hay
+# lotes en tránsito ni trabajo pendiente. Con heurística admisible
+# todo nodo sin expandir tiene f >= incumbente, así que el costo es
+# óptimo (entre caminos de igual costo, cuál se devuelve depende del
+# orden en que llegan los lotes).
+#
+# Arranque: con 'fork' (Linux) el problema se hereda tal cual; con
+# 'spawn' el problema y su heurística deben poder serializarse (pickle).
+# --------------------------------------------------------
+
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+from heapq import heappush, heappop
+
+TAMANO_LOTE_POR_DEFECTO = 64
+ESPERA_INACTIVO_SEGUNDOS = 0.002
+
+
+# 1) Proceso de trabajo
+
+def _trabajador(indice, procesos, problema, estado_inicial, tamano_lote, colas, resultados,
+                incumbente, candado_incumbente, enviados, recibidos, inactivos, detener):
+    """
+    Bucle de un proceso de HDA*. Al terminar pone en 'resultados'
+    (indice, estado_objetivo, costo, padre, accion, expandidos) o
+    (indice, None, error, ...) si falló.
+    """
+    try:
+        funcion_heuristica = problema.funcion_heuristica
+        es_estado_final = problema.es_estado_final
+        sucesores = problema.sucesores
+        entrada = colas[indice]
+
+        costo_acumulado = {}
+        diccionario_padre = {}
+        diccionario_accion = {}
+        abiertos = []  # (f, id_incremental, estado, g)
+        id_incremental = 0
+        mejor_objetivo = None
+        mejor_costo = float("inf")
+        expandidos = 0
+        salientes = [[] for _ in range(procesos)]
+
+        def relajar(estado, g, padre, accion):
+            nonlocal id_incremental, mejor_objetivo, mejor_costo
+            previo = costo_acumulado.get(estado)
+            if previo is not None and g >= previo:
+                return
+            costo_acumulado[estado] = g
+            diccionario_padre[estado] = padre
+            diccionario_accion[estado] = accion
+            if es_estado_final(estado):
+                if g < mejor_costo:
+                    mejor_objetivo, mejor_costo = estado, g
+                    with candado_incumbente:
+                        if g < incumbente.value:
+                            incumbente.value = g
+                return
+            id_incremental += 1
+            heappush(abiertos, (g + funcion_heuristica(estado), id_incremental, estado, g))
+
+        if hash(estado_inicial) % procesos == indice:
+            relajar(estado_inicial, 0, None, None)
+
+        while not detener.is_set():
+            # 1) Recibir (bloquea un poco sólo si no hay nada que hacer)
+            recibio = False
+            limite = incumbente.value
+            hay_trabajo = bool(abiertos) and abiertos[0][0] < limite
+            while True:
+                try:
+                    if recibio or hay_trabajo:
+                        lote = entrada.get_nowait()
+                    else:
+                        lote = entrada.get(timeout=ESPERA_INACTIVO_SEGUNDOS)
+                except queue.Empty:
+                    break
+                inactivos[indice] = 0
+                recibidos[indice] += 1
+                recibio = True
+                for estado, g, padre, accion in lote:
+                    relajar(estado, g, padre, accion)
+
+            # 2) Expandir hasta 'tamano_lote' nodos con f < incumbente
+            limite = incumbente.value
+            expandidos_lote = 0
+            while abiertos and expandidos_lote < tamano_lote:
+                f, _id, estado, g = abiertos[0]
+                if f >= limite:
+                    break
+                heappop(abiertos)
+                if g != costo_acumulado[estado]:
+                    continue  # entrada vieja: el estado mejoró después
+                expandidos_lote += 1
+                for accion, sucesor, costo_de_accion in sucesores(estado):
+                    dueno = hash(sucesor) % procesos
+                    if dueno == indice:
+                        relajar(sucesor, g + costo_de_accion, estado, accion)
+                    else:
+                        salientes[dueno].append((sucesor, g + costo_de_accion, estado, accion))
+                limite = incumbente.value
+            expandidos += expandidos_lote
+
+            # 3) Enviar un lote por destino (contar antes de poner en la cola)
+            for destino, lote in enumerate(salientes):
+                if lote:
+                    enviados[indice] += 1
+                    colas[destino].put(lote)
+                    salientes[destino] = []
+
+            if not recibio and expandidos_lote == 0:
+                inactivos[indice] = 1
+
+        resultados.put((indice, mejor_objetivo, mejor_costo, diccionario_padre, diccionario_accion, expandidos))
+    except Exception:
+        inactivos[indice] = 1
+        resultados.put((indice, None, traceback.format_exc(), {}, {}, 0))
+
+
+# 2) Detección de terminación
+
+def _terminado(inactivos, enviados, recibidos):
+    """
+    Dos pasadas: recibidos (primera) == enviados (segunda) y todos inactivos.
+    """
+    if not all(inactivos):
+        return False
+    total_recibidos = sum(recibidos)
+    if not all(inactivos):
+        return False
+    total_enviados = sum(enviados)
+    return total_recibidos == total_enviados and all(inactivos)
+
+
+# 3) Coordinador
+
+def _lanzar_error(resultados, trabajadores):
+    """
+    Lanza RuntimeError con la traza del proceso que falló (o su código de salida).
+    """
+    try:
+        while True:
+            indice, _objetivo, error, *_resto = resultados.get(timeout=1)
+            if isinstance(error, str):
+                raise RuntimeError(f"Falló el proceso {indice} de HDA*:\n{error}")
+    except queue.Empty:
+        pass
+    codigos = [t.exitcode for t in trabajadores]
+    raise RuntimeError(f"Un proceso de HDA* terminó de forma inesperada (códigos de salida: {codigos}).")
+
+
+def _contexto():
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def busqueda_a_estrella_distribuida(problema, estado_inicial=None, procesos=None,
+                                    tamano_lote=TAMANO_LOTE_POR_DEFECTO):
+    """
+    HDA* sobre 'problema' con 'procesos' procesos (por defecto, os.cpu_count()).
+    Devuelve (estado_objetivo, diccionario_padre, diccionario_accion, estadisticas):
+    padre y acción reúnen las tablas de todos los procesos, así que sirven
+    para reconstruir_camino; estadisticas tiene 'procesos', 'expandidos',
+    'expandidos_por_proceso', 'segundos' y 'expansiones_por_segundo'.
+    Con heurística admisible el costo del camino es óptimo.
+    """
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    estado_inicial = tuple(estado_inicial)
+    procesos = procesos or os.cpu_count() or 1
+    if procesos < 1:
+        raise ValueError(f"Se necesita al menos un proceso: {procesos}")
+    if tamano_lote < 1:
+        raise ValueError(f"El tamaño de lote debe ser al menos 1: {tamano_lote}")
+
+    contexto = _contexto()
+    colas = [contexto.Queue() for _ in range(procesos)]
+    resultados = contexto.Queue()
+    incumbente = contexto.Value("d", float("inf"), lock=False)
+    candado_incumbente = contexto.Lock()
+    enviados = contexto.Array("q", procesos, lock=False)
+    recibidos = contexto.Array("q", procesos, lock=False)
+    inactivos = contexto.Array("b", procesos, lock=False)
+    detener = contexto.Event()
+
+    inicio = time.perf_counter()
+    trabajadores = [
+        contexto.Process(
+            target=_trabajador,
+            args=(i, procesos, problema, estado_inicial, tamano_lote, colas, resultados,
+                  incumbente, candado_incumbente, enviados, recibidos, inactivos, detener),
+            daemon=True,
+        )
+        for i in range(procesos)
+    ]
+    for trabajador in trabajadores:
+        trabajador.start()
+
+    try:
+        while not _terminado(inactivos, enviados, recibidos):
+            if not all(t.is_alive() for t in trabajadores):
+                # Ningún proceso sale antes de 'detener' salvo por un error
+                _lanzar_error(resultados, trabajadores)
+            time.sleep(ESPERA_INACTIVO_SEGUNDOS)
+        segundos = time.perf_counter() - inicio
+        detener.set()
+        respuestas = [resultados.get() for _ in trabajadores]
+    finally:
+        detener.set()
+        for trabajador in trabajadores:
+            trabajador.join(timeout=5)
+            if trabajador.is_alive():
+                trabajador.terminate()
+
+    diccionario_padre = {}
+    diccionario_accion = {}
+    expandidos_por_proceso = [0] * procesos
+    candidatos = []
+    for indice, objetivo, costo, padre, accion, expandidos in sorted(respuestas, key=lambda r: r[0]):
+        if objetivo is None and isinstance(costo, str):
+            raise RuntimeError(f"Falló el proceso {indice} de HDA*:\n{costo}")
+        diccionario_padre.update(padre)
+        diccionario_accion.update(accion)
+        expandidos_por_proceso[indice] = expandidos
+        if objetivo is not None:
+            candidatos.append((costo, objetivo))
+
+    # Mejor objetivo; entre empates, el menor estado (determinista)
+    estado_objetivo = min(candidatos)[1] if candidatos else None
+    total_expandidos = sum(expandidos_por_proceso)
+    estadisticas = {
+        "procesos": procesos,
+        "expandidos": total_expandidos,
+        "expandidos_por_proceso": expandidos_por_proceso,
+        "segundos": segundos,
+        "expansiones_por_segundo": total_expandidos / segundos if segundos > 0 else 0.0,
+    }
+    return estado_objetivo, diccionario_padre, diccionario_accion, estadisticas
@@ -0,0 +1,155 @@
+# ara_estrella.py
+# --------------------------------------------------------
+# ARA* (Anytime Repairing A*) sobre ProblemaJarras.
+#
+# Se busca con A* ponderado, f_w(n) = g(n) + w·h(n), empezando con un
+# peso alto (primera solución rápida) y bajándolo en cada ronda hasta
+# 'peso_final'. Entre rondas no se reinicia la búsqueda:
+#   - ABIERTOS: cola indexada (fronteras.ColaIndexada) con f_w
+#   - CERRADOS: estados expandidos en la ronda actual
+#   - INCONSISTENTES: estados cerrados cuyo g mejoró en la ronda; no
+#     se reexpanden en ella y vuelven a ABIERTOS en la siguiente
+# Una ronda termina cuando el costo del mejor objetivo encontrado es
+# menor o igual que el menor f_w de ABIERTOS.
+#
+# Cota de suboptimalidad tras cada ronda (h admisible):
+#   cota = min(w, costo / min{g(n) + h(n) : n en ABIERTOS ∪ INCONSISTENTES})
+# Con w = 1 al terminar la última ronda la solución es óptima.
+# --------------------------------------------------------
+
+import fronteras
+import motor_jarras
+import traza
+
+PESO_INICIAL_POR_DEFECTO = 3.0
+DECREMENTO_POR_DEFECTO = 0.5
+
+
+def iterar_ara_estrella(problema, estado_inicial=None, peso_inicial=PESO_INICIAL_POR_DEFECTO,
+                        decremento=DECREMENTO_POR_DEFECTO, peso_final=1.0):
+    """
+    ARA* sobre 'problema' como generador:
+    - Produce (traza.MEJORA, registro) cada vez que una ronda mejora la solución;
+      el registro trae ronda, peso, cota, costo, camino, expandidos (de la ronda)
+      y totales. Quien consume puede cortar en cualquier momento y quedarse
+      con la última mejora.
+    - Al final produce (traza.RESULTADO, (estado_objetivo, diccionario_padre,
+      diccionario_accion)) con la mejor solución encontrada.
+    """
+    if peso_final < 1 or peso_inicial < peso_final:
+        raise ValueError("Se necesita peso_inicial >= peso_final >= 1.")
+    if decremento <= 0:
+        raise ValueError("El decremento del peso debe ser positivo.")
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    estado_inicial = tuple(estado_inicial)
+    funcion_heuristica = problema.funcion_heuristica
+    es_estado_final = problema.es_estado_final
+    sucesores = problema.sucesores
+
+    diccionario_costo_acumulado = {estado_inicial: 0}  # g(n)
+    diccionario_padre = {estado_inicial: None}
+    diccionario_accion = {estado_inicial: None}
+    cerrados = set()
+    inconsistentes = {}  # dict como conjunto ordenado (determinista)
+
+    mejor_objetivo = estado_inicial if es_estado_final(estado_inicial) else None
+    costo_objetivo = 0 if mejor_objetivo is not None else float("inf")
+    costo_publicado = float("inf")
+
+    peso = peso_inicial
+    id_incremental = 0
+    abiertos = fronteras.ColaIndexada()
+    abiertos.push(funcion_heuristica(estado_inicial) * peso, id_incremental, estado_inicial)
+
+    total_expandidos = 0
+    ronda = 0
+    while True:
+        # 1) Mejorar el camino con el peso actual
+        expandidos = 0
+        while abiertos and costo_objetivo > abiertos.primero()[0]:
+            _f, _id, estado_actual = abiertos.pop()
+            cerrados.add(estado_actual)
+            expandidos += 1
+            costo_acumulado_actual = diccionario_costo_acumulado[estado_actual]
+            for nombre_accion, estado_sucesor, costo_de_accion in sucesores(estado_actual):
+                costo_acumulado_sucesor = costo_acumulado_actual + costo_de_accion
+                costo_previo = diccionario_costo_acumulado.get(estado_sucesor)
+                if costo_previo is not None and costo_acumulado_sucesor >= costo_previo:
+                    continue
+                diccionario_costo_acumulado[estado_sucesor] = costo_acumulado_sucesor
+                diccionario_padre[estado_sucesor] = estado_actual
+                diccionario_accion[estado_sucesor] = nombre_accion
+                if es_estado_final(estado_sucesor) and costo_acumulado_sucesor < costo_objetivo:
+                    mejor_objetivo = estado_sucesor
+                    costo_objetivo = costo_acumulado_sucesor
+                if estado_sucesor in cerrados:
+                    inconsistentes[estado_sucesor] = None
+                else:
+                    id_incremental += 1
+                    abiertos.push(costo_acumulado_sucesor + peso * funcion_heuristica(estado_sucesor),
+                                  id_incremental, estado_sucesor)
+        total_expandidos += expandidos
+
+        # 2) Publicar la solución si mejoró, con su cota de suboptimalidad
+        if mejor_objetivo is not None and costo_objetivo < costo_publicado:
+            costo_publicado = costo_objetivo
+            yield traza.MEJORA, {
+                "ronda": ronda,
+                "peso": peso,
+                "cota": _cota(peso, costo_objetivo, diccionario_costo_acumulado, funcion_heuristica,
+                              [e for _f, _id, e in abiertos], inconsistentes),
+                "costo": costo_objetivo,
+                "camino": motor_jarras.reconstruir_camino(mejor_objetivo, diccionario_padre, diccionario_accion),
+                "expandidos": expandidos,
+                "totales": {"expandidos": total_expandidos, "descubiertos": len(diccionario_costo_acumulado)},
+            }
+
+        if mejor_objetivo is None or peso <= peso_final:
+            break
+
+        # 3) Bajar el peso y reconstruir ABIERTOS con ABIERTOS ∪ INCONSISTENTES
+        peso = max(peso_final, peso - decremento)
+        pendientes = [e for _f, _id, e in sorted(abiertos, key=lambda t: t[1])]
+        pendientes.extend(e for e in inconsistentes if e not in abiertos)
+        abiertos = fronteras.ColaIndexada()
+        for estado in pendientes:
+            id_incremental += 1
+            abiertos.push(diccionario_costo_acumulado[estado] + peso * funcion_heuristica(estado),
+                          id_incremental, estado)
+        inconsistentes = {}
+        cerrados = set()
+        ronda += 1
+
+    yield traza.RESULTADO, (mejor_objetivo, diccionario_padre, diccionario_accion)
+
+
+def _cota(peso, costo_objetivo, diccionario_costo_acumulado, funcion_heuristica, abiertos, inconsistentes):
+    """
+    min(peso, costo / menor g + h de ABIERTOS ∪ INCONSISTENTES); 1 si ya no quedan.
+    """
+    valores = [diccionario_costo_acumulado[e] + funcion_heuristica(e) for e in abiertos]
+    valores.extend(diccionario_costo_acumulado[e] + funcion_heuristica(e) for e in inconsistentes)
+    minimo = min(valores, default=float("inf"))
+    if minimo == float("inf"):
+        return 1.0
+    if minimo <= 0:
+        return peso
+    return max(1.0, min(peso, costo_objetivo / minimo))
+
+
+def busqueda_ara_estrella(problema, estado_inicial=None, **opciones):
+    """
+    ARA* hasta el final; devuelve
+    (estado_objetivo, diccionario_padre, diccionario_accion, mejoras)
+    donde 'mejoras' es la lista de registros de cada solución mejorada.
+    Acepta las opciones de iterar_ara_estrella.
+    """
+    mejoras = []
+    resultado = (None, {}, {})
+    for tipo, datos in iterar_ara_estrella(problema, estado_inicial, **opciones):
+        if tipo == traza.MEJORA:
+            mejoras.append(datos)
+        else:
+            resultado = datos
+    return resultado + (mejoras,)
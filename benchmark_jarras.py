@@ -0,0 +1,596 @@
+# benchmark_jarras.py
+# --------------------------------------------------------
+# Benchmark de las búsquedas del motor sobre instancias generadas.
+# - Genera instancias de 2 a N jarras con capacidades de 10 a 10^5,
+#   con objetivo alcanzable o inalcanzable (formato de lote_jarras).
+# - Mide cada (instancia, algoritmo, nivel de traza) en un proceso
+#   nuevo: tiempo de pared, expansiones por segundo, expandidos,
+#   descubiertos, tamaño máximo de la frontera y pico de memoria
+#   (RSS del proceso y, con --memoria, pico de tracemalloc).
+# - Escribe los resultados en JSON y los compara con una línea base
+#   guardada; sale con código 1 si alguna expansión/s empeoró más que
+#   la tolerancia.
+#
+# Instancias:
+#   alcanzable  : litros = múltiplo del mcd de las capacidades, a lo
+#                 sumo la capacidad de la jarra objetivo (siempre se
+#                 puede medir en esa jarra)
+#   inalcanzable: todas las capacidades son múltiplos de un divisor
+#                 d >= 2 y los litros no lo son (el oráculo del mcd
+#                 las descarta sin expandir, con cualquier nivel de
+#                 traza: miden el costo del atajo)
+# Generación determinista a partir de la semilla, así que las claves
+# de los resultados coinciden entre corridas y con la línea base.
+#
+# Medición:
+#   - expandidos: llamadas a problema.sucesores (una por expansión),
+#     contadas igual con cualquier nivel de traza
+#   - frontera_maxima: máximo de 'tamano_frontera' de los registros
+#     (None con traza 'ninguna', que no produce registros)
+#   - rss_pico_kb: ru_maxrss del proceso de medición (None si el
+#     módulo 'resource' no existe, p. ej. en Windows)
+#   - segundos: mínimo y mediana de las repeticiones; las expansiones
+#     por segundo usan el mínimo
+#   - tracemalloc se mide en una corrida aparte para no inflar los tiempos
+#
+# Memoria de logs_por_estado (--registros): memoria retenida por los
+# registros de una corrida con un diccionario por registro (como antes
+# de registros.py), con registros de __slots__ y por columnas
+# (registros.LogsColumnares, lo que guarda traza.recolectar_logs).
+# --------------------------------------------------------
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import lote_jarras
+import motor_jarras
+import traza
+
+ALGORITMOS = motor_jarras.ITERADORES
+
+# Escalas de la suite: (jarras, capacidad_minima, capacidad_maxima) por grupo.
+# Con más jarras el espacio de estados crece como el producto de las
+# capacidades, así que las capacidades se achican.
+ESCALAS = {
+    "rapida": ((2, 10, 10000), (3, 10, 60), (4, 10, 15)),
+    "completa": ((2, 10, 1000), (2, 1000, 100000), (3, 10, 200), (4, 10, 30), (5, 10, 12)),
+}
+ESCALA_POR_DEFECTO = "rapida"
+INSTANCIAS_POR_GRUPO_POR_DEFECTO = 2
+REPETICIONES_POR_DEFECTO = 3
+TOLERANCIA_POR_DEFECTO = 0.10
+
+# Por debajo de este tiempo (en la línea base) la variación es ruido y no se marca
+SEGUNDOS_MINIMOS_COMPARACION = 0.05
+
+FORMATO_RESULTADOS = 1
+
+OK = lote_jarras.OK
+SIN_SOLUCION = lote_jarras.SIN_SOLUCION
+TIEMPO_AGOTADO = lote_jarras.TIEMPO_AGOTADO
+ERROR = lote_jarras.ERROR
+
+
+# 1) Generación de instancias
+
+def generar_instancia(rng, numero_jarras, capacidad_minima, capacidad_maxima, alcanzable=True):
+    """
+    Devuelve una instancia (diccionario en el formato de lote_jarras) con
+    'numero_jarras' capacidades en [capacidad_minima, capacidad_maxima] y un
+    objetivo sobre una jarra, alcanzable o no según 'alcanzable'.
+    """
+    if numero_jarras < 1:
+        raise ValueError(f"Se necesita al menos una jarra: {numero_jarras}")
+    if not 1 <= capacidad_minima <= capacidad_maxima:
+        raise ValueError(f"Rango de capacidades inválido: [{capacidad_minima}, {capacidad_maxima}]")
+    jarra = rng.randrange(numero_jarras)
+    if alcanzable:
+        capacidades = [rng.randint(capacidad_minima, capacidad_maxima) for _ in range(numero_jarras)]
+        divisor = math.gcd(*capacidades)
+        litros = divisor * rng.randint(1, capacidades[jarra] // divisor)
+    else:
+        divisor = rng.choice((2, 3, 5))
+        minimo = max(1, -(-capacidad_minima // divisor))
+        maximo = capacidad_maxima // divisor
+        if maximo < minimo:
+            raise ValueError(f"No hay múltiplos de {divisor} en [{capacidad_minima}, {capacidad_maxima}]")
+        capacidades = [divisor * rng.randint(minimo, maximo) for _ in range(numero_jarras)]
+        litros = divisor * rng.randrange(capacidades[jarra] // divisor) + rng.randint(1, divisor - 1)
+    return {"capacidades": capacidades, "objetivo": {str(jarra): litros}}
+
+
+def generar_suite(escala=ESCALA_POR_DEFECTO, por_grupo=INSTANCIAS_POR_GRUPO_POR_DEFECTO, semilla=0):
+    """
+    Genera las instancias de una escala de ESCALAS: 'por_grupo' alcanzables
+    y 'por_grupo' inalcanzables por cada grupo, con ids estables
+    ("<jarras>j-<capacidad_maxima>-<a|i><n>").
+    """
+    if escala not in ESCALAS:
+        raise ValueError(f"Escala desconocida: {escala} (use una de {', '.join(ESCALAS)})")
+    rng = random.Random(semilla)
+    instancias = []
+    for numero_jarras, capacidad_minima, capacidad_maxima in ESCALAS[escala]:
+        for alcanzable in (True, False):
+            for numero in range(por_grupo):
+                instancia = generar_instancia(rng, numero_jarras, capacidad_minima, capacidad_maxima, alcanzable)
+                instancia["id"] = f"{numero_jarras}j-{capacidad_maxima}-{'a' if alcanzable else 'i'}{numero}"
+                instancias.append(instancia)
+    return instancias
+
+
+# 2) Medición de un caso
+
+def _rss_pico_kb():
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico // 1024 if sys.platform == "darwin" else pico  # macOS informa bytes
+
+
+def medir(instancia, algoritmo, nivel_traza, con_tracemalloc=False):
+    """
+    Ejecuta una vez 'algoritmo' sobre la instancia con 'nivel_traza' y
+    devuelve un diccionario con segundos, expandidos, descubiertos, costo,
+    frontera_maxima, encontrado y, con con_tracemalloc=True, tracemalloc_pico_kb.
+    """
+    problema = lote_jarras.crear_problema(instancia)
+    sucesores = problema.sucesores
+    expandidos = 0
+
+    def sucesores_contados(estado):
+        nonlocal expandidos
+        expandidos += 1
+        return sucesores(estado)
+
+    problema.sucesores = sucesores_contados
+    iterador = ALGORITMOS[algoritmo](problema, nivel_traza=nivel_traza)
+
+    if con_tracemalloc:
+        tracemalloc.start()
+    frontera_maxima = None
+    resultado = (None, {}, {})
+    inicio = time.perf_counter()
+    for tipo, datos in iterador:
+        if tipo == traza.RESULTADO:
+            resultado = datos
+        elif frontera_maxima is None or datos["tamano_frontera"] > frontera_maxima:
+            frontera_maxima = datos["tamano_frontera"]
+    segundos = time.perf_counter() - inicio
+    medicion = {}
+    if con_tracemalloc:
+        medicion["tracemalloc_pico_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+
+    estado_objetivo, diccionario_padre, diccionario_accion = resultado
+    camino = motor_jarras.reconstruir_camino(estado_objetivo, diccionario_padre, diccionario_accion)
+    medicion.update({
+        "segundos": segundos,
+        "expandidos": expandidos,
+        "descubiertos": len(diccionario_padre),
+        "frontera_maxima": frontera_maxima,
+        "encontrado": bool(camino),
+        "costo": (sum(problema.obtener_costo_de_accion(accion) for _estado, accion in camino[1:])
+                  if camino else None),
+    })
+    return medicion
+
+
+def _medir_en_proceso(conexion, instancia, algoritmo, nivel_traza, con_tracemalloc):
+    """
+    Tarea del proceso de medición: envía (medicion, None) o (None, error).
+    """
+    try:
+        rss_inicial_kb = _rss_pico_kb()
+        medicion = medir(instancia, algoritmo, nivel_traza, con_tracemalloc)
+        medicion["rss_inicial_kb"] = rss_inicial_kb
+        medicion["rss_pico_kb"] = _rss_pico_kb()
+        conexion.send((medicion, None))
+    except Exception as error:
+        conexion.send((None, f"{type(error).__name__}: {error}"))
+    finally:
+        conexion.close()
+
+
+def medir_aislado(instancia, algoritmo, nivel_traza, con_tracemalloc=False, limite_segundos=None):
+    """
+    medir() en un proceso nuevo (RSS propio, sin memoria ni caché de corridas
+    anteriores). Devuelve (medicion, estado) con estado OK, TIEMPO_AGOTADO o
+    ERROR; si no es OK, 'medicion' es un diccionario con 'error'.
+    """
+    receptor, emisor = multiprocessing.Pipe(duplex=False)
+    proceso = multiprocessing.Process(
+        target=_medir_en_proceso, args=(emisor, instancia, algoritmo, nivel_traza, con_tracemalloc), daemon=True
+    )
+    proceso.start()
+    emisor.close()
+    try:
+        if not receptor.poll(limite_segundos):
+            proceso.terminate()
+            return {"error": f"Superó {limite_segundos} s."}, TIEMPO_AGOTADO
+        medicion, error = receptor.recv()
+    except EOFError:
+        return {"error": f"El proceso de medición terminó abruptamente (código {proceso.exitcode})."}, ERROR
+    finally:
+        proceso.join()
+        receptor.close()
+    if error is not None:
+        return {"error": error}, ERROR
+    return medicion, OK
+
+
+def medir_caso(instancia, algoritmo, nivel_traza, repeticiones=REPETICIONES_POR_DEFECTO, con_tracemalloc=False,
+               limite_segundos=None):
+    """
+    Mide un caso 'repeticiones' veces (cada una en un proceso nuevo) y
+    devuelve su diccionario de resultado con la clave "<id>/<algoritmo>/<nivel>".
+    """
+    resultado = {
+        "clave": f"{instancia['id']}/{algoritmo}/{nivel_traza}",
+        "id": instancia["id"],
+        "jarras": len(instancia["capacidades"]),
+        "capacidades": instancia["capacidades"],
+        "objetivo": instancia.get("objetivo"),
+        "algoritmo": algoritmo,
+        "nivel_traza": nivel_traza,
+    }
+    mediciones = []
+    for _ in range(repeticiones):
+        medicion, estado = medir_aislado(instancia, algoritmo, nivel_traza, limite_segundos=limite_segundos)
+        if estado != OK:
+            resultado.update(medicion)
+            resultado["estado"] = estado
+            return resultado
+        mediciones.append(medicion)
+
+    tiempos = [m["segundos"] for m in mediciones]
+    resultado.update({k: v for k, v in mediciones[0].items() if k != "segundos"})
+    resultado["estado"] = OK if resultado["encontrado"] else SIN_SOLUCION
+    resultado["rss_pico_kb"] = max((m["rss_pico_kb"] for m in mediciones if m["rss_pico_kb"] is not None),
+                                   default=None)
+    resultado["segundos_minimo"] = min(tiempos)
+    resultado["segundos_mediana"] = statistics.median(tiempos)
+    resultado["expansiones_por_segundo"] = (
+        resultado["expandidos"] / resultado["segundos_minimo"] if resultado["segundos_minimo"] > 0 else 0.0
+    )
+    if con_tracemalloc:
+        medicion, estado = medir_aislado(instancia, algoritmo, nivel_traza, True, limite_segundos)
+        resultado["tracemalloc_pico_kb"] = medicion.get("tracemalloc_pico_kb") if estado == OK else None
+    return resultado
+
+
+# 3) Suite completa y comparación con la línea base
+
+def ejecutar_benchmark(instancias, algoritmos=tuple(ALGORITMOS), niveles=(traza.NINGUNA, traza.RESUMEN),
+                       repeticiones=REPETICIONES_POR_DEFECTO, con_tracemalloc=False, limite_segundos=None):
+    """
+    Mide cada (instancia, algoritmo, nivel) y genera sus resultados a medida
+    que terminan, en ese orden.
+    """
+    for algoritmo in algoritmos:
+        if algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido: {algoritmo} (use uno de {', '.join(ALGORITMOS)})")
+    for nivel_traza in niveles:
+        traza.validar_nivel(nivel_traza)
+    if repeticiones < 1:
+        raise ValueError("Se necesita al menos una repetición.")
+    for instancia in instancias:
+        for algoritmo in algoritmos:
+            for nivel_traza in niveles:
+                yield medir_caso(instancia, algoritmo, nivel_traza, repeticiones, con_tracemalloc, limite_segundos)
+
+
+def describir_entorno():
+    """
+    Datos del entorno que acompañan a los resultados (para comparar con cuidado).
+    """
+    return {
+        "python": platform.python_version(),
+        "implementacion": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "procesador": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def comparar(resultados, linea_base, tolerancia=TOLERANCIA_POR_DEFECTO):
+    """
+    Compara expansiones/s por clave contra 'linea_base' (lista de resultados
+    de una corrida anterior). Devuelve una fila por clave común con
+    razon = actual / base, 'regresion' si la razón es menor que
+    1 - tolerancia (salvo casos más rápidos que SEGUNDOS_MINIMOS_COMPARACION)
+    y 'cambio_expandidos' si cambió la cantidad de expansiones.
+    """
+    base_por_clave = {r["clave"]: r for r in linea_base}
+    filas = []
+    for actual in resultados:
+        base = base_por_clave.get(actual["clave"])
+        if base is None or actual.get("estado") not in (OK, SIN_SOLUCION) or "expansiones_por_segundo" not in base:
+            continue
+        velocidad_base = base["expansiones_por_segundo"]
+        razon = actual["expansiones_por_segundo"] / velocidad_base if velocidad_base > 0 else 1.0
+        filas.append({
+            "clave": actual["clave"],
+            "base": velocidad_base,
+            "actual": actual["expansiones_por_segundo"],
+            "razon": razon,
+            "regresion": razon < 1 - tolerancia and base["segundos_minimo"] >= SEGUNDOS_MINIMOS_COMPARACION,
+            "cambio_expandidos": actual["expandidos"] != base["expandidos"],
+        })
+    return filas
+
+
+# 4) Memoria de logs_por_estado
+
+REPRESENTACIONES_REGISTROS = ("diccionarios", "slots", "columnas")
+
+
+def _registro_como_diccionario(registro):
+    # Representación previa a registros.py: dict por registro y 'totales' anidado
+    return {clave: dict(valor) if clave == "totales" else valor for clave, valor in registro.items()}
+
+
+def medir_memoria_registros(instancia, algoritmo, nivel_traza=traza.RESUMEN):
+    """
+    Memoria retenida (KB, tracemalloc) por logs_por_estado de una corrida de
+    'algoritmo' sobre la instancia, para cada representación de
+    REPRESENTACIONES_REGISTROS. Devuelve {"registros": cantidad,
+    "<representacion>_kb": ..., "reduccion": diccionarios / columnas}.
+    """
+    traza.validar_nivel(nivel_traza)
+    if not traza.con_logs(nivel_traza):
+        raise ValueError("Con traza 'ninguna' no hay registros que medir.")
+    medicion = {}
+    for representacion in REPRESENTACIONES_REGISTROS:
+        iterador = ALGORITMOS[algoritmo](lote_jarras.crear_problema(instancia), nivel_traza=nivel_traza)
+        tracemalloc.start()
+        if representacion == "columnas":
+            logs_por_estado = traza.recolectar_logs(iterador)[3]
+        else:
+            logs_por_estado = {}
+            for tipo, datos in iterador:
+                if tipo == traza.EXPANSION:
+                    if representacion == "diccionarios":
+                        datos = _registro_como_diccionario(datos)
+                    logs_por_estado[datos["estado"]] = datos
+        del iterador
+        medicion[f"{representacion}_kb"] = tracemalloc.get_traced_memory()[0] / 1024
+        tracemalloc.stop()
+        medicion["registros"] = len(logs_por_estado)
+        del logs_por_estado
+    medicion["reduccion"] = (medicion["diccionarios_kb"] / medicion["columnas_kb"]
+                             if medicion["columnas_kb"] > 0 else None)
+    return medicion
+
+
+def _imprimir_memoria_registros(clave, medicion):
+    reduccion = medicion["reduccion"]
+    print(
+        f"{clave:<40} registros={medicion['registros']:<8} "
+        + " ".join(f"{r}={medicion[r + '_kb']:.0f} KB" for r in REPRESENTACIONES_REGISTROS)
+        + f" ({'-' if reduccion is None else f'{reduccion:.1f}x'} menos que con diccionarios)"
+    )
+
+
+# 5) CLI
+
+def _imprimir_resultado(resultado):
+    if resultado["estado"] in (OK, SIN_SOLUCION):
+        frontera = resultado["frontera_maxima"]
+        print(
+            f"{resultado['clave']:<40} {resultado['estado']:<13} "
+            f"{resultado['segundos_minimo']:>9.4f} s {resultado['expansiones_por_segundo']:>12.0f} exp/s "
+            f"expandidos={resultado['expandidos']} descubiertos={resultado['descubiertos']} "
+            f"frontera_max={'-' if frontera is None else frontera} rss={resultado['rss_pico_kb']} KB"
+        )
+    else:
+        print(f"{resultado['clave']:<40} {resultado['estado']:<13} {resultado['error']}")
+
+
+def _imprimir_comparacion(filas, tolerancia):
+    print(f"\nComparación con la línea base (tolerancia {tolerancia:.0%}):")
+    for fila in filas:
+        marcas = []
+        if fila["regresion"]:
+            marcas.append("REGRESIÓN")
+        if fila["cambio_expandidos"]:
+            marcas.append("cambió la cantidad de expansiones")
+        print(f"{fila['clave']:<40} {fila['base']:>12.0f} -> {fila['actual']:>12.0f} exp/s "
+              f"({fila['razon']:.2f}x) {' | '.join(marcas)}")
+    regresiones = sum(fila["regresion"] for fila in filas)
+    print(f"- Casos comparados: {len(filas)} | regresiones: {regresiones}")
+
+
+def construir_argumentos():
+    """
+    Construye y devuelve el parser de argumentos de línea de comandos.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark de las búsquedas del motor de jarras sobre instancias generadas."
+    )
+    parser.add_argument(
+        "--escala",
+        choices=tuple(ESCALAS),
+        default=ESCALA_POR_DEFECTO,
+        help="Grupos de instancias a generar: rapida o completa (hasta 5 jarras y capacidades de 10^5).",
+    )
+    parser.add_argument(
+        "--instancias",
+        default=None,
+        help="Archivo JSONL de instancias (formato de lote_jarras) en lugar de generarlas.",
+    )
+    parser.add_argument(
+        "--por-grupo",
+        type=int,
+        default=INSTANCIAS_POR_GRUPO_POR_DEFECTO,
+        help="Instancias alcanzables e inalcanzables por grupo de la escala. Ejemplo: --por-grupo 3",
+    )
+    parser.add_argument(
+        "--semilla",
+        type=int,
+        default=0,
+        help="Semilla del generador de instancias.",
+    )
+    parser.add_argument(
+        "--solo-generar",
+        action="store_true",
+        help="Escribe las instancias generadas en JSONL (en --salida) sin medir.",
+    )
+    parser.add_argument(
+        "--algoritmos",
+        nargs="+",
+        choices=tuple(ALGORITMOS),
+        default=list(ALGORITMOS),
+        help="Algoritmos a medir.",
+    )
+    parser.add_argument(
+        "--trazas",
+        nargs="+",
+        choices=traza.NIVELES,
+        default=[traza.NINGUNA, traza.RESUMEN],
+        help="Niveles de traza a medir.",
+    )
+    parser.add_argument(
+        "--repeticiones",
+        type=int,
+        default=REPETICIONES_POR_DEFECTO,
+        help="Corridas por caso; se informa el tiempo mínimo y la mediana. Ejemplo: --repeticiones 5",
+    )
+    parser.add_argument(
+        "--memoria",
+        action="store_true",
+        help="Mide además el pico de tracemalloc (en una corrida aparte por caso).",
+    )
+    parser.add_argument(
+        "--registros",
+        action="store_true",
+        help="En lugar de los tiempos, mide la memoria de logs_por_estado con diccionarios, __slots__ y columnas.",
+    )
+    parser.add_argument(
+        "--limite-segundos",
+        type=float,
+        default=None,
+        help="Plazo por corrida, en segundos. Ejemplo: --limite-segundos 30",
+    )
+    parser.add_argument(
+        "--salida",
+        default=None,
+        help="Archivo JSON de resultados (o JSONL de instancias con --solo-generar; '-' para stdout).",
+    )
+    parser.add_argument(
+        "--linea-base",
+        default=None,
+        help="Archivo JSON de resultados anterior contra el que comparar las expansiones/s.",
+    )
+    parser.add_argument(
+        "--tolerancia",
+        type=float,
+        default=TOLERANCIA_POR_DEFECTO,
+        help="Caída relativa de expansiones/s tolerada antes de marcar regresión. Ejemplo: --tolerancia 0.15",
+    )
+    return parser
+
+
+def main():
+    parser = construir_argumentos()
+    argumentos = parser.parse_args()
+
+    if argumentos.por_grupo < 1:
+        parser.error("--por-grupo debe ser al menos 1.")
+    if argumentos.repeticiones < 1:
+        parser.error("--repeticiones debe ser al menos 1.")
+    if argumentos.limite_segundos is not None and argumentos.limite_segundos <= 0:
+        parser.error("--limite-segundos debe ser positivo.")
+    if not 0 <= argumentos.tolerancia < 1:
+        parser.error("--tolerancia debe estar en [0, 1).")
+
+    if argumentos.instancias is not None:
+        with open(argumentos.instancias, encoding="utf-8") as archivo:
+            instancias = []
+            for indice, instancia in lote_jarras.leer_instancias(archivo):
+                if isinstance(instancia, Exception):
+                    parser.error(str(instancia))
+                instancia.setdefault("id", str(indice))
+                instancias.append(instancia)
+    else:
+        instancias = generar_suite(argumentos.escala, argumentos.por_grupo, argumentos.semilla)
+
+    if argumentos.solo_generar:
+        salida = sys.stdout if argumentos.salida in (None, "-") else open(argumentos.salida, "w", encoding="utf-8")
+        try:
+            for instancia in instancias:
+                salida.write(json.dumps(instancia, ensure_ascii=False) + "\n")
+        finally:
+            if salida is not sys.stdout:
+                salida.close()
+        return
+
+    if argumentos.registros:
+        mediciones = []
+        for instancia in instancias:
+            for algoritmo in argumentos.algoritmos:
+                for nivel_traza in argumentos.trazas:
+                    if not traza.con_logs(nivel_traza):
+                        continue
+                    clave = f"{instancia['id']}/{algoritmo}/{nivel_traza}"
+                    medicion = dict(clave=clave, **medir_memoria_registros(instancia, algoritmo, nivel_traza))
+                    _imprimir_memoria_registros(clave, medicion)
+                    mediciones.append(medicion)
+        if argumentos.salida is not None:
+            documento = {"formato": FORMATO_RESULTADOS, "entorno": describir_entorno(), "registros": mediciones}
+            if argumentos.salida == "-":
+                json.dump(documento, sys.stdout, ensure_ascii=False, indent=1)
+                print("")
+            else:
+                with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+                    json.dump(documento, archivo, ensure_ascii=False, indent=1)
+        return
+
+    resultados = []
+    for resultado in ejecutar_benchmark(instancias, argumentos.algoritmos, argumentos.trazas,
+                                        argumentos.repeticiones, argumentos.memoria, argumentos.limite_segundos):
+        _imprimir_resultado(resultado)
+        resultados.append(resultado)
+
+    documento = {
+        "formato": FORMATO_RESULTADOS,
+        "entorno": describir_entorno(),
+        "parametros": {
+            "escala": None if argumentos.instancias else argumentos.escala,
+            "semilla": argumentos.semilla,
+            "repeticiones": argumentos.repeticiones,
+        },
+        "resultados": resultados,
+    }
+    if argumentos.salida == "-":
+        json.dump(documento, sys.stdout, ensure_ascii=False, indent=1)
+        print("")
+    elif argumentos.salida is not None:
+        with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+            json.dump(documento, archivo, ensure_ascii=False, indent=1)
+
+    if argumentos.linea_base is not None:
+        with open(argumentos.linea_base, encoding="utf-8") as archivo:
+            linea_base = json.load(archivo)
+        if linea_base.get("formato") != FORMATO_RESULTADOS:
+            parser.error(f"Formato de línea base no soportado: {linea_base.get('formato')}")
+        filas = comparar(resultados, linea_base["resultados"], argumentos.tolerancia)
+        _imprimir_comparacion(filas, argumentos.tolerancia)
+        if any(fila["regresion"] for fila in filas):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
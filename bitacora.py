@@ -0,0 +1,233 @@
+# bitacora.py
+# --------------------------------------------------------
+# Bitácora de expansión codificada por deltas.
+#
+# En lugar de guardar una copia ordenada de la frontera en cada
+# expansión, la búsqueda registra sólo las operaciones sobre el heap:
+#
+#   push(id, prioridad, g, estado)   entrada nueva en la frontera
+#   mejora(id, prioridad, g, estado) push que mejora el g de un estado ya visto
+#   pop(id)                          entrada extraída de la frontera
+#
+# y una marca por cada registro de logs_por_estado. La frontera de la
+# marca N se reconstruye bajo demanda reproduciendo los eventos desde
+# el cursor (la última marca reconstruida), así la memoria crece con el
+# número de operaciones sobre el heap y no con su cuadrado.
+#
+# Recorrer los registros hacia adelante no guarda copias. Sólo al volver
+# a una marca anterior al cursor se reproduce desde el checkpoint más
+# cercano (o desde el inicio) y, durante esa reproducción, se guarda una
+# copia de la frontera cada 'intervalo_checkpoint' eventos. Se conservan
+# a lo sumo 'max_checkpoints' copias (se descarta la usada hace más
+# tiempo): la memoria extra queda acotada por max_checkpoints · F (F =
+# tamaño máximo de la frontera) y volver atrás cuesta a lo sumo
+# 'intervalo_checkpoint' eventos si la zona ya se visitó.
+#
+# Los id de push son los id_incremental de las búsquedas (0, 1, 2, ...),
+# así que los datos de cada push se guardan en listas indexadas por id.
+# --------------------------------------------------------
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+
+INTERVALO_CHECKPOINT_POR_DEFECTO = 4096   # eventos entre checkpoints
+MAX_CHECKPOINTS_POR_DEFECTO = 16
+
+
+class BitacoraExpansiones:
+    """
+    Registro append-only de operaciones sobre la frontera.
+    - convertir(prioridad, g_actual, estado): tupla de la frontera para el log
+    - clave_orden: clave de orden visual de esas tuplas
+    - intervalo_checkpoint: eventos entre checkpoints al volver atrás
+    - max_checkpoints: copias de la frontera que se conservan (LRU)
+    """
+
+    def __init__(self, convertir, clave_orden, intervalo_checkpoint=INTERVALO_CHECKPOINT_POR_DEFECTO,
+                 max_checkpoints=MAX_CHECKPOINTS_POR_DEFECTO):
+        if intervalo_checkpoint < 1:
+            raise ValueError("El intervalo de checkpoints debe ser al menos 1.")
+        if max_checkpoints < 0:
+            raise ValueError("La cantidad de checkpoints no puede ser negativa.")
+        self._convertir = convertir
+        self._clave_orden = clave_orden
+        self.intervalo_checkpoint = intervalo_checkpoint
+        self.max_checkpoints = max_checkpoints
+
+        # Datos de cada push, indexados por id
+        self.prioridades = []
+        self.costos = []
+        self.estados = []
+        self.mejoras = bytearray()
+
+        # Eventos: 2*id para push, 2*id + 1 para pop
+        self.eventos = array("q")
+        # Posición en 'eventos' de cada marca
+        self.marcas = array("q")
+
+        # Reproducción: cursor (última marca reconstruida) y checkpoints
+        # {marca: (vivos, ultimo)} en orden de uso
+        self._cursor = (-1, 0, set(), {})
+        self._checkpoints = OrderedDict()
+        self._ultima_frontera = (None, None)
+
+    # Registro
+
+    def push(self, identificador, prioridad, g, estado, mejora=False):
+        if identificador != len(self.prioridades):
+            raise ValueError(f"Los id de push deben ser consecutivos: se esperaba {len(self.prioridades)}")
+        self.prioridades.append(prioridad)
+        self.costos.append(g)
+        self.estados.append(estado)
+        self.mejoras.append(1 if mejora else 0)
+        self.eventos.append(2 * identificador)
+
+    def pop(self, identificador):
+        self.eventos.append(2 * identificador + 1)
+
+    def marcar(self):
+        """
+        Marca la posición actual (un registro de log) y devuelve su índice.
+        """
+        self.marcas.append(len(self.eventos))
+        return len(self.marcas) - 1
+
+    def frontera_diferida(self):
+        """
+        Marca la posición actual y devuelve su frontera como secuencia perezosa.
+        """
+        return FronteraDiferida(self, self.marcar())
+
+    def __len__(self):
+        return len(self.eventos)
+
+    def contadores(self):
+        """
+        Cantidad de eventos por tipo: {'push', 'mejora', 'pop'}.
+        """
+        pops = sum(e & 1 for e in self.eventos)
+        mejoras = sum(self.mejoras)
+        return {"push": len(self.prioridades) - mejoras, "mejora": mejoras, "pop": pops}
+
+    # Reproducción
+
+    def _aplicar(self, desde, hasta, vivos, ultimo):
+        estados = self.estados
+        eventos = self.eventos
+        for k in range(desde, hasta):
+            evento = eventos[k]
+            identificador = evento >> 1
+            estado = estados[identificador]
+            if evento & 1:
+                vivos.discard(identificador)
+                entrada = ultimo[estado]
+                entrada[1] -= 1
+                if entrada[1] == 0:
+                    del ultimo[estado]
+            else:
+                vivos.add(identificador)
+                entrada = ultimo.get(estado)
+                if entrada is None:
+                    ultimo[estado] = [identificador, 1]
+                else:
+                    entrada[0] = identificador
+                    entrada[1] += 1
+
+    def _copiar(self, vivos, ultimo):
+        return set(vivos), {estado: list(entrada) for estado, entrada in ultimo.items()}
+
+    def _guardar_checkpoint(self, marca, vivos, ultimo):
+        if self.max_checkpoints == 0 or marca in self._checkpoints:
+            return
+        self._checkpoints[marca] = self._copiar(vivos, ultimo)
+        if len(self._checkpoints) > self.max_checkpoints:
+            self._checkpoints.popitem(last=False)
+
+    def _estado_en(self, marca):
+        """
+        Devuelve (vivos, ultimo) en la marca pedida, moviendo el cursor.
+        Sólo al volver atrás se usan y se guardan checkpoints.
+        """
+        marca_cursor, posicion, vivos, ultimo = self._cursor
+        hacia_atras = marca_cursor > marca
+        if hacia_atras:
+            base = max((m for m in self._checkpoints if m <= marca), default=-1)
+            if base >= 0:
+                self._checkpoints.move_to_end(base)
+                posicion = self.marcas[base]
+                vivos, ultimo = self._copiar(*self._checkpoints[base])
+                marca_cursor = base
+            else:
+                marca_cursor, posicion, vivos, ultimo = -1, 0, set(), {}
+
+        ultimo_checkpoint = posicion
+        for siguiente in range(marca_cursor + 1, marca + 1):
+            destino = self.marcas[siguiente]
+            self._aplicar(posicion, destino, vivos, ultimo)
+            posicion = destino
+            if hacia_atras and posicion - ultimo_checkpoint >= self.intervalo_checkpoint:
+                self._guardar_checkpoint(siguiente, vivos, ultimo)
+                ultimo_checkpoint = posicion
+
+        self._cursor = (marca, posicion, vivos, ultimo)
+        return vivos, ultimo
+
+    def frontera_en(self, marca):
+        """
+        Reconstruye la frontera ordenada (formato del log) en la marca indicada.
+        """
+        if not 0 <= marca < len(self.marcas):
+            raise IndexError(f"Marca fuera de rango: {marca}")
+        if self._ultima_frontera[0] == marca:
+            return self._ultima_frontera[1]
+        vivos, ultimo = self._estado_en(marca)
+        prioridades = self.prioridades
+        costos = self.costos
+        estados = self.estados
+        convertir = self._convertir
+        frontera = sorted(
+            [
+                convertir(prioridades[i], costos[ultimo[estados[i]][0]], estados[i])
+                for i in vivos
+            ],
+            key=self._clave_orden
+        )
+        self._ultima_frontera = (marca, frontera)
+        return frontera
+
+
+class FronteraDiferida(Sequence):
+    """
+    Frontera de un registro de log que se reconstruye desde la bitácora
+    sólo cuando se lee (se comporta como la lista 'frontera_total').
+    """
+
+    __slots__ = ("bitacora", "marca")
+
+    def __init__(self, bitacora, marca):
+        self.bitacora = bitacora
+        self.marca = marca
+
+    def _lista(self):
+        return self.bitacora.frontera_en(self.marca)
+
+    def __getitem__(self, indice):
+        return self._lista()[indice]
+
+    def __len__(self):
+        return len(self._lista())
+
+    def __iter__(self):
+        return iter(self._lista())
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __eq__(self, otro):
+        if isinstance(otro, (list, tuple, FronteraDiferida)):
+            return list(self) == list(otro)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self._lista())
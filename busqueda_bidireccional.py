@@ -0,0 +1,321 @@
+# busqueda_bidireccional.py
+# --------------------------------------------------------
+# Búsqueda bidireccional (costo uniforme y A*) sobre ProblemaJarras.
+#
+# Dirección directa: desde el estado inicial con problema.sucesores.
+# Dirección inversa: desde TODOS los estados que cumplen el objetivo,
+# con las transiciones inversas (predecesores):
+#   LLENAR j      : s[j] == cap[j]  <-  p[j] en 0..cap[j]-1
+#   VACIAR i      : s[i] == 0       <-  p[i] en 1..cap[i]
+#   TRANSFERIR i,j: s[i] == 0 ó s[j] == cap[j]  <-  p = s con t litros
+#                   devueltos de j a i (t = 1..min(s[j], cap[i] - s[i]))
+#
+# Corte (resultado óptimo): 'mejor' es el costo del mejor camino
+# encontrado al cruzarse las búsquedas; se termina cuando
+#   mejor <= max(f_min_directa, f_min_inversa)
+# y, sin heurística (costo uniforme), también cuando
+#   mejor <= g_min_directa + g_min_inversa + costo_minimo_de_accion.
+# Con heurísticas admisibles ninguna de las cotas sobreestima, así que
+# ningún camino sin explorar puede mejorar a 'mejor'.
+#
+# En cada paso se expande la dirección con menos elementos en la
+# frontera (criterio de cardinalidad).
+# --------------------------------------------------------
+
+from heapq import heappush, heappop
+from itertools import product
+
+import motor_jarras
+import traza
+
+DIRECTA = "directa"
+INVERSA = "inversa"
+
+
+# 1) Transiciones inversas y estados objetivo
+
+def predecesores(problema, estado):
+    """
+    Devuelve [(nombre_accion, predecesor, costo), ...]: los estados desde los
+    que la acción 'nombre_accion' (en sentido directo) lleva a 'estado'.
+    Orden determinista: por acción y luego por litros del predecesor.
+    """
+    capacidades = problema.capacidades
+    rango = range(problema.numero_jarras)
+    costos = problema.costos
+    nombres = problema.nombres_acciones
+    n = problema.numero_jarras
+    resultado = []
+
+    for j in rango:
+        if estado[j] == capacidades[j]:
+            for litros in range(capacidades[j]):
+                previo = list(estado)
+                previo[j] = litros
+                resultado.append((nombres[j], tuple(previo), costos[motor_jarras.LLENAR]))
+    for i in rango:
+        if estado[i] == 0:
+            for litros in range(1, capacidades[i] + 1):
+                previo = list(estado)
+                previo[i] = litros
+                resultado.append((nombres[n + i], tuple(previo), costos[motor_jarras.VACIAR]))
+    for indice in range(2 * n, len(problema.acciones)):
+        _tipo, i, j = problema.acciones[indice]
+        if estado[i] != 0 and estado[j] != capacidades[j]:
+            continue
+        for cantidad in range(1, min(estado[j], capacidades[i] - estado[i]) + 1):
+            previo = list(estado)
+            previo[i] += cantidad
+            previo[j] -= cantidad
+            resultado.append((nombres[indice], tuple(previo), costos[motor_jarras.TRANSFERIR]))
+    return resultado
+
+
+def estados_objetivo(problema):
+    """
+    Lista (ordenada) de todos los estados que cumplen el objetivo del problema.
+    Las jarras sin objetivo toman cualquier valor entre 0 y su capacidad.
+    """
+    rangos = [
+        (problema.objetivo[j],) if j in problema.objetivo else range(capacidad + 1)
+        for j, capacidad in enumerate(problema.capacidades)
+    ]
+    return [estado for estado in product(*rangos) if problema.es_estado_final(estado)]
+
+
+# 2) Heurísticas admisibles por defecto
+
+def heuristicas_admisibles(problema, estado_inicial):
+    """
+    Devuelve (h_directa, h_inversa), consistentes y admisibles:
+    cada acción cambia a lo sumo 2 jarras, así que con k jarras distintas de
+    la referencia (objetivo o estado inicial) faltan al menos ceil(k/2) acciones.
+    """
+    costo_minimo = min(problema.costos_acciones)
+    objetivo = list(problema.objetivo.items())
+
+    def h_directa(estado):
+        distintas = sum(1 for j, litros in objetivo if estado[j] != litros)
+        return (distintas + 1) // 2 * costo_minimo
+
+    def h_inversa(estado):
+        distintas = sum(1 for a, b in zip(estado, estado_inicial) if a != b)
+        return (distintas + 1) // 2 * costo_minimo
+
+    return h_directa, h_inversa
+
+
+def _sin_heuristica(_estado):
+    return 0
+
+
+# 3) Búsqueda
+
+def _clave_frontera(t):
+    return (t[0], str(t[3]))
+
+
+def iterar_bidireccional(problema, estado_inicial=None, con_heuristica=True,
+                         heuristica_directa=None, heuristica_inversa=None,
+                         nivel_traza=traza.COMPLETA, k_frontera=traza.K_FRONTERA_POR_DEFECTO,
+                         frontera_diferida=False):
+    """
+    Búsqueda bidireccional como generador, con el mismo protocolo que
+    motor_jarras.iterar_a_estrella:
+    - (traza.EXPANSION, registro) por cada expansión, con el formato de
+      registro de A* más la clave "direccion" (DIRECTA o INVERSA). En la
+      dirección inversa, "accion_entrada" es la acción que lleva del estado
+      hacia el objetivo y "sucesores" son sus predecesores.
+    - Al final (traza.RESULTADO, (estado_objetivo, diccionario_padre, diccionario_accion)),
+      listo para reconstruir_camino.
+    - con_heuristica=False: costo uniforme en ambas direcciones.
+    - con_heuristica=True: A* con heurísticas admisibles (por defecto las de
+      heuristicas_admisibles; si se pasan otras deben ser admisibles y
+      consistentes para conservar la optimalidad).
+    """
+    traza.validar_nivel(nivel_traza)
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    estado_inicial = tuple(estado_inicial)
+    con_logs = traza.con_logs(nivel_traza)
+    con_detalle = traza.con_detalle(nivel_traza)
+
+    if con_heuristica:
+        h_directa_defecto, h_inversa_defecto = heuristicas_admisibles(problema, estado_inicial)
+        heuristicas = (heuristica_directa or h_directa_defecto, heuristica_inversa or h_inversa_defecto)
+    else:
+        heuristicas = (_sin_heuristica, _sin_heuristica)
+    vecinos = (problema.sucesores, lambda estado: predecesores(problema, estado))
+    costo_minimo = min(problema.costos_acciones)
+
+    # Por dirección: costo g, padre (directa) o siguiente hacia el objetivo (inversa),
+    # acción, frontera (f, id_incremental, estado) y cerrados
+    costo = ({estado_inicial: 0}, {})
+    enlace = ({estado_inicial: None}, {})
+    accion = ({estado_inicial: None}, {})
+    fronteras = ([], [])
+    cerrados = (set(), set())
+    ids = [0, 0]
+    bitacoras = tuple(
+        traza.crear_bitacora(nivel_traza, lambda f, g, s: (f, g, f - g, s), _clave_frontera,
+                             diferida=frontera_diferida)
+        for _ in range(2)
+    )
+
+    def empujar(direccion, f, g, estado, mejora=False):
+        ids[direccion] += 1
+        heappush(fronteras[direccion], (f, ids[direccion], estado))
+        if bitacoras[direccion] is not None:
+            bitacoras[direccion].push(ids[direccion] - 1, f, g, estado, mejora=mejora)
+
+    empujar(0, heuristicas[0](estado_inicial), 0, estado_inicial)
+    for estado in estados_objetivo(problema):
+        costo[1][estado] = 0
+        enlace[1][estado] = None
+        accion[1][estado] = None
+        empujar(1, heuristicas[1](estado), 0, estado)
+
+    mejor = float("inf")
+    encuentro = None
+    if estado_inicial in costo[1]:
+        mejor, encuentro = 0, estado_inicial
+
+    total_descubiertos = len(costo[0]) + len(costo[1])
+    total_expandidos = 0
+    indice_expansion = 0
+
+    def convertidor(direccion):
+        def convertir(t):
+            f, _id, s = t
+            g = costo[direccion].get(s, 0)
+            return (f, g, f - g, s)
+        return convertir
+
+    convertidores = (convertidor(0), convertidor(1))
+
+    while True:
+        # Descartar de la cima de cada frontera los estados ya cerrados
+        for d in (0, 1):
+            frontera = fronteras[d]
+            while frontera and frontera[0][2] in cerrados[d]:
+                _f, identificador, _s = heappop(frontera)
+                if bitacoras[d] is not None:
+                    bitacoras[d].pop(identificador - 1)
+        if not fronteras[0] or not fronteras[1]:
+            break
+
+        cota = max(fronteras[0][0][0], fronteras[1][0][0])
+        if not con_heuristica:
+            cota = max(cota, fronteras[0][0][0] + fronteras[1][0][0] + costo_minimo)
+        if mejor <= cota:
+            break
+
+        d = 0 if len(fronteras[0]) <= len(fronteras[1]) else 1
+        otra = 1 - d
+        f_actual, identificador, estado_actual = heappop(fronteras[d])
+        if bitacoras[d] is not None:
+            bitacoras[d].pop(identificador - 1)
+        cerrados[d].add(estado_actual)
+        total_expandidos += 1
+        g_actual = costo[d][estado_actual]
+        h = heuristicas[d]
+
+        lista_vecinos = []
+        lista_anadidos = []
+        descubiertos_este_paso = 0
+        for nombre_accion, vecino, costo_de_accion in vecinos[d](estado_actual):
+            g_vecino = g_actual + costo_de_accion
+            h_vecino = h(vecino)
+            if con_detalle:
+                lista_vecinos.append((vecino, nombre_accion, costo_de_accion, g_vecino, h_vecino, g_vecino + h_vecino))
+            costo_previo = costo[d].get(vecino)
+            if costo_previo is None or g_vecino < costo_previo:
+                if costo_previo is None:
+                    descubiertos_este_paso += 1
+                costo[d][vecino] = g_vecino
+                enlace[d][vecino] = estado_actual
+                accion[d][vecino] = nombre_accion
+                cerrados[d].discard(vecino)
+                empujar(d, g_vecino + h_vecino, g_vecino, vecino, mejora=costo_previo is not None)
+                if con_detalle:
+                    lista_anadidos.append((g_vecino + h_vecino, g_vecino, h_vecino, vecino))
+                # Cruce con la otra dirección
+                g_otra = costo[otra].get(vecino)
+                if g_otra is not None and g_vecino + g_otra < mejor:
+                    mejor = g_vecino + g_otra
+                    encuentro = vecino
+
+        total_descubiertos += descubiertos_este_paso
+        if con_logs:
+            registro = traza.registro_a_estrella(
+                indice_expansion, estado_actual, g_actual, f_actual - g_actual,
+                accion[d].get(estado_actual), lista_vecinos, lista_anadidos,
+                traza.frontera_para_log(fronteras[d], nivel_traza, k_frontera, convertidores[d],
+                                        _clave_frontera, bitacoras[d]),
+                descubiertos_este_paso, 1, total_descubiertos, total_expandidos, False, len(fronteras[d]),
+            )
+            registro["direccion"] = (DIRECTA, INVERSA)[d]
+            yield traza.EXPANSION, registro
+        indice_expansion += 1
+
+    if encuentro is None:
+        yield traza.RESULTADO, (None, enlace[0], accion[0])
+        return
+
+    # Unir el camino: árbol directo hasta el encuentro y cadena inversa hasta el objetivo
+    diccionario_padre = dict(enlace[0])
+    diccionario_accion = dict(accion[0])
+    estado = encuentro
+    while enlace[1].get(estado) is not None:
+        siguiente = enlace[1][estado]
+        diccionario_padre[siguiente] = estado
+        diccionario_accion[siguiente] = accion[1][estado]
+        estado = siguiente
+
+    if con_logs:
+        registro = traza.registro_a_estrella(
+            indice_expansion, estado, mejor, 0, diccionario_accion.get(estado), [], [],
+            [], 0, 0, total_descubiertos, total_expandidos, True, 0,
+        )
+        registro["direccion"] = INVERSA
+        yield traza.EXPANSION, registro
+    yield traza.RESULTADO, (estado, diccionario_padre, diccionario_accion)
+
+
+def _recolectar(iterador):
+    """
+    Como traza.recolectar_logs, pero con claves (direccion, estado) en
+    logs_por_estado para las expansiones inversas (un mismo estado puede
+    expandirse en ambas direcciones).
+    """
+    logs_por_estado = {}
+    resultado = (None, {}, {})
+    for tipo, datos in iterador:
+        if tipo == traza.EXPANSION:
+            clave = datos["estado"]
+            if datos["direccion"] == INVERSA and not datos["es_objetivo"]:
+                clave = (INVERSA, clave)
+            logs_por_estado[clave] = datos
+        else:
+            resultado = datos
+    return resultado + (logs_por_estado,)
+
+
+def busqueda_costo_uniforme_bidireccional(problema, estado_inicial=None, **opciones):
+    """
+    Costo uniforme bidireccional. Devuelve
+    (estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado);
+    las expansiones inversas se guardan con clave (INVERSA, estado).
+    """
+    return _recolectar(iterar_bidireccional(problema, estado_inicial, con_heuristica=False,
+                                            frontera_diferida=True, **opciones))
+
+
+def busqueda_a_estrella_bidireccional(problema, estado_inicial=None, **opciones):
+    """
+    A* bidireccional con heurísticas admisibles. Devuelve
+    (estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado);
+    las expansiones inversas se guardan con clave (INVERSA, estado).
+    """
+    return _recolectar(iterar_bidireccional(problema, estado_inicial, con_heuristica=True,
+                                            frontera_diferida=True, **opciones))
@@ -0,0 +1,156 @@
+# busqueda_haz.py
+# --------------------------------------------------------
+# Búsqueda en haz (beam search) como variante acotada de Best-First.
+#
+# La búsqueda avanza por capas: se expanden los estados de la capa
+# actual (de menor a mayor h) y, de todos sus sucesores nuevos, sólo
+# los 'ancho' con menor h forman la capa siguiente. Desempate
+# determinista: orden de generación, es decir, el orden de la capa y
+# luego el orden de acciones del problema (ORDEN_ACCIONES).
+#
+# Memoria: padre, acción y el conjunto de estados ya usados en el haz
+# sólo guardan los estados que entraron al haz (a lo sumo
+# ancho · profundidad); los candidatos de cada capa se descartan.
+#
+# Con ampliar=True, si una capa queda vacía sin llegar al objetivo y
+# alguna capa se recortó, se reintenta desde el inicio con el ancho
+# multiplicado por 'factor' (hasta 'ancho_maximo', si se indica).
+# --------------------------------------------------------
+
+from heapq import nsmallest
+
+import traza
+
+FACTOR_AMPLIACION_POR_DEFECTO = 2
+
+
+def _clave_frontera(t):
+    return (t[0], str(t[1]))
+
+
+def _convertir(t):
+    return (t[0], t[2])
+
+
+def _intento(problema, estado_inicial, sucesores, ancho, nivel_traza, k_frontera, indice_inicial):
+    """
+    Un recorrido completo con 'ancho' fijo. Produce los mismos pares que
+    iterar_haz y, al final, (None, (estado_objetivo, padre, accion, recortado)).
+    """
+    funcion_heuristica = problema.funcion_heuristica
+    es_estado_final = problema.es_estado_final
+    con_logs = traza.con_logs(nivel_traza)
+    con_detalle = traza.con_detalle(nivel_traza)
+
+    diccionario_padre = {estado_inicial: None}
+    diccionario_accion = {estado_inicial: None}
+    orden = 0
+    capa = [(funcion_heuristica(estado_inicial), orden, estado_inicial)]
+    recortado = False
+
+    total_descubiertos = 1
+    total_expandidos = 0
+    indice_expansion = indice_inicial
+
+    while capa:
+        candidatos = {}  # sucesor -> (h, orden, estado_padre, accion)
+        for posicion, (valor_heuristico, _orden, estado_actual) in enumerate(capa):
+            if es_estado_final(estado_actual):
+                if con_logs:
+                    yield traza.EXPANSION, _registro(
+                        indice_expansion, estado_actual, valor_heuristico, diccionario_accion.get(estado_actual),
+                        [], [], capa[posicion + 1:], candidatos, nivel_traza, k_frontera, 0, 0,
+                        total_descubiertos, total_expandidos, True, ancho,
+                    )
+                yield None, (estado_actual, diccionario_padre, diccionario_accion, recortado)
+                return
+
+            total_expandidos += 1
+            lista_sucesores = []
+            lista_sucesores_anadidos = []
+            for nombre_accion, sucesor, _costo in sucesores(estado_actual):
+                h_suc = funcion_heuristica(sucesor)
+                if con_detalle:
+                    lista_sucesores.append((sucesor, nombre_accion, h_suc))
+                if sucesor in diccionario_padre or sucesor in candidatos:
+                    continue
+                orden += 1
+                candidatos[sucesor] = (h_suc, orden, estado_actual, nombre_accion)
+                lista_sucesores_anadidos.append((h_suc, sucesor))
+            total_descubiertos += len(lista_sucesores_anadidos)
+
+            if con_logs:
+                yield traza.EXPANSION, _registro(
+                    indice_expansion, estado_actual, valor_heuristico, diccionario_accion.get(estado_actual),
+                    lista_sucesores, lista_sucesores_anadidos if con_detalle else [], capa[posicion + 1:],
+                    candidatos, nivel_traza, k_frontera, len(lista_sucesores_anadidos), 1,
+                    total_descubiertos, total_expandidos, False, ancho,
+                )
+            indice_expansion += 1
+
+        # Capa siguiente: los 'ancho' candidatos con menor (h, orden)
+        if len(candidatos) > ancho:
+            recortado = True
+        capa = nsmallest(ancho, ((h, o, s) for s, (h, o, _p, _a) in candidatos.items()))
+        for _h, _orden, estado in capa:
+            _h, _orden, estado_padre, nombre_accion = candidatos[estado]
+            diccionario_padre[estado] = estado_padre
+            diccionario_accion[estado] = nombre_accion
+
+    yield None, (None, diccionario_padre, diccionario_accion, recortado)
+
+
+def _registro(indice_expansion, estado, valor_heuristico, accion_entrada, sucesores, sucesores_anadidos,
+              resto_capa, candidatos, nivel_traza, k_frontera, nuevos_descubiertos, expandidos_este_paso,
+              total_descubiertos, total_expandidos, es_objetivo, ancho):
+    """
+    registro_best_first con la frontera del haz (resto de la capa y candidatos).
+    """
+    frontera = []
+    if nivel_traza in (traza.COMPLETA, traza.TOPK):
+        frontera = resto_capa + [(h, o, s) for s, (h, o, _p, _a) in candidatos.items()]
+    registro = traza.registro_best_first(
+        indice_expansion, estado, valor_heuristico, accion_entrada, sucesores, sucesores_anadidos,
+        traza.frontera_para_log(frontera, nivel_traza, k_frontera, _convertir, _clave_frontera),
+        nuevos_descubiertos, expandidos_este_paso, total_descubiertos, total_expandidos,
+        es_objetivo, len(resto_capa) + len(candidatos),
+    )
+    registro["ancho_haz"] = ancho
+    return registro
+
+
+def iterar_haz(problema, estado_inicial=None, ancho=1, ampliar=False, factor=FACTOR_AMPLIACION_POR_DEFECTO,
+               ancho_maximo=None, grafo=None, nivel_traza=traza.COMPLETA,
+               k_frontera=traza.K_FRONTERA_POR_DEFECTO):
+    """
+    Búsqueda en haz sobre 'problema' como generador, con el protocolo de
+    motor_jarras.iterar_best_first: (traza.EXPANSION, registro) por expansión
+    (formato de registro_best_first más la clave 'ancho_haz') y al final
+    (traza.RESULTADO, (estado_objetivo, diccionario_padre, diccionario_accion)).
+    - 'frontera_total' son los estados pendientes de la capa más los
+      candidatos a la capa siguiente vistos hasta ese momento (acotada por
+      el ancho, así que se arma en cada registro sin bitácora).
+    """
+    traza.validar_nivel(nivel_traza)
+    if ancho < 1:
+        raise ValueError(f"El ancho del haz debe ser al menos 1: {ancho}")
+    if factor < 2:
+        raise ValueError(f"El factor de ampliación debe ser al menos 2: {factor}")
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    sucesores = problema.sucesores if grafo is None else grafo.generador_sucesores(problema)
+
+    indice_expansion = 0
+    while True:
+        for tipo, datos in _intento(problema, estado_inicial, sucesores, ancho, nivel_traza, k_frontera,
+                                    indice_expansion):
+            if tipo is not None:
+                indice_expansion = datos["expansion_index"] + 1
+                yield tipo, datos
+        estado_objetivo, diccionario_padre, diccionario_accion, recortado = datos
+        if (estado_objetivo is not None or not ampliar or not recortado
+                or (ancho_maximo is not None and ancho >= ancho_maximo)):
+            break
+        ancho = ancho * factor if ancho_maximo is None else min(ancho * factor, ancho_maximo)
+
+    yield traza.RESULTADO, (estado_objetivo, diccionario_padre, diccionario_accion)
@@ -0,0 +1,375 @@
+# cache_soluciones.py
+# --------------------------------------------------------
+# Caché persistente de soluciones en disco.
+#
+# Clave: SHA-256 de una descripción canónica (JSON con claves
+# ordenadas) de capacidades, costos, nombres de acciones, estado
+# inicial, objetivo, heurística, algoritmo y opciones de la búsqueda.
+# La heurística se identifica por módulo y __qualname__; las lambdas y
+# funciones locales (qualname con <lambda> o <locals>) no tienen un
+# nombre estable y no se cachean salvo que se les asigne uno (como
+# hace heuristicas.heuristica_pdb).
+#
+# Valor: camino solución (estados e índices de acción) y métricas
+# (costo, expandidos, descubiertos) en binario compacto.
+#
+# Formato del archivo (little-endian):
+#   cabecera : magia (8s) | generación (Q) | reloj (Q) | entradas (Q)
+#   entrada  : clave (32s) | último uso (q) | longitud (I) | datos
+#   datos    : jarras (H) | pasos (I) | costo (d) | expandidos (q) |
+#              descubiertos (q) | litros (q * pasos * jarras) |
+#              acciones (h * pasos, -1 = estado inicial)
+#
+# Lectura: el archivo se mapea en memoria (mmap) y se indexa una vez
+# por generación (clave -> posición); cada consulta es una búsqueda en
+# el índice y la decodificación de una sola entrada.
+# LRU: cada acierto escribe el 'reloj' en el campo 'último uso' de la
+# entrada. Al superar 'capacidad_bytes' se compacta el archivo
+# conservando las entradas usadas más recientemente.
+# Concurrencia: toda operación toma un flock exclusivo sobre el
+# archivo; la generación cambia al agregar o compactar, así los demás
+# procesos reconstruyen su índice y su mmap antes de leer.
+# Daños: al indexar, una entrada que no entra completa en el archivo
+# (escritura cortada) se trunca junto con el resto; una cabecera sin la
+# magia deja el caché vacío; una entrada que no se puede decodificar
+# cuenta como fallo (buscar devuelve None) y sale del índice.
+# --------------------------------------------------------
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections import namedtuple
+
+try:
+    import fcntl
+except ImportError:  # sin flock (p. ej. Windows): sin bloqueo entre procesos
+    fcntl = None
+
+MAGIA = b"JARCACH1"
+CABECERA = struct.Struct("<8sQQQ")
+ENTRADA = struct.Struct("<32sqI")
+DATOS = struct.Struct("<HIdqq")
+
+CAPACIDAD_POR_DEFECTO = 16 * 1024 * 1024  # bytes
+FRACCION_TRAS_COMPACTAR = 0.75            # se compacta hasta el 75 % de la capacidad
+VARIABLE_RUTA = "JARRAS_CACHE"
+
+
+def ruta_por_defecto():
+    """
+    Ruta del caché: $JARRAS_CACHE o ~/.cache/jarras/soluciones.bin
+    """
+    ruta = os.environ.get(VARIABLE_RUTA)
+    if ruta:
+        return ruta
+    return os.path.join(os.path.expanduser("~"), ".cache", "jarras", "soluciones.bin")
+
+
+# 1) Clave canónica y solución
+
+Solucion = namedtuple("Solucion", "camino costo expandidos descubiertos")
+Solucion.__doc__ = """
+Solución guardada en el caché:
+- camino: [(estado, nombre_accion_entrada), ...] (la primera acción es None)
+- costo: suma de los costos de las acciones del camino (None si no hay solución)
+- expandidos / descubiertos: métricas de la búsqueda que la encontró
+"""
+
+
+def nombre_heuristica(problema):
+    """
+    Identificador estable de la heurística de 'problema' (módulo y nombre
+    calificado), o None si no lo tiene (lambda o función local: dos
+    distintas pueden llamarse igual).
+    """
+    funcion = getattr(problema, "_heuristica", None)
+    if funcion is None:
+        return "por_defecto"
+    nombre = getattr(funcion, "__qualname__", None)
+    if nombre is None or "<lambda>" in nombre or "<locals>" in nombre:
+        return None
+    return f"{getattr(funcion, '__module__', '?')}.{nombre}"
+
+
+def _valor_opcion(valor):
+    """
+    Valor de una opción para la clave: tal cual si es un escalar JSON,
+    si no el nombre de su tipo (p. ej. un GrafoCSR).
+    """
+    if valor is None or isinstance(valor, (bool, int, float, str)):
+        return valor
+    return type(valor).__name__
+
+
+def clave_problema(problema, algoritmo, estado_inicial=None, opciones=None):
+    """
+    Devuelve la clave (32 bytes) de 'problema' resuelto con 'algoritmo' y
+    las 'opciones' de la búsqueda ({nombre: valor}), o None si la heurística
+    no tiene nombre estable (ver nombre_heuristica): no se cachea.
+    """
+    heuristica = nombre_heuristica(problema)
+    if heuristica is None:
+        return None
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    descripcion = {
+        "algoritmo": algoritmo,
+        "capacidades": list(problema.capacidades),
+        "costos": list(problema.costos_acciones),
+        "acciones": list(problema.nombres_acciones),
+        "inicial": list(estado_inicial),
+        "objetivo": sorted([int(j), int(x)] for j, x in problema.objetivo.items()),
+        "heuristica": heuristica,
+        "opciones": {nombre: _valor_opcion(valor) for nombre, valor in (opciones or {}).items()},
+    }
+    texto = json.dumps(descripcion, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(texto.encode("utf-8")).digest()
+
+
+def codificar_solucion(problema, solucion):
+    """
+    Serializa una Solucion a bytes (ver formato en la cabecera del módulo).
+    """
+    n = problema.numero_jarras
+    camino = solucion.camino
+    litros = [x for estado, _accion in camino for x in estado]
+    acciones = [-1 if accion is None else problema.indice_por_nombre[accion] for _estado, accion in camino]
+    costo = float("nan") if solucion.costo is None else float(solucion.costo)
+    return b"".join([
+        DATOS.pack(n, len(camino), costo, solucion.expandidos, solucion.descubiertos),
+        struct.pack(f"<{len(litros)}q", *litros),
+        struct.pack(f"<{len(acciones)}h", *acciones),
+    ])
+
+
+def decodificar_solucion(problema, datos, desplazamiento=0):
+    """
+    Reconstruye la Solucion guardada en 'datos' a partir de 'desplazamiento'.
+    """
+    n, pasos, costo, expandidos, descubiertos = DATOS.unpack_from(datos, desplazamiento)
+    if n != problema.numero_jarras:
+        raise ValueError("La entrada del caché no corresponde al problema.")
+    desplazamiento += DATOS.size
+    litros = struct.unpack_from(f"<{pasos * n}q", datos, desplazamiento)
+    desplazamiento += 8 * pasos * n
+    acciones = struct.unpack_from(f"<{pasos}h", datos, desplazamiento)
+    nombres = problema.nombres_acciones
+    camino = [
+        (tuple(litros[k * n:(k + 1) * n]), None if acciones[k] < 0 else nombres[acciones[k]])
+        for k in range(pasos)
+    ]
+    if costo != costo:  # NaN: sin solución
+        costo = None
+    elif all(isinstance(c, int) for c in problema.costos_acciones):
+        costo = int(costo)
+    return Solucion(camino, costo, expandidos, descubiertos)
+
+
+# 2) Archivo mapeado en memoria
+
+class CacheSoluciones:
+    """
+    Caché de soluciones en un archivo mapeado en memoria, con desalojo LRU
+    al superar 'capacidad_bytes' y acceso seguro desde varios procesos.
+    """
+
+    def __init__(self, ruta=None, capacidad_bytes=CAPACIDAD_POR_DEFECTO):
+        if capacidad_bytes <= CABECERA.size:
+            raise ValueError("La capacidad del caché es demasiado chica.")
+        self.ruta = ruta or ruta_por_defecto()
+        self.capacidad_bytes = capacidad_bytes
+        directorio = os.path.dirname(os.path.abspath(self.ruta))
+        os.makedirs(directorio, exist_ok=True)
+        self._fd = os.open(self.ruta, os.O_RDWR | os.O_CREAT, 0o644)
+        self._mapa = None
+        self._tamano_mapa = 0
+        self._generacion = None
+        self._indice = {}  # clave -> posición de la entrada
+        with self._bloqueo():
+            if os.fstat(self._fd).st_size < CABECERA.size:
+                os.ftruncate(self._fd, 0)
+                os.pwrite(self._fd, CABECERA.pack(MAGIA, 1, 0, 0), 0)
+            elif os.pread(self._fd, len(MAGIA), 0) != MAGIA:
+                raise ValueError(f"{self.ruta} no es un caché de soluciones.")
+
+    def cerrar(self):
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_excepcion):
+        self.cerrar()
+
+    # Bloqueo y sincronización
+
+    def _bloqueo(self):
+        return _Bloqueo(self._fd)
+
+    def _sincronizar(self):
+        """
+        Re-mapea y re-indexa el archivo si cambió de tamaño o de generación.
+        Una cabecera dañada reinicia el caché vacío y una entrada cortada al
+        final se trunca. Se llama con el bloqueo tomado.
+        """
+        tamano = os.fstat(self._fd).st_size
+        if tamano < CABECERA.size or os.pread(self._fd, len(MAGIA), 0) != MAGIA:
+            generacion = self._generacion + 1 if self._generacion is not None else 1
+            os.ftruncate(self._fd, 0)
+            self._escribir_cabecera(generacion, 0, 0)
+            tamano = CABECERA.size
+        cambio = tamano != self._tamano_mapa
+        if cambio:
+            self._mapear(tamano)
+        _magia, generacion, reloj, _entradas = CABECERA.unpack_from(self._mapa, 0)
+        if cambio or generacion != self._generacion:
+            self._indice = {}
+            fin = CABECERA.size
+            for clave, posicion, _uso, longitud in self._entradas():
+                self._indice[clave] = posicion
+                fin = posicion + ENTRADA.size + longitud
+            if fin < self._tamano_mapa:
+                os.ftruncate(self._fd, fin)
+                self._mapear(fin)
+            self._generacion = generacion
+        return reloj
+
+    def _mapear(self, tamano):
+        if self._mapa is not None:
+            self._mapa.close()
+        self._mapa = mmap.mmap(self._fd, tamano, access=mmap.ACCESS_READ)
+        self._tamano_mapa = tamano
+
+    def _entradas(self):
+        """
+        Genera (clave, posición, último uso, longitud) de cada entrada completa
+        del archivo; se detiene en la primera que no entra (escritura cortada).
+        """
+        posicion = CABECERA.size
+        while posicion + ENTRADA.size <= self._tamano_mapa:
+            clave, uso, longitud = ENTRADA.unpack_from(self._mapa, posicion)
+            if posicion + ENTRADA.size + longitud > self._tamano_mapa:
+                return
+            yield clave, posicion, uso, longitud
+            posicion += ENTRADA.size + longitud
+
+    def _escribir_cabecera(self, generacion, reloj, entradas):
+        os.pwrite(self._fd, CABECERA.pack(MAGIA, generacion, reloj, entradas), 0)
+
+    # Operaciones
+
+    def __len__(self):
+        with self._bloqueo():
+            self._sincronizar()
+            return len(self._indice)
+
+    def __contains__(self, clave):
+        with self._bloqueo():
+            self._sincronizar()
+            return clave in self._indice
+
+    def buscar(self, problema, clave):
+        """
+        Devuelve la Solucion guardada para 'clave' o None. Un acierto la
+        marca como usada recientemente (LRU); una entrada dañada es un fallo
+        y sale del índice (guardar la vuelve a escribir).
+        """
+        with self._bloqueo():
+            reloj = self._sincronizar()
+            posicion = self._indice.get(clave)
+            if posicion is None:
+                return None
+            _clave, _uso, longitud = ENTRADA.unpack_from(self._mapa, posicion)
+            inicio = posicion + ENTRADA.size
+            try:
+                solucion = decodificar_solucion(problema, self._mapa[inicio:inicio + longitud])
+            except (struct.error, ValueError, IndexError):
+                del self._indice[clave]
+                return None
+            reloj += 1
+            os.pwrite(self._fd, struct.pack("<q", reloj), posicion + 32)
+            os.pwrite(self._fd, struct.pack("<Q", reloj), 16)
+            return solucion
+
+    def guardar(self, problema, clave, solucion):
+        """
+        Guarda 'solucion' bajo 'clave' (si ya estaba, sólo la marca como usada).
+        Devuelve False si la entrada no entra en la capacidad del caché.
+        """
+        datos = codificar_solucion(problema, solucion)
+        if CABECERA.size + ENTRADA.size + len(datos) > self.capacidad_bytes:
+            return False
+        with self._bloqueo():
+            reloj = self._sincronizar()
+            _magia, generacion, _reloj, entradas = CABECERA.unpack_from(self._mapa, 0)
+            reloj += 1
+            posicion = self._indice.get(clave)
+            if posicion is not None:
+                os.pwrite(self._fd, struct.pack("<q", reloj), posicion + 32)
+                os.pwrite(self._fd, struct.pack("<Q", reloj), 16)
+                return True
+            os.pwrite(self._fd, ENTRADA.pack(clave, reloj, len(datos)) + datos, self._tamano_mapa)
+            self._escribir_cabecera(generacion + 1, reloj, entradas + 1)
+            if self._tamano_mapa + ENTRADA.size + len(datos) > self.capacidad_bytes:
+                self._sincronizar()
+                self._compactar()
+            return True
+
+    def limpiar(self):
+        """
+        Elimina todas las entradas.
+        """
+        with self._bloqueo():
+            self._sincronizar()
+            _magia, generacion, reloj, _entradas = CABECERA.unpack_from(self._mapa, 0)
+            os.ftruncate(self._fd, CABECERA.size)
+            self._escribir_cabecera(generacion + 1, reloj, 0)
+
+    def _compactar(self):
+        """
+        Reescribe el archivo con las entradas más recientes hasta ocupar
+        FRACCION_TRAS_COMPACTAR de la capacidad. Se llama con el bloqueo tomado.
+        """
+        _magia, generacion, reloj, _entradas = CABECERA.unpack_from(self._mapa, 0)
+        limite = int(self.capacidad_bytes * FRACCION_TRAS_COMPACTAR)
+        conservadas = []
+        ocupado = CABECERA.size
+        for _clave, posicion, _uso, longitud in sorted(self._entradas(), key=lambda e: -e[2]):
+            tamano = ENTRADA.size + longitud
+            if ocupado + tamano > limite:
+                break
+            conservadas.append((posicion, tamano))
+            ocupado += tamano
+        # Se conserva el orden original de las entradas en el archivo
+        conservadas.sort()
+        cuerpo = b"".join(self._mapa[posicion:posicion + tamano] for posicion, tamano in conservadas)
+        os.pwrite(self._fd, cuerpo, CABECERA.size)
+        os.ftruncate(self._fd, CABECERA.size + len(cuerpo))
+        self._escribir_cabecera(generacion + 1, reloj, len(conservadas))
+
+
+class _Bloqueo:
+    """
+    flock exclusivo sobre el descriptor del caché (no hace nada sin fcntl).
+    """
+
+    __slots__ = ("fd",)
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    def __enter__(self):
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *_excepcion):
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
@@ -0,0 +1,665 @@
+# estados_empaquetados.py
+# --------------------------------------------------------
+# Codificación opcional de estados como un único entero en base
+# mixta (base de cada jarra = capacidad + 1) para las búsquedas
+# de motor_jarras.
+#
+#   codigo = litros_0 * peso_0 + litros_1 * peso_1 + ...
+#   peso_0 = 1, peso_k = peso_(k-1) * (capacidad_(k-1) + 1)
+#
+# Con el estado empaquetado, padre, acción, g y visitados dejan de
+# ser diccionarios con claves tupla y pasan a estar indexados por el
+# código del estado (TablasEmpaquetadas):
+#   - dispersas: diccionarios con claves enteras (sin tuplas, unos
+#     200 bytes por estado descubierto)
+#   - densas: arreglos planos (módulo 'array') de una celda por
+#     código posible, 15 bytes por celda (7 en Best-First) alcanzable
+#     o no
+# Se empieza con tablas densas si el espacio tiene a lo sumo
+# CELDAS_DENSAS_DESDE_INICIO celdas y con dispersas si no; las
+# dispersas pasan a densas cuando los descubiertos superan
+# FRACCION_DENSAS de las celdas (desde ahí las densas ocupan menos).
+#
+# El bucle trabaja sobre códigos: una función generada por
+# configuración (como sucesores_compilados.py) decodifica el estado
+# expandido con divisiones enteras, calcula cada código sucesor con
+# aritmética (llenar suma (cap - x)·peso, transferir suma
+# cantidad·(peso_j - peso_i)) y, con la heurística por defecto,
+# también h del sucesor en forma incremental (sólo cambian una o dos
+# jarras). El test de objetivo también es sobre el código. Las tuplas
+# sólo se arman para los logs, para una heurística propia y al
+# reconstruir el camino.
+#
+# Cuándo conviene (A*, traza 'ninguna', heurística por defecto):
+#   - espacio denso (gran parte de las celdas alcanzables, p. ej.
+#     (20, 25, 31, 37), 171 mil de 663 mil celdas): la mitad de
+#     memoria que con tuplas (36 MB contra 69 MB) y unas 3 veces
+#     más rápido
+#   - espacio disperso (p. ej. (97, 89, 1000), 389 mil de 8.9 millones
+#     de celdas): se queda con tablas dispersas, un 10% menos de
+#     memoria y 1.7 veces más rápido
+#   - con una heurística propia cada sucesor se decodifica para
+#     llamarla: la ganancia de tiempo se pierde; con traza detallada
+#     domina el armado de los logs
+# --------------------------------------------------------
+
+from array import array
+
+import fronteras
+import sucesores_compilados
+import traza
+
+# Tablas densas: sólo con espacios de a lo sumo LIMITE_CELDAS celdas;
+# desde el inicio con a lo sumo CELDAS_DENSAS_DESDE_INICIO; y al
+# descubrir más de FRACCION_DENSAS de las celdas
+LIMITE_CELDAS = 10**9
+CELDAS_DENSAS_DESDE_INICIO = 2**16
+FRACCION_DENSAS = 1 / 16
+
+# Valores centinela en las tablas
+SIN_DESCUBRIR = -1   # padre: estado aún no descubierto
+SIN_PADRE = -2       # padre: estado inicial
+SIN_ACCION = -1      # acción: estado inicial / no descubierto
+SIN_COSTO = -1       # g: estado aún no descubierto
+
+
+# 1) Codificador en base mixta
+
+class CodificadorEstados:
+    """
+    Traduce estados (tuplas de litros) a enteros en base mixta y viceversa.
+    """
+
+    def __init__(self, capacidades):
+        self.capacidades = tuple(capacidades)
+        self.bases = tuple(c + 1 for c in self.capacidades)
+        pesos = []
+        peso = 1
+        for base in self.bases:
+            pesos.append(peso)
+            peso *= base
+        self.pesos = tuple(pesos)
+        self.total_celdas = peso
+
+    def codificar(self, estado):
+        codigo = 0
+        for litros, peso in zip(estado, self.pesos):
+            codigo += litros * peso
+        return codigo
+
+    def decodificar(self, codigo):
+        niveles = []
+        for base in self.bases:
+            codigo, litros = divmod(codigo, base)
+            niveles.append(litros)
+        return tuple(niveles)
+
+    def tipo_indice(self):
+        """
+        Typecode de 'array' mínimo para guardar códigos de estado (con signo).
+        """
+        return "i" if self.total_celdas < 2**31 else "q"
+
+
+def _tipo_costo(problema):
+    """
+    Typecode de 'array' para g: entero si todos los costos son enteros.
+    """
+    if all(isinstance(c, int) for c in problema.costos_acciones):
+        return "q"
+    return "d"
+
+
+def crear_codificador(problema):
+    """
+    Crea el codificador para 'problema'. Con más de LIMITE_CELDAS celdas
+    las tablas quedan siempre dispersas.
+    """
+    return CodificadorEstados(problema.capacidades)
+
+
+# 2) Tablas por código: dispersas (dict) o densas (array)
+
+class _TablaDispersa(dict):
+    """
+    Diccionario código -> valor que devuelve 'ausente' para los códigos que
+    no tiene (se lee igual que un arreglo denso: tabla[codigo]).
+    """
+
+    __slots__ = ("ausente",)
+
+    def __init__(self, ausente):
+        super().__init__()
+        self.ausente = ausente
+
+    def __missing__(self, codigo):
+        return self.ausente
+
+
+class TablasEmpaquetadas:
+    """
+    Padre, acción, g (opcional) y visitados indexados por código.
+    - densas: arreglos de total_celdas posiciones; si no, _TablaDispersa
+    - descubiertos: estados con padre (lo actualiza la búsqueda)
+    - umbral_densas: cantidad de descubiertos desde la que conviene densificar
+      (infinito si ya son densas o el espacio supera LIMITE_CELDAS)
+    """
+
+    def __init__(self, codificador, tipo_costo=None):
+        self.codificador = codificador
+        self.tipo_costo = tipo_costo
+        self.descubiertos = 0
+        self.densas = False
+        self.padres = _TablaDispersa(SIN_DESCUBRIR)
+        self.acciones = _TablaDispersa(SIN_ACCION)
+        self.costos = _TablaDispersa(SIN_COSTO) if tipo_costo is not None else None
+        self.visitados = _TablaDispersa(0)
+        total = codificador.total_celdas
+        self.umbral_densas = total * FRACCION_DENSAS if total <= LIMITE_CELDAS else float("inf")
+        if total <= CELDAS_DENSAS_DESDE_INICIO:
+            self.densificar()
+
+    def densificar(self):
+        """
+        Pasa las tablas dispersas a arreglos densos con los mismos valores.
+        """
+        total = self.codificador.total_celdas
+        padres = array(self.codificador.tipo_indice(), [SIN_DESCUBRIR]) * total
+        acciones = array("h", [SIN_ACCION]) * total
+        visitados = bytearray(total)
+        for codigo, padre in self.padres.items():
+            padres[codigo] = padre
+        for codigo, indice in self.acciones.items():
+            acciones[codigo] = indice
+        for codigo in self.visitados:
+            visitados[codigo] = 1
+        if self.costos is not None:
+            costos = array(self.tipo_costo, [SIN_COSTO]) * total
+            for codigo, costo in self.costos.items():
+                costos[codigo] = costo
+            self.costos = costos
+        self.padres, self.acciones, self.visitados = padres, acciones, visitados
+        self.densas = True
+        self.umbral_densas = float("inf")
+
+    def codigos(self):
+        """
+        Códigos de los estados descubiertos, en orden creciente.
+        """
+        if self.densas:
+            return (codigo for codigo, padre in enumerate(self.padres) if padre != SIN_DESCUBRIR)
+        return iter(sorted(self.padres))
+
+
+# 3) Vistas tipo diccionario sobre las tablas
+
+class TablaEmpaquetada:
+    """
+    Vista de sólo lectura con claves tupla sobre una tabla indexada por código.
+    Se comporta como diccionario_padre / diccionario_accion para
+    reconstruir_camino y los runners (get, [], in, len, items).
+    """
+
+    def __init__(self, tablas, campo, traducir):
+        self._tablas = tablas
+        self._codificador = tablas.codificador
+        self._campo = campo          # "padres" o "acciones"
+        self._traducir = traducir
+
+    def _codigo(self, estado):
+        if estado is None or len(estado) != len(self._codificador.bases):
+            return None
+        for litros, base in zip(estado, self._codificador.bases):
+            if not 0 <= litros < base:
+                return None
+        return self._codificador.codificar(estado)
+
+    def __contains__(self, estado):
+        codigo = self._codigo(estado)
+        return codigo is not None and self._tablas.padres[codigo] != SIN_DESCUBRIR
+
+    def __getitem__(self, estado):
+        if estado not in self:
+            raise KeyError(estado)
+        return self._traducir(getattr(self._tablas, self._campo)[self._codigo(estado)])
+
+    def get(self, estado, por_defecto=None):
+        if estado not in self:
+            return por_defecto
+        return self._traducir(getattr(self._tablas, self._campo)[self._codigo(estado)])
+
+    def __len__(self):
+        return self._tablas.descubiertos
+
+    def __iter__(self):
+        decodificar = self._codificador.decodificar
+        for codigo in self._tablas.codigos():
+            yield decodificar(codigo)
+
+    def keys(self):
+        return iter(self)
+
+    def items(self):
+        for estado in self:
+            yield estado, self[estado]
+
+
+def _crear_vistas(problema, tablas):
+    decodificar = tablas.codificador.decodificar
+    nombres = problema.nombres_acciones
+
+    def traducir_padre(codigo):
+        return None if codigo == SIN_PADRE else decodificar(codigo)
+
+    def traducir_accion(indice):
+        return None if indice == SIN_ACCION else nombres[indice]
+
+    return TablaEmpaquetada(tablas, "padres", traducir_padre), TablaEmpaquetada(tablas, "acciones", traducir_accion)
+
+
+# 4) Sucesores sobre códigos
+
+def _tabla_transiciones(problema):
+    """
+    Precalcula el índice de acción de cada transferencia (origen, destino).
+    """
+    n = problema.numero_jarras
+    indice_transferir = {}
+    for indice in range(2 * n, len(problema.acciones)):
+        _tipo, i, j = problema.acciones[indice]
+        indice_transferir[(i, j)] = indice
+    return indice_transferir
+
+
+def sucesores_codificados(codificador, codigo, indice_transferir):
+    """
+    Devuelve (niveles, [(indice_accion, codigo_sucesor), ...]) en el orden determinista
+    de acciones, calculando los códigos de los sucesores de forma aritmética.
+    Versión genérica (con bucles) de la función que genera compilar_busqueda_codificada.
+    """
+    niveles = codificador.decodificar(codigo)
+    capacidades = codificador.capacidades
+    pesos = codificador.pesos
+    n = len(niveles)
+    resultado = []
+    for j in range(n):
+        if niveles[j] < capacidades[j]:
+            resultado.append((j, codigo + (capacidades[j] - niveles[j]) * pesos[j]))
+    for i in range(n):
+        if niveles[i] > 0:
+            resultado.append((n + i, codigo - niveles[i] * pesos[i]))
+    for i in range(n):
+        litros_origen = niveles[i]
+        if litros_origen == 0:
+            continue
+        for j in range(n):
+            if i == j:
+                continue
+            espacio_en_destino = capacidades[j] - niveles[j]
+            if espacio_en_destino == 0:
+                continue
+            cantidad_transferida = min(litros_origen, espacio_en_destino)
+            resultado.append((
+                indice_transferir[(i, j)],
+                codigo + cantidad_transferida * (pesos[j] - pesos[i]),
+            ))
+    return niveles, resultado
+
+
+def generar_codigo_codificado(capacidades, indice_transferir, costos_acciones, objetivo, heuristica_en_linea):
+    """
+    Devuelve (codigo, espacio_global) de dos funciones para la configuración:
+    - sucesores(codigo) -> [(indice_accion, codigo_sucesor, costo, h_sucesor), ...]
+      en el orden determinista; con heuristica_en_linea=True h es la heurística
+      por defecto (suma de |litros - objetivo|) calculada sin armar el sucesor,
+      si no se llama a _h (del espacio global) con la tupla del sucesor
+    - es_final(codigo) -> bool, el objetivo {jarra: litros} sobre el código
+    """
+    constantes = sucesores_compilados.Constantes()
+    n = len(capacidades)
+    pesos = []
+    peso = 1
+    for capacidad in capacidades:
+        pesos.append(peso)
+        peso *= capacidad + 1
+    variables = [f"x{j}" for j in range(n)]
+
+    def desplazamiento(cantidad, peso_accion):
+        return f"{cantidad} * {peso_accion}" if peso_accion != 1 else cantidad
+
+    def heuristica(cambios):
+        if not heuristica_en_linea:
+            tupla = "(" + ", ".join(cambios.get(j, variables[j]) for j in range(n)) + ("," if n == 1 else "") + ")"
+            return f"_h({tupla})"
+        partes = ["h"]
+        for j, expresion in cambios.items():
+            if j not in objetivo:
+                continue
+            if expresion.isdigit():
+                partes.append(f"- d{j} + {abs(int(expresion) - objetivo[j])}")
+            else:
+                partes.append(f"- d{j} + abs({expresion} - {objetivo[j]})")
+        return " ".join(partes)
+
+    lineas = ["def sucesores(codigo):"]
+    if n == 1:
+        lineas.append("    x0 = codigo")
+    else:
+        lineas.append("    resto = codigo")
+        for j in range(n - 1):
+            lineas.append(f"    x{j} = resto % {capacidades[j] + 1}")
+            lineas.append(f"    resto //= {capacidades[j] + 1}")
+        lineas.append(f"    x{n - 1} = resto")
+    if heuristica_en_linea:
+        for j, litros in sorted(objetivo.items()):
+            lineas.append(f"    d{j} = abs(x{j} - {litros})")
+        lineas.append("    h = " + (" + ".join(f"d{j}" for j in sorted(objetivo)) or "0"))
+    lineas.append("    resultado = []")
+    lineas.append("    agregar = resultado.append")
+    for j, capacidad in enumerate(capacidades):
+        lineas.append(f"    if x{j} < {capacidad}:")
+        lineas.append(f"        agregar(({j}, codigo + {desplazamiento(f'({capacidad} - x{j})', pesos[j])}, "
+                      f"{constantes.literal(costos_acciones[j])}, {heuristica({j: str(capacidad)})}))")
+    for i in range(n):
+        lineas.append(f"    if x{i} > 0:")
+        lineas.append(f"        agregar(({n + i}, codigo - {desplazamiento(f'x{i}', pesos[i])}, "
+                      f"{constantes.literal(costos_acciones[n + i])}, {heuristica({i: '0'})}))")
+    for i in range(n):
+        destinos = [j for j in range(n) if j != i]
+        if not destinos:
+            continue
+        lineas.append(f"    if x{i} != 0:")
+        for j in destinos:
+            indice = indice_transferir[(i, j)]
+            lineas.append(f"        espacio = {capacidades[j]} - x{j}")
+            lineas.append("        if espacio != 0:")
+            lineas.append(f"            cantidad = x{i} if x{i} < espacio else espacio")
+            lineas.append(f"            agregar(({indice}, codigo + cantidad * {pesos[j] - pesos[i]}, "
+                          f"{constantes.literal(costos_acciones[indice])}, "
+                          f"{heuristica({i: f'x{i} - cantidad', j: f'x{j} + cantidad'})}))")
+    lineas.append("    return resultado")
+    lineas.append("")
+    lineas.append("def es_final(codigo):")
+    condiciones = []
+    for j, litros in sorted(objetivo.items()):
+        expresion = f"codigo // {pesos[j]}" if pesos[j] != 1 else "codigo"
+        if j < n - 1:
+            expresion = f"{expresion} % {capacidades[j] + 1}"
+        condiciones.append(f"{expresion} == {litros}")
+    lineas.append("    return " + (" and ".join(condiciones) or "True"))
+    return "\n".join(lineas) + "\n", constantes.espacio
+
+
+_CACHE = {}
+
+
+def compilar_busqueda_codificada(problema):
+    """
+    Devuelve (sucesores, es_final) generadas para 'problema' (ver
+    generar_codigo_codificado). Con la heurística por defecto se cachean por
+    configuración; con una heurística propia se generan cada vez, con ella
+    en el espacio global.
+    """
+    indice_transferir = _tabla_transiciones(problema)
+    en_linea = problema._heuristica is None
+    clave = (problema.capacidades, tuple(sorted(indice_transferir.items())), tuple(problema.costos_acciones),
+             tuple(sorted(problema.objetivo.items())))
+    if en_linea and clave in _CACHE:
+        return _CACHE[clave]
+    codigo, espacio = generar_codigo_codificado(problema.capacidades, indice_transferir,
+                                                problema.costos_acciones, problema.objetivo, en_linea)
+    if not en_linea:
+        espacio["_h"] = problema.funcion_heuristica
+    exec(compile(codigo, f"<empaquetado {problema.capacidades}>", "exec"), espacio)
+    funciones = (espacio["sucesores"], espacio["es_final"])
+    if en_linea:
+        _CACHE[clave] = funciones
+    return funciones
+
+
+# 5) Búsquedas con estados empaquetados
+
+def iterar_best_first_empaquetada(problema, estado_inicial=None, nivel_traza=traza.COMPLETA,
+                                  k_frontera=traza.K_FRONTERA_POR_DEFECTO, frontera_diferida=False,
+                                  tipo_frontera=fronteras.AUTOMATICA):
+    """
+    Best-First con estados empaquetados en enteros y tablas por código.
+    Mismo contrato que motor_jarras.iterar_best_first; padre y acción
+    se entregan como vistas TablaEmpaquetada con claves tupla.
+    """
+    traza.validar_nivel(nivel_traza)
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    codificador = crear_codificador(problema)
+    decodificar = codificador.decodificar
+    funcion_heuristica = problema.funcion_heuristica
+    sucesores, es_final = compilar_busqueda_codificada(problema)
+    nombres = problema.nombres_acciones
+    con_logs = traza.con_logs(nivel_traza)
+    con_detalle = traza.con_detalle(nivel_traza)
+
+    tablas = TablasEmpaquetadas(codificador)
+    padres, acciones, visitados = tablas.padres, tablas.acciones, tablas.visitados
+    vista_padre, vista_accion = _crear_vistas(problema, tablas)
+
+    codigo_inicial = codificador.codificar(estado_inicial)
+    padres[codigo_inicial] = SIN_PADRE
+    unicos = tablas.descubiertos = 1
+
+    bitacora = traza.crear_bitacora(nivel_traza, lambda h, _g, c: (h, decodificar(c)),
+                                    lambda t: (t[0], str(t[1])), diferida=frontera_diferida)
+
+    id_incremental = 0
+    h_inicial = funcion_heuristica(estado_inicial)
+    # Cola de prioridad: (h, id_incremental, codigo)
+    frontera = fronteras.crear_frontera(tipo_frontera, (), h_inicial)
+    frontera.push(h_inicial, id_incremental, codigo_inicial)
+    if bitacora is not None:
+        bitacora.push(id_incremental, h_inicial, 0, codigo_inicial)
+
+    total_descubiertos = 1
+    total_expandidos = 0
+    indice_expansion = 0
+
+    def convertir(t):
+        return (t[0], decodificar(t[2]))
+
+    def frontera_para_log():
+        return traza.frontera_para_log(frontera, nivel_traza, k_frontera, convertir,
+                                       lambda t: (t[0], str(t[1])), bitacora)
+
+    while frontera:
+        valor_heuristico, identificador, codigo_actual = frontera.pop()
+        if bitacora is not None:
+            bitacora.pop(identificador)
+
+        if visitados[codigo_actual]:
+            continue
+
+        if es_final(codigo_actual):
+            tablas.descubiertos = unicos
+            estado_actual = decodificar(codigo_actual)
+            if con_logs:
+                yield traza.EXPANSION, traza.registro_best_first(
+                    indice_expansion, estado_actual, valor_heuristico,
+                    vista_accion.get(estado_actual), [], [], frontera_para_log(),
+                    0, 0, total_descubiertos, total_expandidos, True, len(frontera),
+                )
+            yield traza.RESULTADO, (estado_actual, vista_padre, vista_accion)
+            return
+
+        visitados[codigo_actual] = 1
+        total_expandidos += 1
+
+        lista_sucesores = []
+        lista_sucesores_anadidos = []
+        nuevos_descubiertos = 0
+        for indice_accion, codigo_sucesor, _costo, h_suc in sucesores(codigo_actual):
+            if con_detalle:
+                lista_sucesores.append((decodificar(codigo_sucesor), nombres[indice_accion], h_suc))
+            if padres[codigo_sucesor] == SIN_DESCUBRIR:
+                padres[codigo_sucesor] = codigo_actual
+                acciones[codigo_sucesor] = indice_accion
+                unicos += 1
+                id_incremental += 1
+                frontera.push(h_suc, id_incremental, codigo_sucesor)
+                if bitacora is not None:
+                    bitacora.push(id_incremental, h_suc, 0, codigo_sucesor)
+            if padres[codigo_sucesor] == codigo_actual:
+                nuevos_descubiertos += 1
+                if con_detalle:
+                    lista_sucesores_anadidos.append((h_suc, decodificar(codigo_sucesor)))
+
+        total_descubiertos += nuevos_descubiertos
+        tablas.descubiertos = unicos
+        if unicos > tablas.umbral_densas:
+            tablas.densificar()
+            padres, acciones, visitados = tablas.padres, tablas.acciones, tablas.visitados
+
+        if con_logs:
+            estado_actual = decodificar(codigo_actual)
+            yield traza.EXPANSION, traza.registro_best_first(
+                indice_expansion, estado_actual, valor_heuristico,
+                vista_accion.get(estado_actual), lista_sucesores, lista_sucesores_anadidos,
+                frontera_para_log(), nuevos_descubiertos, 1,
+                total_descubiertos, total_expandidos, False, len(frontera),
+            )
+
+        indice_expansion += 1
+
+    yield traza.RESULTADO, (None, vista_padre, vista_accion)
+
+
+def iterar_a_estrella_empaquetada(problema, estado_inicial=None, nivel_traza=traza.COMPLETA,
+                                  k_frontera=traza.K_FRONTERA_POR_DEFECTO, frontera_diferida=False,
+                                  tipo_frontera=fronteras.AUTOMATICA):
+    """
+    A* con estados empaquetados en enteros y padre/acción/g en tablas por código.
+    Mismo contrato que motor_jarras.iterar_a_estrella; padre y acción
+    se entregan como vistas TablaEmpaquetada con claves tupla.
+    """
+    traza.validar_nivel(nivel_traza)
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    codificador = crear_codificador(problema)
+    decodificar = codificador.decodificar
+    funcion_heuristica = problema.funcion_heuristica
+    sucesores, es_final = compilar_busqueda_codificada(problema)
+    nombres = problema.nombres_acciones
+    con_logs = traza.con_logs(nivel_traza)
+    con_detalle = traza.con_detalle(nivel_traza)
+
+    tablas = TablasEmpaquetadas(codificador, _tipo_costo(problema))
+    padres, acciones, costo_acumulado, visitados = tablas.padres, tablas.acciones, tablas.costos, tablas.visitados
+    vista_padre, vista_accion = _crear_vistas(problema, tablas)
+
+    codigo_inicial = codificador.codificar(estado_inicial)
+    padres[codigo_inicial] = SIN_PADRE
+    costo_acumulado[codigo_inicial] = 0
+    unicos = tablas.descubiertos = 1
+
+    bitacora = traza.crear_bitacora(nivel_traza, lambda f, g, c: (f, g, f - g, decodificar(c)),
+                                    lambda t: (t[0], str(t[3])), diferida=frontera_diferida)
+
+    id_incremental = 0
+    f_inicial = funcion_heuristica(estado_inicial)
+    # Cola de prioridad: (f, id_incremental, codigo)
+    frontera = fronteras.crear_frontera(tipo_frontera, problema.costos_acciones, f_inicial)
+    frontera.push(f_inicial, id_incremental, codigo_inicial)
+    if bitacora is not None:
+        bitacora.push(id_incremental, f_inicial, 0, codigo_inicial)
+
+    total_descubiertos = 1
+    total_expandidos = 0
+    indice_expansion = 0
+
+    def convertir(t):
+        f, _id, c = t
+        g = tablas.costos[c]
+        return (f, g, f - g, decodificar(c))
+
+    def frontera_para_log():
+        return traza.frontera_para_log(frontera, nivel_traza, k_frontera, convertir,
+                                       lambda t: (t[0], str(t[3])), bitacora)
+
+    while frontera:
+        _valor_funcion_f, identificador, codigo_actual = frontera.pop()
+        if bitacora is not None:
+            bitacora.pop(identificador)
+
+        if visitados[codigo_actual]:
+            continue
+
+        costo_acumulado_actual = costo_acumulado[codigo_actual]
+
+        if es_final(codigo_actual):
+            tablas.descubiertos = unicos
+            estado_actual = decodificar(codigo_actual)
+            if con_logs:
+                yield traza.EXPANSION, traza.registro_a_estrella(
+                    indice_expansion, estado_actual, costo_acumulado_actual,
+                    funcion_heuristica(estado_actual), vista_accion.get(estado_actual), [], [],
+                    frontera_para_log(), 0, 0, total_descubiertos, total_expandidos, True, len(frontera),
+                )
+            yield traza.RESULTADO, (estado_actual, vista_padre, vista_accion)
+            return
+
+        visitados[codigo_actual] = 1
+        total_expandidos += 1
+
+        lista_sucesores = []
+        lista_sucesores_anadidos = []
+        descubiertos_este_paso = 0
+
+        for indice_accion, codigo_sucesor, costo_de_accion, heuristica_sucesor in sucesores(codigo_actual):
+            costo_acumulado_sucesor = costo_acumulado_actual + costo_de_accion
+            valor_funcion_f_sucesor = costo_acumulado_sucesor + heuristica_sucesor
+
+            if con_detalle:
+                lista_sucesores.append((
+                    decodificar(codigo_sucesor),
+                    nombres[indice_accion],
+                    costo_de_accion,
+                    costo_acumulado_sucesor,
+                    heuristica_sucesor,
+                    valor_funcion_f_sucesor
+                ))
+
+            costo_previo = costo_acumulado[codigo_sucesor]
+            if costo_previo < 0 or costo_acumulado_sucesor < costo_previo:
+                if costo_previo < 0:
+                    unicos += 1
+                costo_acumulado[codigo_sucesor] = costo_acumulado_sucesor
+                padres[codigo_sucesor] = codigo_actual
+                acciones[codigo_sucesor] = indice_accion
+                id_incremental += 1
+                reemplazado = frontera.push(valor_funcion_f_sucesor, id_incremental, codigo_sucesor)
+                if bitacora is not None:
+                    if reemplazado is not None:
+                        bitacora.pop(reemplazado)
+                    bitacora.push(id_incremental, valor_funcion_f_sucesor, costo_acumulado_sucesor,
+                                  codigo_sucesor, mejora=costo_previo >= 0)
+                if con_detalle:
+                    lista_sucesores_anadidos.append((valor_funcion_f_sucesor, costo_acumulado_sucesor,
+                                                     heuristica_sucesor, decodificar(codigo_sucesor)))
+                descubiertos_este_paso += 1
+
+        total_descubiertos += descubiertos_este_paso
+        tablas.descubiertos = unicos
+        if unicos > tablas.umbral_densas:
+            tablas.densificar()
+            padres, acciones, costo_acumulado, visitados = (tablas.padres, tablas.acciones, tablas.costos,
+                                                            tablas.visitados)
+
+        if con_logs:
+            estado_actual = decodificar(codigo_actual)
+            yield traza.EXPANSION, traza.registro_a_estrella(
+                indice_expansion, estado_actual, costo_acumulado_actual,
+                funcion_heuristica(estado_actual), vista_accion.get(estado_actual),
+                lista_sucesores, lista_sucesores_anadidos, frontera_para_log(),
+                descubiertos_este_paso, 1, total_descubiertos, total_expandidos, False, len(frontera),
+            )
+
+        indice_expansion += 1
+
+    yield traza.RESULTADO, (None, vista_padre, vista_accion)
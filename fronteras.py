@@ -0,0 +1,289 @@
+# fronteras.py
+# --------------------------------------------------------
+# Implementaciones de la frontera (cola de prioridad) de las búsquedas.
+#
+# Todas guardan elementos (prioridad, id_incremental, estado) y se
+# extraen en orden (prioridad, id_incremental), así que cualquier
+# implementación expande en el mismo orden que heapq.
+#
+#   heap      : heapq con borrado perezoso. Cada mejora de g agrega un
+#               elemento nuevo y los viejos quedan en la cola hasta que
+#               la búsqueda los descarta al extraerlos (visitados).
+#   indexada  : heap binario indexado con mapa estado -> posición.
+#               Una mejora de g actualiza la prioridad en su lugar
+#               (decrease-key), así que la cola nunca tiene más
+#               elementos que estados abiertos.
+#   cubetas   : cola de Dial para prioridades enteras pequeñas. Una
+#               cubeta FIFO por prioridad y un cursor en la menor no
+#               vacía: push O(1) y pop O(1) amortizado. Los id crecen
+#               con cada push, así que FIFO dentro de la cubeta es el
+#               mismo desempate por id_incremental que heapq. Borrado
+#               perezoso, igual que 'heap'.
+#   automatica: 'cubetas' si los costos de las acciones y la prioridad
+#               inicial son enteros; si no, 'heap'.
+#
+# Interfaz común:
+#   push(prioridad, id, estado) -> id del elemento reemplazado o None
+#   pop() -> (prioridad, id, estado)
+#   primero() -> (prioridad, id, estado) sin extraerlo
+#   len(frontera), bool(frontera), iter(frontera) (sin orden)
+# --------------------------------------------------------
+
+from collections import deque
+from heapq import heapify, heappush, heappop
+
+HEAP = "heap"
+INDEXADA = "indexada"
+CUBETAS = "cubetas"
+AUTOMATICA = "automatica"
+TIPOS = (AUTOMATICA, HEAP, INDEXADA, CUBETAS)
+
+# Mayor prioridad con cubeta propia; por encima se pasa a heapq
+LIMITE_CUBETAS = 1 << 16
+
+
+class ColaHeap:
+    """
+    Frontera sobre heapq con borrado perezoso (comportamiento histórico).
+    """
+
+    __slots__ = ("elementos",)
+
+    def __init__(self):
+        self.elementos = []
+
+    def push(self, prioridad, identificador, estado):
+        heappush(self.elementos, (prioridad, identificador, estado))
+        return None
+
+    def pop(self):
+        return heappop(self.elementos)
+
+    def primero(self):
+        return self.elementos[0]
+
+    def __len__(self):
+        return len(self.elementos)
+
+    def __bool__(self):
+        return bool(self.elementos)
+
+    def __iter__(self):
+        return iter(self.elementos)
+
+
+class ColaIndexada:
+    """
+    Heap binario indexado: a lo sumo un elemento por estado, con
+    decrease-key en su lugar a través del mapa estado -> posición.
+    """
+
+    __slots__ = ("elementos", "posiciones")
+
+    def __init__(self):
+        self.elementos = []
+        self.posiciones = {}
+
+    def push(self, prioridad, identificador, estado):
+        """
+        Inserta 'estado' o, si ya está en la cola, reemplaza su elemento por
+        (prioridad, identificador) y lo reubica. Devuelve el id reemplazado.
+        """
+        nuevo = (prioridad, identificador, estado)
+        posicion = self.posiciones.get(estado)
+        if posicion is None:
+            self.elementos.append(nuevo)
+            self._subir(len(self.elementos) - 1)
+            return None
+        anterior = self.elementos[posicion]
+        self.elementos[posicion] = nuevo
+        if nuevo < anterior:
+            self._subir(posicion)
+        else:
+            self._bajar(posicion)
+        return anterior[1]
+
+    def pop(self):
+        elementos = self.elementos
+        ultimo = elementos.pop()
+        if not elementos:
+            del self.posiciones[ultimo[2]]
+            return ultimo
+        minimo = elementos[0]
+        del self.posiciones[minimo[2]]
+        elementos[0] = ultimo
+        self._bajar(0)
+        return minimo
+
+    def primero(self):
+        return self.elementos[0]
+
+    def __contains__(self, estado):
+        return estado in self.posiciones
+
+    def __len__(self):
+        return len(self.elementos)
+
+    def __bool__(self):
+        return bool(self.elementos)
+
+    def __iter__(self):
+        return iter(self.elementos)
+
+    # Reubicación dentro del heap (actualizan el mapa de posiciones)
+
+    def _subir(self, posicion):
+        elementos = self.elementos
+        posiciones = self.posiciones
+        elemento = elementos[posicion]
+        while posicion > 0:
+            padre = (posicion - 1) >> 1
+            elemento_padre = elementos[padre]
+            if elemento < elemento_padre:
+                elementos[posicion] = elemento_padre
+                posiciones[elemento_padre[2]] = posicion
+                posicion = padre
+            else:
+                break
+        elementos[posicion] = elemento
+        posiciones[elemento[2]] = posicion
+
+    def _bajar(self, posicion):
+        elementos = self.elementos
+        posiciones = self.posiciones
+        total = len(elementos)
+        elemento = elementos[posicion]
+        while True:
+            hijo = 2 * posicion + 1
+            if hijo >= total:
+                break
+            derecho = hijo + 1
+            if derecho < total and elementos[derecho] < elementos[hijo]:
+                hijo = derecho
+            if elementos[hijo] < elemento:
+                elementos[posicion] = elementos[hijo]
+                posiciones[elementos[posicion][2]] = posicion
+                posicion = hijo
+            else:
+                break
+        elementos[posicion] = elemento
+        posiciones[elemento[2]] = posicion
+
+
+class ColaCubetas:
+    """
+    Cola de cubetas (Dial) para prioridades enteras en [0, LIMITE_CUBETAS].
+    - Las prioridades infinitas (estados sin salida según la heurística) van
+      a una cubeta aparte que se vacía al final.
+    - Ante una prioridad que no entra en una cubeta (no entera, negativa o muy
+      grande) todos los elementos pasan a un heap interno y la cola sigue
+      como ColaHeap, sin cambiar el orden de extracción.
+    """
+
+    __slots__ = ("cubetas", "infinitas", "cursor", "cantidad", "respaldo")
+
+    def __init__(self):
+        self.cubetas = []
+        self.infinitas = deque()
+        self.cursor = 0
+        self.cantidad = 0
+        self.respaldo = None
+
+    def push(self, prioridad, identificador, estado):
+        elemento = (prioridad, identificador, estado)
+        if self.respaldo is not None:
+            heappush(self.respaldo, elemento)
+            return None
+        if type(prioridad) is int and 0 <= prioridad <= LIMITE_CUBETAS:
+            cubetas = self.cubetas
+            if prioridad >= len(cubetas):
+                cubetas.extend(deque() for _ in range(prioridad + 1 - len(cubetas)))
+            cubetas[prioridad].append(elemento)
+            if prioridad < self.cursor:
+                self.cursor = prioridad
+            self.cantidad += 1
+        elif prioridad == float("inf"):
+            self.infinitas.append(elemento)
+        else:
+            self._pasar_a_heap()
+            heappush(self.respaldo, elemento)
+        return None
+
+    def pop(self):
+        if self.respaldo is not None:
+            return heappop(self.respaldo)
+        if self.cantidad:
+            cubetas = self.cubetas
+            cursor = self.cursor
+            while not cubetas[cursor]:
+                cursor += 1
+            self.cursor = cursor
+            self.cantidad -= 1
+            return cubetas[cursor].popleft()
+        if self.infinitas:
+            return self.infinitas.popleft()
+        raise IndexError("pop de una frontera vacía")
+
+    def primero(self):
+        if self.respaldo is not None:
+            return self.respaldo[0]
+        if self.cantidad:
+            cubetas = self.cubetas
+            cursor = self.cursor
+            while not cubetas[cursor]:
+                cursor += 1
+            self.cursor = cursor
+            return cubetas[cursor][0]
+        if self.infinitas:
+            return self.infinitas[0]
+        raise IndexError("primero de una frontera vacía")
+
+    def _pasar_a_heap(self):
+        self.respaldo = list(self)
+        heapify(self.respaldo)
+        self.cubetas = []
+        self.infinitas = deque()
+        self.cursor = 0
+        self.cantidad = 0
+
+    def __len__(self):
+        if self.respaldo is not None:
+            return len(self.respaldo)
+        return self.cantidad + len(self.infinitas)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        if self.respaldo is not None:
+            yield from self.respaldo
+            return
+        for cubeta in self.cubetas[self.cursor:]:
+            yield from cubeta
+        yield from self.infinitas
+
+
+_CLASES = {HEAP: ColaHeap, INDEXADA: ColaIndexada, CUBETAS: ColaCubetas}
+
+
+def elegir_tipo(costos, prioridad_inicial):
+    """
+    Tipo para AUTOMATICA: CUBETAS si los costos y la prioridad inicial son
+    enteros (las prioridades siguientes también lo serán con una heurística
+    entera); HEAP en otro caso.
+    """
+    if all(type(c) is int and c >= 0 for c in costos) and type(prioridad_inicial) is int:
+        return CUBETAS
+    return HEAP
+
+
+def crear_frontera(tipo=HEAP, costos=(), prioridad_inicial=0):
+    """
+    Devuelve una frontera vacía del tipo pedido (ver TIPOS). Con AUTOMATICA
+    el tipo se elige con elegir_tipo(costos, prioridad_inicial).
+    """
+    if tipo == AUTOMATICA:
+        tipo = elegir_tipo(costos, prioridad_inicial)
+    if tipo not in _CLASES:
+        raise ValueError(f"Tipo de frontera desconocido: {tipo} (use uno de {', '.join(TIPOS)})")
+    return _CLASES[tipo]()
@@ -0,0 +1,241 @@
+# grafo_csr.py
+# --------------------------------------------------------
+# Grafo de estados precompilado en formato CSR (compressed sparse row)
+# para reutilizarlo entre muchas búsquedas con las mismas capacidades.
+#
+# El grafo sólo depende de las capacidades y los costos de acción, así
+# que se enumera una vez (BFS desde los estados raíz) y se guarda en
+# arreglos contiguos:
+#   niveles          : litros de cada nodo, jarra por jarra (n * nodos)
+#   desplazamientos  : inicio de las aristas de cada nodo (nodos + 1)
+#   destinos         : nodo sucesor de cada arista
+#   acciones         : índice de acción de cada arista
+#   costos           : costo de cada arista
+#
+# Las aristas de cada nodo conservan el orden determinista de acciones,
+# por lo que una búsqueda sobre el grafo expande exactamente en el mismo
+# orden que sobre el problema.
+#
+# Formato en disco: una línea de cabecera JSON seguida de los arreglos
+# en binario (array.tofile), en el orden de la lista anterior.
+# --------------------------------------------------------
+
+import json
+from array import array
+from collections import deque
+
+MAGIA = "grafo_csr_jarras"
+VERSION = 1
+
+# Grafos ya construidos en este proceso: (capacidades, costos, raíces) -> GrafoCSR
+_GRAFOS_EN_MEMORIA = {}
+
+
+def _tipo_para(maximo):
+    return "i" if maximo < 2**31 else "q"
+
+
+# 1) Estructura del grafo
+
+class GrafoCSR:
+    """
+    Grafo de estados alcanzables en arreglos contiguos (CSR).
+    """
+
+    def __init__(self, capacidades, costos_acciones, niveles, desplazamientos, destinos, acciones, costos):
+        self.capacidades = tuple(capacidades)
+        self.costos_acciones = list(costos_acciones)
+        self.niveles = niveles
+        self.desplazamientos = desplazamientos
+        self.destinos = destinos
+        self.acciones = acciones
+        self.costos = costos
+        self.numero_jarras = len(self.capacidades)
+        self.numero_nodos = len(desplazamientos) - 1
+        self.numero_aristas = len(destinos)
+        self._estados = None
+        self._indice = None
+
+    def estados(self):
+        """
+        Lista de estados (tuplas) por nodo; se materializa una sola vez.
+        """
+        if self._estados is None:
+            n = self.numero_jarras
+            niveles = self.niveles
+            self._estados = [tuple(niveles[k:k + n]) for k in range(0, len(niveles), n)]
+        return self._estados
+
+    def indice_de(self, estado):
+        """
+        Devuelve el nodo del 'estado' o None si no está en el grafo.
+        """
+        if self._indice is None:
+            self._indice = {estado: nodo for nodo, estado in enumerate(self.estados())}
+        return self._indice.get(estado)
+
+    def estado_de(self, nodo):
+        return self.estados()[nodo]
+
+    def validar_problema(self, problema):
+        """
+        Lanza ValueError si 'problema' no comparte capacidades y costos con el grafo.
+        """
+        if tuple(problema.capacidades) != self.capacidades:
+            raise ValueError(
+                f"El grafo es para capacidades {self.capacidades}, no {tuple(problema.capacidades)}"
+            )
+        if list(problema.costos_acciones) != self.costos_acciones:
+            raise ValueError("Los costos de acción del problema no coinciden con los del grafo.")
+
+    def generador_sucesores(self, problema):
+        """
+        Devuelve una función sucesores(estado) -> [(nombre_accion, sucesor, costo), ...]
+        equivalente a problema.sucesores, pero leída del grafo sin recalcular nada.
+        """
+        self.validar_problema(problema)
+        nombres = problema.nombres_acciones
+        estados = self.estados()
+        indice_de = self.indice_de
+        desplazamientos = self.desplazamientos
+        destinos = self.destinos
+        acciones = self.acciones
+        costos = self.costos
+
+        def sucesores(estado):
+            nodo = indice_de(estado)
+            if nodo is None:
+                raise ValueError(f"El estado {estado} no está en el grafo precompilado.")
+            return [
+                (nombres[acciones[k]], estados[destinos[k]], costos[k])
+                for k in range(desplazamientos[nodo], desplazamientos[nodo + 1])
+            ]
+
+        return sucesores
+
+
+# 2) Construcción
+
+def construir_grafo_csr(problema, estados_raiz=None):
+    """
+    Enumera por BFS todos los estados alcanzables desde 'estados_raiz'
+    (por defecto, el estado inicial del problema) y los guarda en CSR.
+    """
+    if estados_raiz is None:
+        estados_raiz = [problema.obtener_estado_inicial()]
+
+    indice = {}
+    orden = []
+    cola = deque()
+    for estado in estados_raiz:
+        estado = tuple(estado)
+        if estado not in indice:
+            indice[estado] = len(orden)
+            orden.append(estado)
+            cola.append(estado)
+
+    # BFS: descubrir nodos y guardar sus aristas en el orden de las acciones
+    aristas_por_nodo = []
+    while cola:
+        estado = cola.popleft()
+        aristas = []
+        for nombre_accion, sucesor, costo in problema.sucesores(estado):
+            if sucesor not in indice:
+                indice[sucesor] = len(orden)
+                orden.append(sucesor)
+                cola.append(sucesor)
+            aristas.append((indice[sucesor], problema.indice_por_nombre[nombre_accion], costo))
+        aristas_por_nodo.append(aristas)
+
+    numero_nodos = len(orden)
+    tipo_costo = "q" if all(isinstance(c, int) for c in problema.costos_acciones) else "d"
+
+    niveles = array(_tipo_para(max(problema.capacidades)))
+    for estado in orden:
+        niveles.extend(estado)
+    desplazamientos = array("q", [0])
+    destinos = array(_tipo_para(numero_nodos))
+    acciones = array("h")
+    costos = array(tipo_costo)
+    for aristas in aristas_por_nodo:
+        for destino, indice_accion, costo in aristas:
+            destinos.append(destino)
+            acciones.append(indice_accion)
+            costos.append(costo)
+        desplazamientos.append(len(destinos))
+
+    grafo = GrafoCSR(problema.capacidades, problema.costos_acciones, niveles,
+                     desplazamientos, destinos, acciones, costos)
+    grafo._estados = orden
+    grafo._indice = indice
+    return grafo
+
+
+def obtener_grafo_csr(problema, estados_raiz=None, ruta=None):
+    """
+    Devuelve el grafo del problema reutilizando, en este orden:
+    el grafo ya construido en este proceso, el guardado en 'ruta' o uno nuevo
+    (que se guarda en 'ruta' si se indicó).
+    """
+    if estados_raiz is None:
+        estados_raiz = [problema.obtener_estado_inicial()]
+    clave = (tuple(problema.capacidades), tuple(problema.costos_acciones),
+             tuple(tuple(e) for e in estados_raiz))
+    if clave in _GRAFOS_EN_MEMORIA:
+        return _GRAFOS_EN_MEMORIA[clave]
+
+    grafo = None
+    if ruta is not None:
+        try:
+            grafo = cargar_grafo_csr(ruta)
+            grafo.validar_problema(problema)
+            if any(grafo.indice_de(tuple(e)) is None for e in estados_raiz):
+                grafo = None
+        except (OSError, ValueError):
+            grafo = None
+    if grafo is None:
+        grafo = construir_grafo_csr(problema, estados_raiz)
+        if ruta is not None:
+            guardar_grafo_csr(grafo, ruta)
+
+    _GRAFOS_EN_MEMORIA[clave] = grafo
+    return grafo
+
+
+# 3) Guardar y cargar
+
+def guardar_grafo_csr(grafo, ruta):
+    """
+    Guarda el grafo en 'ruta': cabecera JSON en una línea + arreglos binarios.
+    """
+    arreglos = [grafo.niveles, grafo.desplazamientos, grafo.destinos, grafo.acciones, grafo.costos]
+    cabecera = {
+        "magia": MAGIA,
+        "version": VERSION,
+        "capacidades": list(grafo.capacidades),
+        "costos_acciones": grafo.costos_acciones,
+        "tipos": [a.typecode for a in arreglos],
+        "longitudes": [len(a) for a in arreglos],
+    }
+    with open(ruta, "wb") as archivo:
+        archivo.write(json.dumps(cabecera).encode("utf-8") + b"\n")
+        for arreglo in arreglos:
+            arreglo.tofile(archivo)
+
+
+def cargar_grafo_csr(ruta):
+    """
+    Carga un grafo guardado con guardar_grafo_csr.
+    """
+    with open(ruta, "rb") as archivo:
+        cabecera = json.loads(archivo.readline().decode("utf-8"))
+        if cabecera.get("magia") != MAGIA or cabecera.get("version") != VERSION:
+            raise ValueError(f"{ruta} no es un grafo CSR compatible.")
+        arreglos = []
+        for tipo, longitud in zip(cabecera["tipos"], cabecera["longitudes"]):
+            arreglo = array(tipo)
+            arreglo.fromfile(archivo, longitud)
+            arreglos.append(arreglo)
+    niveles, desplazamientos, destinos, acciones, costos = arreglos
+    return GrafoCSR(cabecera["capacidades"], cabecera["costos_acciones"], niveles,
+                    desplazamientos, destinos, acciones, costos)
@@ -0,0 +1,295 @@
+# heuristicas.py
+# --------------------------------------------------------
+# Heurísticas por bases de datos de patrones (PDB) y verificador de
+# admisibilidad / consistencia para ProblemaJarras.
+#
+# PDB: se proyecta el estado sobre un subconjunto de jarras (patrón)
+# y se calcula, con Dijkstra hacia atrás desde los objetivos
+# abstractos, el costo exacto en el espacio abstracto. Las jarras
+# fuera del patrón se olvidan, así que una transferencia con una de
+# ellas puede mover cualquier cantidad entre 1 y su capacidad:
+#   - llenar / vaciar una jarra del patrón: igual que en el problema
+#   - transferir entre jarras del patrón:   igual que en el problema
+#   - transferir desde/hacia una jarra externa: la jarra del patrón
+#     pierde/gana t litros, t = 1..min(litros o espacio, capacidad externa)
+#   - acciones sólo sobre jarras externas: no cambian el patrón
+# Toda transición del problema tiene su imagen en la abstracción con
+# el mismo costo, por lo que cada PDB es admisible y consistente, y
+# el máximo de varias PDB también lo es.
+#
+# Verificador: calcula el costo exacto al objetivo (h*) de todos los
+# estados alcanzables (Dijkstra hacia atrás sobre el grafo alcanzable)
+# y revisa h(s) <= h*(s) y h(s) <= c(s, s') + h(s') en cada arista.
+# --------------------------------------------------------
+
+from collections import deque
+from heapq import heappush, heappop
+from itertools import combinations, product
+
+import motor_jarras
+
+# Límite de estados abstractos por patrón
+LIMITE_ESTADOS_PATRON = 10**6
+
+
+# 1) Bases de datos de patrones
+
+class BaseDePatrones:
+    """
+    Costo abstracto al objetivo para cada proyección del estado sobre 'patron'.
+    Se usa como heurística: h(estado) = tabla[proyección]. Si la proyección
+    no puede llegar al objetivo abstracto, devuelve infinito.
+    """
+
+    # Admisible por construcción (ver el encabezado)
+    admisible = True
+
+    def __init__(self, patron, tabla):
+        self.patron = tuple(patron)
+        self.tabla = tabla
+
+    def __call__(self, estado):
+        return self.tabla.get(tuple(estado[j] for j in self.patron), float("inf"))
+
+    def __len__(self):
+        return len(self.tabla)
+
+    def __repr__(self):
+        return f"BaseDePatrones(patron={self.patron}, estados={len(self.tabla)})"
+
+
+def _sucesores_abstractos(problema, patron, abstracto):
+    """
+    Lista de (sucesor_abstracto, costo) del estado 'abstracto' (litros de las
+    jarras de 'patron', en ese orden). Ver las reglas en la cabecera del módulo.
+    """
+    capacidades = problema.capacidades
+    costos = problema.costos
+    externas = [k for k in range(problema.numero_jarras) if k not in patron]
+    capacidad_externa = max((capacidades[k] for k in externas), default=0)
+    costo_transferir = costos[motor_jarras.TRANSFERIR]
+    resultado = []
+
+    for a, j in enumerate(patron):
+        litros = abstracto[a]
+        if litros < capacidades[j]:
+            resultado.append((abstracto[:a] + (capacidades[j],) + abstracto[a + 1:], costos[motor_jarras.LLENAR]))
+        if litros > 0:
+            resultado.append((abstracto[:a] + (0,) + abstracto[a + 1:], costos[motor_jarras.VACIAR]))
+        # Con una jarra externa: perder o ganar t litros
+        for t in range(1, min(litros, capacidad_externa) + 1):
+            resultado.append((abstracto[:a] + (litros - t,) + abstracto[a + 1:], costo_transferir))
+        for t in range(1, min(capacidades[j] - litros, capacidad_externa) + 1):
+            resultado.append((abstracto[:a] + (litros + t,) + abstracto[a + 1:], costo_transferir))
+    for a, i in enumerate(patron):
+        for b, j in enumerate(patron):
+            if a == b or abstracto[a] == 0 or abstracto[b] == capacidades[j]:
+                continue
+            t = min(abstracto[a], capacidades[j] - abstracto[b])
+            nuevo = list(abstracto)
+            nuevo[a] -= t
+            nuevo[b] += t
+            resultado.append((tuple(nuevo), costo_transferir))
+    return resultado
+
+
+def construir_base_de_patrones(problema, patron):
+    """
+    Construye la PDB de 'problema' para 'patron' (índices de jarras) con un
+    Dijkstra hacia atrás desde los estados abstractos que cumplen el objetivo.
+    """
+    patron = tuple(sorted(set(patron)))
+    if not patron or not all(0 <= j < problema.numero_jarras for j in patron):
+        raise ValueError(f"Patrón inválido: {patron}")
+    rangos = [range(problema.capacidades[j] + 1) for j in patron]
+    total = 1
+    for rango in rangos:
+        total *= len(rango)
+    if total > LIMITE_ESTADOS_PATRON:
+        raise ValueError(f"El patrón {patron} tiene demasiados estados abstractos ({total}).")
+
+    # Grafo abstracto invertido: sucesor -> [(predecesor, costo), ...]
+    inverso = {}
+    abstractos = list(product(*rangos))
+    for abstracto in abstractos:
+        for sucesor, costo in _sucesores_abstractos(problema, patron, abstracto):
+            inverso.setdefault(sucesor, []).append((abstracto, costo))
+
+    objetivo = problema.objetivo
+    tabla = {}
+    frontera = []
+    for abstracto in abstractos:
+        if all(abstracto[a] == objetivo[j] for a, j in enumerate(patron) if j in objetivo):
+            tabla[abstracto] = 0
+            frontera.append((0, abstracto))
+
+    while frontera:
+        costo_actual, abstracto = heappop(frontera)
+        if costo_actual > tabla[abstracto]:
+            continue
+        for previo, costo in inverso.get(abstracto, ()):
+            nuevo = costo_actual + costo
+            if nuevo < tabla.get(previo, float("inf")):
+                tabla[previo] = nuevo
+                heappush(frontera, (nuevo, previo))
+    return BaseDePatrones(patron, tabla)
+
+
+def heuristica_maxima(heuristicas):
+    """
+    Combina heurísticas tomando el máximo (admisible si cada una lo es).
+    El resultado tiene admisible=True si todas lo declaran.
+    """
+    heuristicas = list(heuristicas)
+
+    def h(estado):
+        return max(heuristica(estado) for heuristica in heuristicas)
+
+    h.heuristicas = heuristicas
+    h.admisible = all(getattr(heuristica, "admisible", False) for heuristica in heuristicas)
+    return h
+
+
+def patrones_por_defecto(problema, tamano=2):
+    """
+    Patrones de 'tamano' jarras que incluyen al menos una jarra del objetivo
+    (todas las combinaciones), o el patrón con todas las jarras si son menos.
+    """
+    jarras = range(problema.numero_jarras)
+    if problema.numero_jarras <= tamano:
+        return [tuple(jarras)]
+    objetivo = set(problema.objetivo)
+    return [p for p in combinations(jarras, tamano) if objetivo & set(p)] or [tuple(jarras)[:tamano]]
+
+
+def heuristica_pdb(problema, patrones=None):
+    """
+    Heurística admisible y consistente: máximo de las PDB de 'patrones'
+    (por defecto, patrones_por_defecto(problema)).
+    """
+    if patrones is None:
+        patrones = patrones_por_defecto(problema)
+    patrones = [tuple(sorted(set(p))) for p in patrones]
+    h = heuristica_maxima(construir_base_de_patrones(problema, p) for p in patrones)
+    # Nombre estable (lo usa la clave del caché de soluciones)
+    h.__qualname__ = f"heuristica_pdb{tuple(patrones)}"
+    return h
+
+
+# 2) Verificador de admisibilidad y consistencia
+
+class InformeHeuristica:
+    """
+    Resultado de verificar_heuristica.
+    - estados / aristas: tamaño del espacio alcanzable revisado
+    - violaciones_admisibilidad: cantidad de estados con h(s) > h*(s)
+    - violaciones_consistencia: cantidad de aristas con h(s) > c + h(s')
+    - ejemplos_admisibilidad: [(estado, h, h_estrella), ...] (los primeros)
+    - ejemplos_consistencia: [(estado, accion, sucesor, h, costo, h_sucesor), ...]
+    - max_sobreestimacion: máximo de h(s) - h*(s)
+    - costo_exacto: diccionario estado -> h*(s) (sólo estados que llegan al objetivo)
+    """
+
+    def __init__(self, estados, aristas, costo_exacto):
+        self.estados = estados
+        self.aristas = aristas
+        self.costo_exacto = costo_exacto
+        self.violaciones_admisibilidad = 0
+        self.violaciones_consistencia = 0
+        self.ejemplos_admisibilidad = []
+        self.ejemplos_consistencia = []
+        self.max_sobreestimacion = 0
+
+    @property
+    def admisible(self):
+        return self.violaciones_admisibilidad == 0
+
+    @property
+    def consistente(self):
+        return self.violaciones_consistencia == 0
+
+    def resumen(self):
+        return (
+            f"Estados: {self.estados} | Aristas: {self.aristas} | "
+            f"Admisible: {'sí' if self.admisible else 'no'} ({self.violaciones_admisibilidad} violaciones, "
+            f"sobreestimación máxima {self.max_sobreestimacion}) | "
+            f"Consistente: {'sí' if self.consistente else 'no'} ({self.violaciones_consistencia} violaciones)"
+        )
+
+
+def costo_exacto_al_objetivo(problema, estado_inicial=None):
+    """
+    Devuelve (costo_exacto, alcanzables, aristas): h*(s) para cada estado
+    alcanzable desde el inicial que llega al objetivo, el conjunto de estados
+    alcanzables y la lista de aristas (estado, accion, sucesor, costo).
+    """
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    estado_inicial = tuple(estado_inicial)
+
+    # Espacio alcanzable (BFS) y grafo invertido
+    vistos = {estado_inicial}
+    cola = deque([estado_inicial])
+    aristas = []
+    inverso = {}
+    while cola:
+        estado = cola.popleft()
+        for nombre_accion, sucesor, costo in problema.sucesores(estado):
+            aristas.append((estado, nombre_accion, sucesor, costo))
+            inverso.setdefault(sucesor, []).append((estado, costo))
+            if sucesor not in vistos:
+                vistos.add(sucesor)
+                cola.append(sucesor)
+
+    # Dijkstra hacia atrás desde los objetivos alcanzables
+    costo_exacto = {}
+    frontera = []
+    for estado in vistos:
+        if problema.es_estado_final(estado):
+            costo_exacto[estado] = 0
+            frontera.append((0, estado))
+    frontera.sort()
+    while frontera:
+        costo_actual, estado = heappop(frontera)
+        if costo_actual > costo_exacto[estado]:
+            continue
+        for previo, costo in inverso.get(estado, ()):
+            nuevo = costo_actual + costo
+            if nuevo < costo_exacto.get(previo, float("inf")):
+                costo_exacto[previo] = nuevo
+                heappush(frontera, (nuevo, previo))
+    return costo_exacto, vistos, aristas
+
+
+def verificar_heuristica(problema, heuristica=None, estado_inicial=None, maximo_ejemplos=10):
+    """
+    Verifica 'heuristica' (por defecto problema.funcion_heuristica) sobre todo el
+    espacio alcanzable desde el inicial y devuelve un InformeHeuristica.
+    Los estados que no llegan al objetivo (h* infinito) no violan la admisibilidad.
+    """
+    if heuristica is None:
+        heuristica = problema.funcion_heuristica
+    costo_exacto, estados, aristas = costo_exacto_al_objetivo(problema, estado_inicial)
+
+    informe = InformeHeuristica(len(estados), len(aristas), costo_exacto)
+    valores = {estado: heuristica(estado) for estado in estados}
+
+    for estado in sorted(estados):
+        h_estrella = costo_exacto.get(estado)
+        if h_estrella is None:
+            continue
+        exceso = valores[estado] - h_estrella
+        if exceso > 0:
+            informe.violaciones_admisibilidad += 1
+            informe.max_sobreestimacion = max(informe.max_sobreestimacion, exceso)
+            if len(informe.ejemplos_admisibilidad) < maximo_ejemplos:
+                informe.ejemplos_admisibilidad.append((estado, valores[estado], h_estrella))
+
+    for estado, nombre_accion, sucesor, costo in aristas:
+        if valores[estado] > costo + valores[sucesor]:
+            informe.violaciones_consistencia += 1
+            if len(informe.ejemplos_consistencia) < maximo_ejemplos:
+                informe.ejemplos_consistencia.append(
+                    (estado, nombre_accion, sucesor, valores[estado], costo, valores[sucesor])
+                )
+    return informe
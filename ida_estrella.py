@@ -0,0 +1,189 @@
+# ida_estrella.py
+# --------------------------------------------------------
+# IDA* (A* con profundización iterativa) sobre ProblemaJarras.
+#
+# Cada iteración es una búsqueda en profundidad que poda los nodos
+# con f = g + h > umbral. El umbral de la iteración siguiente es el
+# menor f podado; si no se podó nada, no hay solución.
+#
+# Memoria: sólo el camino actual (estados, acciones, g e iteradores de
+# sucesores) más el conjunto de estados del camino para descartar
+# ciclos, es decir, lineal en la profundidad de la solución. Opcional:
+# tabla de transposiciones acotada (estado -> menor g visto en la
+# iteración) para no repetir subárboles alcanzados por caminos más
+# caros; al llenarse deja de aceptar estados nuevos.
+#
+# Sucesores, costos y heurística son los del problema
+# (problema.sucesores equivale a obtener_acciones_posibles +
+# aplicar_accion + obtener_costo_de_accion, en el mismo orden).
+# Con una heurística admisible el camino encontrado es óptimo.
+#
+# Sin solución, IDA* sólo termina si ninguna iteración poda nodos; con
+# h finita el umbral crece sin fin (los caminos pueden alargarse). Por
+# eso antes de iterar se consulta el oráculo del mcd
+# (solucion_analitica.motivo_inalcanzable); los objetivos inalcanzables
+# que no descarta se cortan por límite: a lo sumo 'max_iteraciones'
+# iteraciones y no se empieza otra si ya se expandieron
+# 'max_expandidos' nodos en total (cada iteración suele expandir el
+# doble que la anterior, así que el total queda cerca de ese valor).
+# Al cortar, el último registro tiene limite_alcanzado=True: es "sin
+# solución dentro del límite", no una prueba de que no la hay.
+# --------------------------------------------------------
+
+import solucion_analitica
+import traza
+
+MAX_ITERACIONES_POR_DEFECTO = 100
+MAX_EXPANDIDOS_POR_DEFECTO = 5 * 10**5
+
+
+# 1) Una iteración (búsqueda en profundidad acotada por el umbral)
+
+def _iteracion(problema, estado_inicial, umbral, capacidad_transposiciones):
+    """
+    Recorre en profundidad los nodos con f <= umbral. Devuelve
+    (camino, siguiente_umbral, expandidos, generados, profundidad_maxima, transposiciones)
+    donde 'camino' es [(estado, accion_entrada), ...] o None si no se encontró.
+    """
+    funcion_heuristica = problema.funcion_heuristica
+    es_estado_final = problema.es_estado_final
+    sucesores = problema.sucesores
+
+    siguiente_umbral = float("inf")
+    expandidos = 0
+    generados = 0
+    transposiciones = {}
+    if capacidad_transposiciones:
+        transposiciones[estado_inicial] = 0
+
+    camino = [(estado_inicial, None)]
+    costos = [0]
+    en_camino = {estado_inicial}
+    profundidad_maxima = 0
+    if es_estado_final(estado_inicial):
+        return camino, siguiente_umbral, expandidos, generados, profundidad_maxima, len(transposiciones)
+
+    pila = [iter(sucesores(estado_inicial))]
+    expandidos += 1
+    while pila:
+        siguiente = next(pila[-1], None)
+        if siguiente is None:
+            # Sucesores agotados: retroceder
+            pila.pop()
+            estado, _accion = camino.pop()
+            costos.pop()
+            en_camino.discard(estado)
+            continue
+
+        accion, sucesor, costo_de_accion = siguiente
+        generados += 1
+        if sucesor in en_camino:
+            continue
+        g_sucesor = costos[-1] + costo_de_accion
+        f_sucesor = g_sucesor + funcion_heuristica(sucesor)
+        if f_sucesor > umbral:
+            if f_sucesor < siguiente_umbral:
+                siguiente_umbral = f_sucesor
+            continue
+        if capacidad_transposiciones:
+            g_previo = transposiciones.get(sucesor)
+            if g_previo is not None and g_previo <= g_sucesor:
+                continue
+            if g_previo is not None or len(transposiciones) < capacidad_transposiciones:
+                transposiciones[sucesor] = g_sucesor
+
+        camino.append((sucesor, accion))
+        costos.append(g_sucesor)
+        en_camino.add(sucesor)
+        if len(camino) - 1 > profundidad_maxima:
+            profundidad_maxima = len(camino) - 1
+        if es_estado_final(sucesor):
+            return camino, siguiente_umbral, expandidos, generados, profundidad_maxima, len(transposiciones)
+        pila.append(iter(sucesores(sucesor)))
+        expandidos += 1
+
+    return None, siguiente_umbral, expandidos, generados, profundidad_maxima, len(transposiciones)
+
+
+# 2) IDA*
+
+def iterar_ida_estrella(problema, estado_inicial=None, capacidad_transposiciones=0,
+                        max_iteraciones=MAX_ITERACIONES_POR_DEFECTO, max_expandidos=MAX_EXPANDIDOS_POR_DEFECTO):
+    """
+    IDA* sobre 'problema' como generador:
+    - Produce (traza.ITERACION, registro) al terminar cada iteración, con
+      umbral, siguiente_umbral, expandidos, generados, profundidad_maxima,
+      transposiciones, encontrado, limite_alcanzado y los totales acumulados.
+    - Al final produce (traza.RESULTADO, (estado_objetivo, diccionario_padre,
+      diccionario_accion)); padre y acción sólo contienen el camino solución.
+    - 'capacidad_transposiciones' (0 = sin tabla) acota la tabla de transposiciones.
+    - 'max_iteraciones' y 'max_expandidos' (None = sin límite) cortan la búsqueda
+      con resultado sin solución; el último registro lo indica con
+      limite_alcanzado=True (sin solución dentro del límite).
+    - Si el oráculo del mcd descarta el objetivo no se itera: sólo se produce
+      el resultado sin solución.
+    """
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    estado_inicial = tuple(estado_inicial)
+
+    if solucion_analitica.motivo_inalcanzable(problema, estado_inicial) is not None:
+        umbral = float("inf")
+    else:
+        umbral = problema.funcion_heuristica(estado_inicial)
+    total_expandidos = 0
+    total_generados = 0
+    numero_iteracion = 0
+    camino = None
+    while umbral != float("inf"):
+        camino, siguiente_umbral, expandidos, generados, profundidad_maxima, transposiciones = _iteracion(
+            problema, estado_inicial, umbral, capacidad_transposiciones
+        )
+        total_expandidos += expandidos
+        total_generados += generados
+        limite_alcanzado = camino is None and siguiente_umbral != float("inf") and (
+            (max_iteraciones is not None and numero_iteracion + 1 >= max_iteraciones)
+            or (max_expandidos is not None and total_expandidos >= max_expandidos)
+        )
+        yield traza.ITERACION, {
+            "iteracion": numero_iteracion,
+            "umbral": umbral,
+            "siguiente_umbral": siguiente_umbral,
+            "expandidos": expandidos,
+            "generados": generados,
+            "profundidad_maxima": profundidad_maxima,
+            "transposiciones": transposiciones,
+            "encontrado": camino is not None,
+            "limite_alcanzado": limite_alcanzado,
+            "totales": {"expandidos": total_expandidos, "generados": total_generados},
+        }
+        numero_iteracion += 1
+        if camino is not None or limite_alcanzado:
+            break
+        umbral = siguiente_umbral
+
+    diccionario_padre = {}
+    diccionario_accion = {}
+    anterior = None
+    for estado, accion in camino or ():
+        diccionario_padre[estado] = anterior
+        diccionario_accion[estado] = accion
+        anterior = estado
+    yield traza.RESULTADO, (anterior, diccionario_padre, diccionario_accion)
+
+
+def busqueda_ida_estrella(problema, estado_inicial=None, **opciones):
+    """
+    IDA* sobre 'problema'; devuelve
+    (estado_objetivo, diccionario_padre, diccionario_accion, iteraciones)
+    donde 'iteraciones' es la lista de registros de cada iteración.
+    Acepta las opciones de iterar_ida_estrella.
+    """
+    iteraciones = []
+    resultado = (None, {}, {})
+    for tipo, datos in iterar_ida_estrella(problema, estado_inicial, **opciones):
+        if tipo == traza.ITERACION:
+            iteraciones.append(datos)
+        else:
+            resultado = datos
+    return resultado + (iteraciones,)
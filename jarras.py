@@ -16,13 +16,14 @@
 #   T45 = Transferir de 4 L a 5 L
 # --------------------------------------------------------
 
-from heapq import heappush, heappop
+import motor_jarras
 
 # Capacidades de las jarras
 CAPACIDAD_JARRA5 = 5
 CAPACIDAD_JARRA4 = 4
 
 # Orden determinista deseado de acciones para lograr consistencia en la búsqueda
+# (coincide con el orden de motor_jarras.generar_acciones para 2 jarras)
 ORDEN_ACCIONES = ["L5", "L4", "V5", "V4", "T54", "T45"]
 
 # 1) Estado inicial y final
@@ -31,15 +32,14 @@ def obtener_estado_inicial():
     """
     Devuelve el estado inicial (las dos jarras están vacías)
     """
-    return (0,0)
+    return PROBLEMA.obtener_estado_inicial()
 
 def es_estado_final(estado):
     """
     Retorna true si el estado corresponde al estado final.
     El final es que la jarra de 5 litros contenga exactamente 2 litros.
     """
-    litros_jarra5, litros_jarra4 = estado
-    return litros_jarra5 == 2
+    return PROBLEMA.es_estado_final(estado)
 
 
 # 2) Heurística
@@ -51,6 +51,16 @@ def funcion_heuristica(estado):
     litros_jarra5, litros_jarra4 = estado
     return abs(litros_jarra5 - 2)
 
+# Especificación del problema sobre el motor genérico:
+# jarra 0 = jarra de 5 L, jarra 1 = jarra de 4 L; objetivo: 2 L en la jarra de 5 L
+PROBLEMA = motor_jarras.ProblemaJarras(
+    capacidades=(CAPACIDAD_JARRA5, CAPACIDAD_JARRA4),
+    estado_inicial=(0, 0),
+    objetivo={0: 2},
+    nombres_acciones=ORDEN_ACCIONES,
+    heuristica=funcion_heuristica,
+)
+
 # 3) Acciones y precondiciones
 
 def obtener_acciones_posibles(estado):
@@ -58,23 +68,7 @@ def obtener_acciones_posibles(estado):
     Retorna el conjunto de acciones posibles para aplicar en el 'estado'
     Se verifican las precondiciones básicas para cada posible acción
     """
-    litros_jarra5, litros_jarra4 = estado
-    conjunto_acciones = set()
-
-    if litros_jarra5 < CAPACIDAD_JARRA5:
-        conjunto_acciones.add("L5")
-    if litros_jarra4 < CAPACIDAD_JARRA4:
-        conjunto_acciones.add("L4")
-    if litros_jarra5 > 0:
-        conjunto_acciones.add("V5")
-    if litros_jarra4 > 0:
-        conjunto_acciones.add("V4")
-    if litros_jarra5 > 0 and litros_jarra4 < CAPACIDAD_JARRA4:
-        conjunto_acciones.add("T54")
-    if litros_jarra4 > 0 and litros_jarra5 < CAPACIDAD_JARRA5:
-        conjunto_acciones.add("T45")
-
-    return conjunto_acciones
+    return PROBLEMA.obtener_acciones_posibles(estado)
 
 # 4) Modelo de transición
 
@@ -83,135 +77,36 @@ def aplicar_accion(estado, accion):
     Aplica la acción al estado y retorna el nuevo estado (litros_jarra5, litros_jarra4)
     Hace uso de min/max para manejar los sobrantes de las jarras
     """
+    return PROBLEMA.aplicar_accion(estado, accion)
 
-    litros_jarra5, litros_jarra4 = estado
-
-    if accion == "L5":       # Llenar jarra de 5 litros
-        return (CAPACIDAD_JARRA5, litros_jarra4)
-
-    elif accion == "L4":     # Llenar jarra de 4 litros
-        return (litros_jarra5, CAPACIDAD_JARRA4)
-
-    elif accion == "V5":     # Vaciar jarra de 5 litros
-        return (0, litros_jarra4)
-
-    elif accion == "V4":     # Vaciar jarra de 4 litros
-        return (litros_jarra5, 0)
-
-    elif accion == "T54":    # Transferir de jarra 5 L a jarra 4 L
-        espacio_disponible_en_jarra4 = CAPACIDAD_JARRA4 - litros_jarra4
-        cantidad_transferida = min(litros_jarra5, espacio_disponible_en_jarra4)
-        return (litros_jarra5 - cantidad_transferida, litros_jarra4 + cantidad_transferida)
-
-    elif accion == "T45":    # Transferir de jarra 4 L a jarra 5 L
-        espacio_disponible_en_jarra5 = CAPACIDAD_JARRA5 - litros_jarra5
-        cantidad_transferida = min(litros_jarra4, espacio_disponible_en_jarra5)
-        return (litros_jarra5 + cantidad_transferida, litros_jarra4 - cantidad_transferida)
-    
 
 # 5) Búsqueda best-first - Ayuda de ChatGPT 5-Thinking, ver prompt en prompt.txt
-def busqueda_best_first(estado_inicial = None):
+def busqueda_best_first(estado_inicial = None, **opciones):
     """
     Realiza la búsqueda Best-first:
     - La prioridad en la cola es sólo la heurística h(n)
     - Devuelve (estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado)
       donde logs_por_estado es un diccionario con información detallada de la expansión
       de cada estado extraído de la frontera.
+    La búsqueda se ejecuta sobre el motor genérico (motor_jarras); 'opciones' se
+    pasan tal cual (empaquetado, grafo, nivel_traza, k_frontera, ...).
     """
-    if estado_inicial is None:
-        estado_inicial = obtener_estado_inicial()
-    
-    # Cola de prioridad: (h, id_incremental, estado)
-    frontera = []
-    id_incremental = 0
-    heappush(frontera, (funcion_heuristica(estado_inicial), id_incremental, estado_inicial))
-
-    # Conjuntos y diccionarios de apoyo
-    visitados = set()
-    diccionario_padre = {estado_inicial: None}
-    diccionario_accion = {estado_inicial: None}
-
-    # Contadores y logs
-    total_descubiertos = 1  # incluye el estado inicial
-    total_expandidos = 0
-    indice_expansion = 0
-    logs_por_estado = {}
-
-    while frontera:
-        valor_heuristico, identificador, estado_actual = heappop(frontera)
-
-        if estado_actual in visitados:
-            continue
-
-        # Si es objetivo, registramos log (sin expandir) y devolvemos
-        if es_estado_final(estado_actual):
-            logs_por_estado[estado_actual] = {
-                "expansion_index": indice_expansion,
-                "estado": estado_actual,
-                "heuristica": funcion_heuristica(estado_actual),
-                "accion_entrada": diccionario_accion.get(estado_actual),
-                "sucesores": [],
-                "sucesores_anadidos": [],
-                "frontera_total": sorted([(h, s) for (h, _id, s) in frontera], key=lambda t: (t[0], str(t[1]))),
-                "nuevos_descubiertos": 0,
-                "expandidos_este_paso": 0,
-                "totales": {"descubiertos": total_descubiertos, "expandidos": total_expandidos},
-                "es_objetivo": True,
-            }
-            return estado_actual, diccionario_padre, diccionario_accion, logs_por_estado
-
-        # Marcar como visitado y contabilizar expansión
-        visitados.add(estado_actual)
-        total_expandidos += 1
-        
-        # Generar acciones en orden determinista
-        acciones_en_orden = [a for a in ORDEN_ACCIONES if a in obtener_acciones_posibles(estado_actual)]
-        for accion in acciones_en_orden:
-            sucesor = aplicar_accion(estado_actual, accion)
-            if sucesor not in diccionario_padre: # Si aún no ha sido descubieto
-                diccionario_padre[sucesor] = estado_actual
-                diccionario_accion[sucesor] = accion
-                id_incremental += 1
-                heappush(frontera, (funcion_heuristica(sucesor), id_incremental, sucesor))
-        
-        # Preparar log de la expansión
-        # Generar lista ordenada de acciones y sucesores con sus heurísticas
-        acciones_posibles = [a for a in ORDEN_ACCIONES if a in obtener_acciones_posibles(estado_actual)]
-        lista_sucesores = []
-        lista_sucesores_anadidos = []
-        # Para distinguir "añadidos", comparamos contra diccionario_padre previo a esta expansión.
-        # Como ya insertamos arriba, reconstruimos mirando si el padre del sucesor es el estado_actual.
-        for accion in acciones_posibles:
-            suc = aplicar_accion(estado_actual, accion)
-            h_suc = funcion_heuristica(suc)
-            lista_sucesores.append((suc, accion, h_suc))
-            if diccionario_padre.get(suc) == estado_actual:
-                lista_sucesores_anadidos.append((h_suc, suc))
+    return motor_jarras.busqueda_best_first(PROBLEMA, estado_inicial, **opciones)
 
-        # Recalcular totales de descubiertos (únicos) a partir de añadidos en esta expansión
-        total_descubiertos += len(lista_sucesores_anadidos)
-
-        # Frontera ordenada solo por (h, estado como texto para estabilidad visual)
-        frontera_total_ordenada = sorted([(h, s) for (h, _id, s) in frontera], key=lambda t: (t[0], str(t[1])))
-
-        logs_por_estado[estado_actual] = {
-            "expansion_index": indice_expansion,
-            "estado": estado_actual,
-            "heuristica": funcion_heuristica(estado_actual),
-            "accion_entrada": diccionario_accion.get(estado_actual),
-            "sucesores": lista_sucesores,
-            "sucesores_anadidos": lista_sucesores_anadidos,
-            "frontera_total": frontera_total_ordenada,
-            "nuevos_descubiertos": len(lista_sucesores_anadidos),
-            "expandidos_este_paso": 1,
-            "totales": {"descubiertos": total_descubiertos, "expandidos": total_expandidos},
-            "es_objetivo": False,
-        }
+def iterar_best_first(estado_inicial = None, **opciones):
+    """
+    Variante en generador de busqueda_best_first: produce un registro por
+    expansión (traza.EXPANSION, log) y al final
+    (traza.RESULTADO, (estado_objetivo, diccionario_padre, diccionario_accion)).
+    """
+    return motor_jarras.iterar_best_first(PROBLEMA, estado_inicial, **opciones)
 
-        indice_expansion += 1
-        
-    # En caso de que no se encuentre la solución
-    return None, diccionario_padre, diccionario_accion, logs_por_estado
+def resolver(estado_inicial = None, cache = None, **opciones):
+    """
+    Resuelve con Best-First consultando primero 'cache' (cache_soluciones.CacheSoluciones).
+    Devuelve (solucion, desde_cache); ver motor_jarras.resolver.
+    """
+    return motor_jarras.resolver(PROBLEMA, motor_jarras.BEST_FIRST, estado_inicial, cache, **opciones)
 
 # 6) Reconstrucción de la solución
 def reconstruir_camino(estado_final, diccionario_padre, diccionario_accion):
@@ -19,7 +19,13 @@
 #   TRANSFERIR_DE_JARRA3_A_JARRA1, TRANSFERIR_DE_JARRA3_A_JARRA2
 # --------------------------------------------------------
 
-from heapq import heappush, heappop
+import a_estrella_distribuida
+import ara_estrella
+import busqueda_bidireccional
+import heuristicas
+import ida_estrella
+import motor_jarras
+import tabla_costos
 
 # Capacidades de las jarras
 CAPACIDAD_JARRA1 = 3
@@ -31,6 +37,7 @@ COSTO_ACCION_VACIAR = 3
 COSTO_ACCION_TRANSFERIR = 2
 
 # Orden determinista de acciones para consistencia en la búsqueda
+# (coincide con el orden de motor_jarras.generar_acciones para 3 jarras)
 ORDEN_ACCIONES = [
      "LLENAR_JARRA1", "LLENAR_JARRA2", "LLENAR_JARRA3",
     "VACIAR_JARRA1",  "VACIAR_JARRA2",  "VACIAR_JARRA3",
@@ -48,62 +55,68 @@ def obtener_estado_inicial():
     """
     Devuelve el estado inicial: las tres jarras están vacías.
     """
-    return (0, 0, 0)
+    return PROBLEMA.obtener_estado_inicial()
 
 def es_estado_final(estado):
     """
     Retorna True si la jarra de 7 L (jarra2) contiene exactamente 6 L.
     """
-    _, litros_jarra2, _ = estado
-    return litros_jarra2 == 6
+    return PROBLEMA.es_estado_final(estado)
 
 # 2) Heurística para A*: h(n) = |litros_jarra2 - 6|
 def funcion_heuristica(estado):
     _, litros_jarra2, _ = estado
     return abs(litros_jarra2 - 6)
 
+# Especificación del problema sobre el motor genérico:
+# objetivo: 6 L en la jarra de 7 L (índice 1)
+PROBLEMA = motor_jarras.ProblemaJarras(
+    capacidades=(CAPACIDAD_JARRA1, CAPACIDAD_JARRA2, CAPACIDAD_JARRA3),
+    estado_inicial=(0, 0, 0),
+    objetivo={1: 6},
+    costos={
+        motor_jarras.LLENAR: COSTO_ACCION_LLENAR,
+        motor_jarras.VACIAR: COSTO_ACCION_VACIAR,
+        motor_jarras.TRANSFERIR: COSTO_ACCION_TRANSFERIR,
+    },
+    nombres_acciones=ORDEN_ACCIONES,
+    heuristica=funcion_heuristica,
+)
+
+# Heurísticas disponibles para las búsquedas A* de este módulo:
+#   jarra2: |litros_jarra2 - 6| (ignora los costos: no es admisible, desde
+#           (0, 0, 0) estima 6 y el óptimo cuesta 5)
+#   pdb   : máximo de bases de patrones sobre pares de jarras (admisible y
+#           consistente, ver heuristicas.py)
+HEURISTICA_JARRA2 = "jarra2"
+HEURISTICA_PDB = "pdb"
+HEURISTICAS = (HEURISTICA_JARRA2, HEURISTICA_PDB)
+_PROBLEMAS_POR_HEURISTICA = {HEURISTICA_JARRA2: PROBLEMA}
+
+def obtener_problema(heuristica=HEURISTICA_JARRA2):
+    """
+    Devuelve el problema con la heurística pedida (las PDB se construyen una vez).
+    """
+    if heuristica not in HEURISTICAS:
+        raise ValueError(f"Heurística desconocida: {heuristica} (use una de {', '.join(HEURISTICAS)})")
+    if heuristica not in _PROBLEMAS_POR_HEURISTICA:
+        _PROBLEMAS_POR_HEURISTICA[heuristica] = PROBLEMA.con_heuristica(heuristicas.heuristica_pdb(PROBLEMA))
+    return _PROBLEMAS_POR_HEURISTICA[heuristica]
+
+def verificar_heuristica(heuristica=HEURISTICA_JARRA2):
+    """
+    Verifica admisibilidad y consistencia de la heurística sobre todo el espacio
+    alcanzable; devuelve un heuristicas.InformeHeuristica.
+    """
+    return heuristicas.verificar_heuristica(obtener_problema(heuristica))
+
 # 3) Acciones y precondiciones
 
 def obtener_acciones_posibles(estado):
     """
     Retorna el conjunto de acciones posibles (nombres completos) aplicables en 'estado'.
     """
-    litros_jarra1, litros_jarra2, litros_jarra3 = estado
-    conjunto_acciones = set()
-
-    # Llenar (si no está llena)
-    if litros_jarra1 < CAPACIDAD_JARRA1:
-        conjunto_acciones.add("LLENAR_JARRA1")
-    if litros_jarra2 < CAPACIDAD_JARRA2:
-        conjunto_acciones.add("LLENAR_JARRA2")
-    if litros_jarra3 < CAPACIDAD_JARRA3:
-        conjunto_acciones.add("LLENAR_JARRA3")
-
-    # Vaciar (si tiene algo)
-    if litros_jarra1 > 0:
-        conjunto_acciones.add("VACIAR_JARRA1")
-    if litros_jarra2 > 0:
-        conjunto_acciones.add("VACIAR_JARRA2")
-    if litros_jarra3 > 0:
-        conjunto_acciones.add("VACIAR_JARRA3")
-
-    # Transferir (si origen tiene > 0 y destino no está lleno)
-    if litros_jarra1 > 0 and litros_jarra2 < CAPACIDAD_JARRA2:
-        conjunto_acciones.add("TRANSFERIR_DE_JARRA1_A_JARRA2")
-    if litros_jarra1 > 0 and litros_jarra3 < CAPACIDAD_JARRA3:
-        conjunto_acciones.add("TRANSFERIR_DE_JARRA1_A_JARRA3")
-
-    if litros_jarra2 > 0 and litros_jarra1 < CAPACIDAD_JARRA1:
-        conjunto_acciones.add("TRANSFERIR_DE_JARRA2_A_JARRA1")
-    if litros_jarra2 > 0 and litros_jarra3 < CAPACIDAD_JARRA3:
-        conjunto_acciones.add("TRANSFERIR_DE_JARRA2_A_JARRA3")
-
-    if litros_jarra3 > 0 and litros_jarra1 < CAPACIDAD_JARRA1:
-        conjunto_acciones.add("TRANSFERIR_DE_JARRA3_A_JARRA1")
-    if litros_jarra3 > 0 and litros_jarra2 < CAPACIDAD_JARRA2:
-        conjunto_acciones.add("TRANSFERIR_DE_JARRA3_A_JARRA2")
-
-    return conjunto_acciones
+    return PROBLEMA.obtener_acciones_posibles(estado)
 
 # 4) Modelo de transición y costo de acción
 
@@ -111,211 +124,121 @@ def obtener_costo_de_accion(nombre_accion):
     """
     Devuelve el costo asociado a la acción por su tipo (llenar, vaciar, transferir).
     """
-    if nombre_accion.startswith("LLENAR_"):
-        return COSTO_ACCION_LLENAR
-    if nombre_accion.startswith("VACIAR_"):
-        return COSTO_ACCION_VACIAR
-    if nombre_accion.startswith("TRANSFERIR_"):
-        return COSTO_ACCION_TRANSFERIR
-    raise ValueError(f"Acción desconocida: {nombre_accion}")
+    return PROBLEMA.obtener_costo_de_accion(nombre_accion)
 
 def aplicar_accion(estado, nombre_accion):
     """
     Aplica la acción (nombre completo) y retorna el nuevo estado (litros_jarra1, litros_jarra2, litros_jarra3).
     """
-    litros_jarra1, litros_jarra2, litros_jarra3 = estado
-
-    # Llenar
-    if nombre_accion == "LLENAR_JARRA1":
-        return (CAPACIDAD_JARRA1, litros_jarra2, litros_jarra3)
-    if nombre_accion == "LLENAR_JARRA2":
-        return (litros_jarra1, CAPACIDAD_JARRA2, litros_jarra3)
-    if nombre_accion == "LLENAR_JARRA3":
-        return (litros_jarra1, litros_jarra2, CAPACIDAD_JARRA3)
-
-    # Vaciar
-    if nombre_accion == "VACIAR_JARRA1":
-        return (0, litros_jarra2, litros_jarra3)
-    if nombre_accion == "VACIAR_JARRA2":
-        return (litros_jarra1, 0, litros_jarra3)
-    if nombre_accion == "VACIAR_JARRA3":
-        return (litros_jarra1, litros_jarra2, 0)
-
-    # Transferencias (cálculo genérico auxiliar)
-    def transferir(cantidad_origen, capacidad_destino, cantidad_destino):
-        espacio_en_destino = capacidad_destino - cantidad_destino
-        cantidad_transferida = min(cantidad_origen, espacio_en_destino)
-        return cantidad_transferida
-
-    # 1 -> 2
-    if nombre_accion == "TRANSFERIR_DE_JARRA1_A_JARRA2":
-        t = transferir(litros_jarra1, CAPACIDAD_JARRA2, litros_jarra2)
-        return (litros_jarra1 - t, litros_jarra2 + t, litros_jarra3)
-    # 1 -> 3
-    if nombre_accion == "TRANSFERIR_DE_JARRA1_A_JARRA3":
-        t = transferir(litros_jarra1, CAPACIDAD_JARRA3, litros_jarra3)
-        return (litros_jarra1 - t, litros_jarra2, litros_jarra3 + t)
-    # 2 -> 1
-    if nombre_accion == "TRANSFERIR_DE_JARRA2_A_JARRA1":
-        t = transferir(litros_jarra2, CAPACIDAD_JARRA1, litros_jarra1)
-        return (litros_jarra1 + t, litros_jarra2 - t, litros_jarra3)
-    # 2 -> 3
-    if nombre_accion == "TRANSFERIR_DE_JARRA2_A_JARRA3":
-        t = transferir(litros_jarra2, CAPACIDAD_JARRA3, litros_jarra3)
-        return (litros_jarra1, litros_jarra2 - t, litros_jarra3 + t)
-    # 3 -> 1
-    if nombre_accion == "TRANSFERIR_DE_JARRA3_A_JARRA1":
-        t = transferir(litros_jarra3, CAPACIDAD_JARRA1, litros_jarra1)
-        return (litros_jarra1 + t, litros_jarra2, litros_jarra3 - t)
-    # 3 -> 2
-    if nombre_accion == "TRANSFERIR_DE_JARRA3_A_JARRA2":
-        t = transferir(litros_jarra3, CAPACIDAD_JARRA2, litros_jarra2)
-        return (litros_jarra1, litros_jarra2 + t, litros_jarra3 - t)
-
-    raise ValueError(f"Acción desconocida: {nombre_accion}")
+    return PROBLEMA.aplicar_accion(estado, nombre_accion)
 
 # 5) Búsqueda A* con logs detallados - Ayudado de ChatGPT 5 Thinking, prompt documentado en prompt2.txt
-def busqueda_a_estrella(estado_inicial=None):
+def busqueda_a_estrella(estado_inicial=None, heuristica=HEURISTICA_JARRA2, **opciones):
     """
     Realiza la búsqueda A*:
     - La prioridad en la cola es f(n) = g(n) + h(n)
     - Devuelve (estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado)
       donde logs_por_estado detalla cada expansión.
+    La búsqueda se ejecuta sobre el motor genérico (motor_jarras); 'opciones' se
+    pasan tal cual (empaquetado, grafo, nivel_traza, k_frontera, ...).
+    'heuristica' elige h(n) entre HEURISTICAS; con peso=w (opción) es A*
+    ponderado, f(n) = g(n) + w·h(n).
     """
-    if estado_inicial is None:
-        estado_inicial = obtener_estado_inicial()
+    return motor_jarras.busqueda_a_estrella(obtener_problema(heuristica), estado_inicial, **opciones)
 
-    frontera = []  # elementos: (f, id_incremental, estado)
-    id_incremental = 0
-    heappush(frontera, (funcion_heuristica(estado_inicial), id_incremental, estado_inicial))
+def iterar_a_estrella(estado_inicial=None, heuristica=HEURISTICA_JARRA2, **opciones):
+    """
+    Variante en generador de busqueda_a_estrella: produce un registro por
+    expansión (traza.EXPANSION, log) y al final
+    (traza.RESULTADO, (estado_objetivo, diccionario_padre, diccionario_accion)).
+    """
+    return motor_jarras.iterar_a_estrella(obtener_problema(heuristica), estado_inicial, **opciones)
 
-    # Estructuras de apoyo
-    diccionario_padre = {estado_inicial: None}
-    diccionario_accion = {estado_inicial: None}
-    diccionario_costo_acumulado = {estado_inicial: 0}  # g(n)
+def _heuristica_directa_bidireccional(heuristica):
+    """
+    Heurística hacia adelante del A* bidireccional: None (la admisible por
+    defecto) o la PDB. jarra2 no se acepta: el corte necesita h admisible.
+    """
+    if heuristica is None:
+        return None
+    if heuristica != HEURISTICA_PDB:
+        raise ValueError(f"A* bidireccional necesita una heurística admisible: '{heuristica}' no lo es "
+                         f"(use '{HEURISTICA_PDB}' o ninguna).")
+    return obtener_problema(heuristica).funcion_heuristica
+
+def iterar_a_estrella_bidireccional(estado_inicial=None, heuristica=None, **opciones):
+    """
+    A* bidireccional (hacia adelante desde el inicial y hacia atrás desde todos
+    los estados con 6 L en la jarra 2), con el mismo protocolo que iterar_a_estrella.
+    Con heuristica=HEURISTICA_PDB la dirección directa usa la PDB; si no, las
+    heurísticas admisibles por defecto. Ver busqueda_bidireccional.iterar_bidireccional.
+    """
+    return busqueda_bidireccional.iterar_bidireccional(
+        PROBLEMA, estado_inicial, heuristica_directa=_heuristica_directa_bidireccional(heuristica), **opciones
+    )
 
-    # Contadores y logs
-    total_descubiertos = 1  # incluye el inicial
-    total_expandidos = 0
-    indice_expansion = 0
-    logs_por_estado = {}
+def busqueda_a_estrella_bidireccional(estado_inicial=None, heuristica=None, **opciones):
+    """
+    A* bidireccional; devuelve (estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado).
+    """
+    return busqueda_bidireccional.busqueda_a_estrella_bidireccional(
+        PROBLEMA, estado_inicial, heuristica_directa=_heuristica_directa_bidireccional(heuristica), **opciones
+    )
 
-    visitados = set()
+def iterar_ida_estrella(estado_inicial=None, heuristica=HEURISTICA_JARRA2, **opciones):
+    """
+    IDA* (memoria lineal en la profundidad): produce (traza.ITERACION, registro)
+    por cada umbral y al final (traza.RESULTADO, (estado_objetivo, diccionario_padre,
+    diccionario_accion)). Ver ida_estrella.iterar_ida_estrella.
+    """
+    return ida_estrella.iterar_ida_estrella(obtener_problema(heuristica), estado_inicial, **opciones)
 
-    while frontera:
-        valor_funcion_f, _identificador, estado_actual = heappop(frontera)
+def busqueda_ida_estrella(estado_inicial=None, heuristica=HEURISTICA_JARRA2, **opciones):
+    """
+    IDA*; devuelve (estado_objetivo, diccionario_padre, diccionario_accion, iteraciones).
+    """
+    return ida_estrella.busqueda_ida_estrella(obtener_problema(heuristica), estado_inicial, **opciones)
 
-        if estado_actual in visitados:
-            continue
+def iterar_ara_estrella(estado_inicial=None, heuristica=HEURISTICA_JARRA2, **opciones):
+    """
+    ARA* (A* anytime): produce (traza.MEJORA, registro) con cada solución mejorada
+    y su cota de suboptimalidad, bajando el peso hasta 1, y al final
+    (traza.RESULTADO, ...). Ver ara_estrella.iterar_ara_estrella.
+    """
+    return ara_estrella.iterar_ara_estrella(obtener_problema(heuristica), estado_inicial, **opciones)
+
+def busqueda_a_estrella_distribuida(estado_inicial=None, heuristica=HEURISTICA_JARRA2, **opciones):
+    """
+    A* distribuido por hash (HDA*) entre procesos; devuelve
+    (estado_objetivo, diccionario_padre, diccionario_accion, estadisticas).
+    Ver a_estrella_distribuida.busqueda_a_estrella_distribuida.
+    """
+    return a_estrella_distribuida.busqueda_a_estrella_distribuida(obtener_problema(heuristica), estado_inicial,
+                                                                  **opciones)
 
-        costo_acumulado_actual = diccionario_costo_acumulado[estado_actual]
-        heuristica_actual = funcion_heuristica(estado_actual)
-
-        # ¿Objetivo?
-        if es_estado_final(estado_actual):
-            frontera_total_ordenada = sorted(
-                [
-                    (
-                        f,
-                        diccionario_costo_acumulado.get(s, float("inf")),
-                        f - diccionario_costo_acumulado.get(s, 0),
-                        s,
-                    )
-                    for (f, _id, s) in frontera
-                ],
-                key=lambda t: (t[0], str(t[3]))
-            )
-            logs_por_estado[estado_actual] = {
-                "indice_de_expansion": indice_expansion,
-                "estado": estado_actual,
-                "costo_acumulado_g": costo_acumulado_actual,
-                "heuristica_h": heuristica_actual,
-                "valor_funcion_f": costo_acumulado_actual + heuristica_actual,
-                "accion_entrada": diccionario_accion.get(estado_actual),
-                "sucesores": [],
-                "sucesores_anadidos": [],
-                "frontera_total": frontera_total_ordenada,
-                "nuevos_descubiertos": 0,
-                "expandidos_este_paso": 0,
-                "totales": {"descubiertos": total_descubiertos, "expandidos": total_expandidos},
-                "es_objetivo": True,
-            }
-            return estado_actual, diccionario_padre, diccionario_accion, logs_por_estado
-
-        # Expandir
-        visitados.add(estado_actual)
-        total_expandidos += 1
-
-        acciones_posibles_en_orden = [a for a in ORDEN_ACCIONES if a in obtener_acciones_posibles(estado_actual)]
-
-        # Para el log
-        lista_sucesores = []
-        lista_sucesores_anadidos = []
-        descubiertos_este_paso = 0
-
-        for nombre_accion in acciones_posibles_en_orden:
-            estado_sucesor = aplicar_accion(estado_actual, nombre_accion)
-            costo_de_accion = obtener_costo_de_accion(nombre_accion)
-            costo_acumulado_sucesor = costo_acumulado_actual + costo_de_accion
-            heuristica_sucesor = funcion_heuristica(estado_sucesor)
-            valor_funcion_f_sucesor = costo_acumulado_sucesor + heuristica_sucesor
-
-            # Registrar sucesor (siempre)
-            lista_sucesores.append((
-                estado_sucesor,
-                nombre_accion,
-                costo_de_accion,
-                costo_acumulado_sucesor,
-                heuristica_sucesor,
-                valor_funcion_f_sucesor
-            ))
-
-            # Si nunca visto o mejora costo g, actualizar y empujar a frontera
-            if (estado_sucesor not in diccionario_costo_acumulado) or (costo_acumulado_sucesor < diccionario_costo_acumulado[estado_sucesor]):
-                diccionario_costo_acumulado[estado_sucesor] = costo_acumulado_sucesor
-                diccionario_padre[estado_sucesor] = estado_actual
-                diccionario_accion[estado_sucesor] = nombre_accion
-                id_incremental += 1
-                heappush(frontera, (valor_funcion_f_sucesor, id_incremental, estado_sucesor))
-                lista_sucesores_anadidos.append((valor_funcion_f_sucesor, costo_acumulado_sucesor, heuristica_sucesor, estado_sucesor))
-                descubiertos_este_paso += 1
-
-        total_descubiertos += descubiertos_este_paso
-
-        # Frontera para el log (ordenada por f, y estado como texto)
-        frontera_total_ordenada = sorted(
-            [
-                (
-                    f,
-                    diccionario_costo_acumulado.get(s, float("inf")),
-                    f - diccionario_costo_acumulado.get(s, 0),
-                    s,
-                )
-                for (f, _id, s) in frontera
-            ],
-            key=lambda t: (t[0], str(t[3]))
-        )
-
-        logs_por_estado[estado_actual] = {
-            "indice_de_expansion": indice_expansion,
-            "estado": estado_actual,
-            "costo_acumulado_g": costo_acumulado_actual,
-            "heuristica_h": heuristica_actual,
-            "valor_funcion_f": costo_acumulado_actual + heuristica_actual,
-            "accion_entrada": diccionario_accion.get(estado_actual),
-            "sucesores": lista_sucesores,             # (estado, accion, costo_accion, g, h, f)
-            "sucesores_anadidos": lista_sucesores_anadidos,  # (f, g, h, estado)
-            "frontera_total": frontera_total_ordenada,       # (f, g, h, estado)
-            "nuevos_descubiertos": descubiertos_este_paso,
-            "expandidos_este_paso": 1,
-            "totales": {"descubiertos": total_descubiertos, "expandidos": total_expandidos},
-            "es_objetivo": False,
-        }
-
-        indice_expansion += 1
-
-    # Sin solución
-    return None, diccionario_padre, diccionario_accion, logs_por_estado
+def resolver(estado_inicial=None, cache=None, heuristica=HEURISTICA_JARRA2, **opciones):
+    """
+    Resuelve con A* consultando primero 'cache' (cache_soluciones.CacheSoluciones).
+    Devuelve (solucion, desde_cache); ver motor_jarras.resolver.
+    """
+    return motor_jarras.resolver(obtener_problema(heuristica), motor_jarras.A_ESTRELLA, estado_inicial, cache,
+                                 **opciones)
+
+def obtener_tabla_costos():
+    """
+    Tabla de costos mínimos para todos los objetivos (jarra, litros) desde el
+    estado inicial, con los costos L=1, V=3, T=2. Se construye con un único
+    barrido de Dijkstra y se reutiliza en las llamadas siguientes.
+    """
+    return tabla_costos.obtener_tabla_costos(PROBLEMA)
+
+def camino_mas_barato(jarra, litros):
+    """
+    Devuelve (costo, camino) para tener 'litros' en 'jarra' (índice 0..2) al
+    menor costo, o (None, []) si no es alcanzable. Consulta la tabla de costos.
+    """
+    tabla = obtener_tabla_costos()
+    return tabla.costo_para(jarra, litros), tabla.camino_para(jarra, litros)
 
 # 6) Reconstrucción de la solución
 def reconstruir_camino(estado_final, diccionario_padre, diccionario_accion):
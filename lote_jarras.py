@@ -0,0 +1,355 @@
+# lote_jarras.py
+# --------------------------------------------------------
+# Resolución en lote de muchas instancias de jarras.
+# - Lee instancias desde un archivo JSONL (o stdin con '-'),
+#   una instancia por línea.
+# - Reparte las instancias en bloques entre los procesos de un
+#   ProcessPoolExecutor y escribe un resultado JSONL por instancia,
+#   en orden de finalización o en el orden de entrada.
+#
+# Formato de cada instancia (sólo 'capacidades' es obligatorio):
+#   {"id": "a1", "capacidades": [3, 7, 9], "objetivo": {"1": 6},
+#    "estado_inicial": [0, 0, 0], "costos": {"L": 1, "V": 3, "T": 2},
+#    "algoritmo": "a_estrella" | "best_first", "empaquetado": false}
+#
+# Formato de cada resultado:
+#   {"indice": 0, "id": "a1", "estado": "ok" | "sin_solucion" |
+#    "tiempo_agotado" | "error", "camino": [[estado, accion], ...],
+#    "costo": 9, "expandidos": 12, "descubiertos": 40,
+#    "tiempo_segundos": 0.0012, "error": "..."}
+#
+# Límite de tiempo: cada instancia revisa su plazo entre expansiones
+# (la búsqueda se consume con iterar_* a nivel de traza 'resumen').
+# Procesos caídos: si un proceso muere, el pool se recrea y las
+# instancias que estaban en curso se reintentan de a una; sólo la que
+# vuelve a tirar el proceso se informa como error.
+# --------------------------------------------------------
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import motor_jarras
+import traza
+
+ALGORITMOS = motor_jarras.ITERADORES
+
+ORDEN_ENTRADA = "entrada"
+ORDEN_FINALIZACION = "finalizacion"
+ORDENES = (ORDEN_ENTRADA, ORDEN_FINALIZACION)
+
+OK = "ok"
+SIN_SOLUCION = "sin_solucion"
+TIEMPO_AGOTADO = "tiempo_agotado"
+ERROR = "error"
+
+TAMANO_BLOQUE_POR_DEFECTO = 8
+
+
+# 1) Resolución de una instancia
+
+def crear_problema(instancia):
+    """
+    Construye el ProblemaJarras descrito por una instancia (diccionario JSON).
+    Las claves de 'objetivo' pueden venir como texto ("0") o como enteros.
+    """
+    if "capacidades" not in instancia:
+        raise ValueError("La instancia no tiene 'capacidades'.")
+    return motor_jarras.ProblemaJarras(
+        instancia["capacidades"],
+        estado_inicial=instancia.get("estado_inicial"),
+        objetivo=instancia.get("objetivo"),
+        costos=instancia.get("costos"),
+    )
+
+
+def _resultado_base(indice, instancia):
+    resultado = {"indice": indice}
+    if isinstance(instancia, dict) and "id" in instancia:
+        resultado["id"] = instancia["id"]
+    return resultado
+
+
+def resolver_instancia(indice, instancia, limite_segundos=None):
+    """
+    Resuelve una instancia y devuelve su diccionario de resultado.
+    Usa las mismas búsquedas que busqueda_a_estrella / busqueda_best_first,
+    consumidas como iterador para poder contar expansiones y cortar por tiempo.
+    Nunca lanza excepciones: los errores quedan en el resultado.
+    """
+    resultado = _resultado_base(indice, instancia)
+    inicio = time.perf_counter()
+    try:
+        problema = crear_problema(instancia)
+        algoritmo = instancia.get("algoritmo", motor_jarras.A_ESTRELLA)
+        if algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido: {algoritmo} (use uno de {', '.join(ALGORITMOS)})")
+        iterador = ALGORITMOS[algoritmo](
+            problema, empaquetado=bool(instancia.get("empaquetado", False)), nivel_traza=traza.RESUMEN
+        )
+
+        plazo = None if limite_segundos is None else inicio + limite_segundos
+        expandidos = 0
+        estado_objetivo, diccionario_padre, diccionario_accion = None, {}, {}
+        for tipo, datos in iterador:
+            if tipo == traza.RESULTADO:
+                estado_objetivo, diccionario_padre, diccionario_accion = datos
+                break
+            expandidos = datos["totales"]["expandidos"]
+            if plazo is not None and time.perf_counter() > plazo:
+                iterador.close()
+                resultado["estado"] = TIEMPO_AGOTADO
+                resultado["expandidos"] = expandidos
+                resultado["tiempo_segundos"] = time.perf_counter() - inicio
+                return resultado
+
+        camino = motor_jarras.reconstruir_camino(estado_objetivo, diccionario_padre, diccionario_accion)
+        resultado["estado"] = OK if camino else SIN_SOLUCION
+        resultado["camino"] = [[list(estado), accion] for estado, accion in camino]
+        resultado["costo"] = (
+            sum(problema.obtener_costo_de_accion(accion) for _estado, accion in camino[1:]) if camino else None
+        )
+        resultado["expandidos"] = expandidos
+        resultado["descubiertos"] = len(diccionario_padre)
+    except Exception as error:  # una instancia inválida no debe frenar el lote
+        resultado["estado"] = ERROR
+        resultado["error"] = f"{type(error).__name__}: {error}"
+    resultado["tiempo_segundos"] = time.perf_counter() - inicio
+    return resultado
+
+
+def _resolver_bloque(bloque, limite_segundos):
+    """
+    Tarea de cada proceso: resuelve una lista de (indice, instancia).
+    """
+    return [resolver_instancia(indice, instancia, limite_segundos) for indice, instancia in bloque]
+
+
+# 2) Lectura de instancias
+
+def leer_instancias(archivo):
+    """
+    Genera (indice, instancia) por cada línea no vacía de 'archivo'.
+    Las líneas que no son JSON válido se entregan como (indice, ValueError).
+    """
+    indice = 0
+    for linea in archivo:
+        linea = linea.strip()
+        if not linea:
+            continue
+        try:
+            instancia = json.loads(linea)
+            if not isinstance(instancia, dict):
+                raise ValueError("cada línea debe ser un objeto JSON")
+        except ValueError as error:
+            instancia = ValueError(f"Línea {indice + 1} inválida: {error}")
+        yield indice, instancia
+        indice += 1
+
+
+def _bloques(instancias, tamano_bloque, errores):
+    """
+    Agrupa las instancias válidas en bloques; las inválidas van a 'errores'.
+    """
+    bloque = []
+    for indice, instancia in instancias:
+        if isinstance(instancia, Exception):
+            resultado = _resultado_base(indice, None)
+            resultado["estado"] = ERROR
+            resultado["error"] = str(instancia)
+            errores.append(resultado)
+            continue
+        bloque.append((indice, instancia))
+        if len(bloque) >= tamano_bloque:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
+
+
+# 3) Reparto en procesos
+
+def _resultado_caido(indice, instancia):
+    resultado = _resultado_base(indice, instancia)
+    resultado["estado"] = ERROR
+    resultado["error"] = "El proceso que resolvía la instancia terminó abruptamente."
+    return resultado
+
+
+def _ordenar(resultados, orden, pendientes, siguiente):
+    """
+    Devuelve (listos, siguiente): en orden de entrada sólo se liberan los
+    resultados contiguos a partir del índice 'siguiente'.
+    """
+    if orden == ORDEN_FINALIZACION:
+        return resultados, siguiente
+    for resultado in resultados:
+        pendientes[resultado["indice"]] = resultado
+    listos = []
+    while siguiente in pendientes:
+        listos.append(pendientes.pop(siguiente))
+        siguiente += 1
+    return listos, siguiente
+
+
+def resolver_lote(instancias, procesos=None, tamano_bloque=TAMANO_BLOQUE_POR_DEFECTO,
+                  limite_segundos=None, orden=ORDEN_FINALIZACION):
+    """
+    Resuelve las instancias (iterable de (indice, instancia), ver leer_instancias)
+    en un pool de procesos y genera los resultados a medida que están listos.
+    - tamano_bloque: instancias por tarea enviada a un proceso.
+    - limite_segundos: plazo por instancia (None = sin límite).
+    - orden: ORDEN_FINALIZACION o ORDEN_ENTRADA.
+    La entrada se lee de a poco: nunca hay más de 2 bloques por proceso en vuelo.
+    """
+    if orden not in ORDENES:
+        raise ValueError(f"Orden desconocido: {orden} (use uno de {', '.join(ORDENES)})")
+    if tamano_bloque < 1:
+        raise ValueError("El tamaño de bloque debe ser al menos 1.")
+    procesos = procesos or os.cpu_count() or 1
+    maximo_en_vuelo = 2 * procesos
+
+    errores = []
+    bloques = _bloques(instancias, tamano_bloque, errores)
+    pendientes = {}
+    siguiente = 0
+    sospechosos = []  # instancias en curso cuando un proceso murió
+    en_vuelo = {}     # future -> bloque
+    pool = ProcessPoolExecutor(max_workers=procesos)
+    agotados = False
+
+    try:
+        while True:
+            # 1) Reintentar de a una las instancias que estaban en un pool caído
+            while sospechosos and not en_vuelo:
+                tarea = sospechosos.pop(0)
+                try:
+                    resultados = pool.submit(_resolver_bloque, [tarea], limite_segundos).result()
+                except BrokenProcessPool:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = ProcessPoolExecutor(max_workers=procesos)
+                    resultados = [_resultado_caido(*tarea)]
+                listos, siguiente = _ordenar(resultados, orden, pendientes, siguiente)
+                yield from listos
+
+            # 2) Completar la cola de bloques en vuelo
+            while not agotados and not sospechosos and len(en_vuelo) < maximo_en_vuelo:
+                bloque = next(bloques, None)
+                if errores:
+                    listos, siguiente = _ordenar(errores, orden, pendientes, siguiente)
+                    errores = []
+                    yield from listos
+                if bloque is None:
+                    agotados = True
+                    break
+                en_vuelo[pool.submit(_resolver_bloque, bloque, limite_segundos)] = bloque
+
+            if not en_vuelo:
+                if agotados and not sospechosos:
+                    break
+                continue
+
+            # 3) Recoger los bloques terminados
+            terminados, _ = wait(en_vuelo, return_when=FIRST_COMPLETED)
+            for future in terminados:
+                bloque = en_vuelo.pop(future)
+                try:
+                    resultados = future.result()
+                except BrokenProcessPool:
+                    sospechosos.extend(bloque)
+                    continue
+                listos, siguiente = _ordenar(resultados, orden, pendientes, siguiente)
+                yield from listos
+
+            # Si el pool se rompió, todo lo que seguía en vuelo pasa a sospechoso
+            if sospechosos:
+                for bloque in en_vuelo.values():
+                    sospechosos.extend(bloque)
+                en_vuelo = {}
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = ProcessPoolExecutor(max_workers=procesos)
+                sospechosos.sort(key=lambda tarea: tarea[0])
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# 4) CLI
+
+def construir_argumentos():
+    """
+    Construye y devuelve el parser de argumentos de línea de comandos.
+    """
+    parser = argparse.ArgumentParser(
+        description="Resuelve en lote instancias de jarras leídas de un archivo JSONL."
+    )
+    parser.add_argument(
+        "entrada",
+        help="Archivo JSONL con una instancia por línea ('-' para leer de stdin)."
+    )
+    parser.add_argument(
+        "--salida",
+        default="-",
+        help="Archivo JSONL de resultados ('-' para stdout, por defecto)."
+    )
+    parser.add_argument(
+        "--procesos",
+        type=int,
+        default=None,
+        help="Cantidad de procesos (por defecto, uno por CPU)."
+    )
+    parser.add_argument(
+        "--tamano-bloque",
+        type=int,
+        default=TAMANO_BLOQUE_POR_DEFECTO,
+        help="Instancias por tarea enviada a cada proceso. Ejemplo: --tamano-bloque 16"
+    )
+    parser.add_argument(
+        "--limite-segundos",
+        type=float,
+        default=None,
+        help="Plazo máximo por instancia, en segundos. Ejemplo: --limite-segundos 2.5"
+    )
+    parser.add_argument(
+        "--orden",
+        choices=ORDENES,
+        default=ORDEN_FINALIZACION,
+        help="Orden de los resultados: finalizacion (apenas terminan) o entrada."
+    )
+    return parser
+
+
+def main():
+    parser = construir_argumentos()
+    argumentos = parser.parse_args()
+
+    if argumentos.procesos is not None and argumentos.procesos < 1:
+        parser.error("--procesos debe ser al menos 1.")
+    if argumentos.tamano_bloque < 1:
+        parser.error("--tamano-bloque debe ser al menos 1.")
+    if argumentos.limite_segundos is not None and argumentos.limite_segundos <= 0:
+        parser.error("--limite-segundos debe ser positivo.")
+
+    entrada = sys.stdin if argumentos.entrada == "-" else open(argumentos.entrada, encoding="utf-8")
+    salida = sys.stdout if argumentos.salida == "-" else open(argumentos.salida, "w", encoding="utf-8")
+    try:
+        for resultado in resolver_lote(
+            leer_instancias(entrada),
+            procesos=argumentos.procesos,
+            tamano_bloque=argumentos.tamano_bloque,
+            limite_segundos=argumentos.limite_segundos,
+            orden=argumentos.orden,
+        ):
+            salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            salida.flush()
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,777 @@
+# motor_jarras.py
+# --------------------------------------------------------
+# Motor genérico para el problema de las N jarras.
+# Las capacidades, el estado inicial, el objetivo y los costos
+# de las acciones llegan como datos (no están fijos en el código).
+#
+# Representación del estado: tupla (litros_jarra0, ..., litros_jarraN-1)
+#
+# Acciones: se generan como tuplas (tipo, origen, destino) de índices
+#   (LLENAR,     None, j) = Llenar la jarra j
+#   (VACIAR,     i, None) = Vaciar la jarra i
+#   (TRANSFERIR, i, j)    = Transferir de la jarra i a la jarra j
+#
+# Orden determinista de acciones: primero todos los llenados,
+# luego todos los vaciados y por último las transferencias (i, j)
+# en orden lexicográfico. Es el mismo orden que usan jarras.py y
+# jarras_a_estrella.py en su ORDEN_ACCIONES.
+# --------------------------------------------------------
+
+import inspect
+
+import busqueda_haz
+import cache_soluciones
+import estados_empaquetados
+import fronteras
+import perfilado
+import simetrias
+import solucion_analitica
+import sucesores_compilados
+import traza
+
+# Tipos de acción
+LLENAR = "L"
+VACIAR = "V"
+TRANSFERIR = "T"
+
+# Costo por defecto de cada tipo de acción (problema sin costos)
+COSTOS_POR_DEFECTO = {LLENAR: 1, VACIAR: 1, TRANSFERIR: 1}
+
+# Nombres de los algoritmos (claves del caché de soluciones)
+A_ESTRELLA = "a_estrella"
+BEST_FIRST = "best_first"
+
+# g de los elementos de la frontera sin costo registrado (un único float compartido)
+INFINITO = float("inf")
+
+
+# 1) Generación de acciones
+
+def generar_acciones(numero_jarras):
+    """
+    Genera la lista de acciones (tipo, origen, destino) en orden determinista
+    para un problema con 'numero_jarras' jarras.
+    """
+    acciones = [(LLENAR, None, j) for j in range(numero_jarras)]
+    acciones += [(VACIAR, i, None) for i in range(numero_jarras)]
+    acciones += [
+        (TRANSFERIR, i, j)
+        for i in range(numero_jarras)
+        for j in range(numero_jarras)
+        if i != j
+    ]
+    return acciones
+
+def nombre_de_accion_por_defecto(accion):
+    """
+    Nombre corto (1-indexado) de una acción: L1, V2, T13, ...
+    """
+    tipo, origen, destino = accion
+    if tipo == LLENAR:
+        return f"L{destino + 1}"
+    if tipo == VACIAR:
+        return f"V{origen + 1}"
+    return f"T{origen + 1}{destino + 1}"
+
+
+# 2) Especificación del problema
+
+class ProblemaJarras:
+    """
+    Especificación de un problema de N jarras dirigida por datos.
+
+    - capacidades: secuencia con la capacidad de cada jarra.
+    - estado_inicial: litros iniciales por jarra (por defecto, todas vacías).
+    - objetivo: diccionario {indice_jarra: litros} que debe cumplirse.
+    - costos: diccionario {LLENAR|VACIAR|TRANSFERIR: costo} (por defecto 1).
+    - nombres_acciones: nombres a usar para cada acción, en el orden de
+      generar_acciones (por defecto L1, V1, T12, ...).
+    - heuristica: función h(estado); por defecto la suma de |litros_j - objetivo_j|.
+    """
+
+    def __init__(self, capacidades, estado_inicial=None, objetivo=None, costos=None,
+                 nombres_acciones=None, heuristica=None):
+        self.capacidades = tuple(int(c) for c in capacidades)
+        self.numero_jarras = len(self.capacidades)
+        if self.numero_jarras == 0:
+            raise ValueError("Se necesita al menos una jarra.")
+        if any(c <= 0 for c in self.capacidades):
+            raise ValueError(f"Capacidades inválidas: {self.capacidades}")
+
+        if estado_inicial is None:
+            estado_inicial = (0,) * self.numero_jarras
+        self.estado_inicial = tuple(int(x) for x in estado_inicial)
+        self._validar_estado(self.estado_inicial)
+
+        self.objetivo = {int(j): int(x) for j, x in (objetivo or {}).items()}
+        for j in self.objetivo:
+            if not 0 <= j < self.numero_jarras:
+                raise ValueError(f"Jarra objetivo fuera de rango: {j}")
+
+        self.costos = dict(COSTOS_POR_DEFECTO)
+        if costos:
+            self.costos.update(costos)
+
+        self.acciones = generar_acciones(self.numero_jarras)
+        if nombres_acciones is None:
+            nombres_acciones = [nombre_de_accion_por_defecto(a) for a in self.acciones]
+        if len(nombres_acciones) != len(self.acciones):
+            raise ValueError("Se necesita un nombre por cada acción.")
+        self.nombres_acciones = list(nombres_acciones)
+        self.indice_por_nombre = {nombre: i for i, nombre in enumerate(self.nombres_acciones)}
+        self.costos_acciones = [self.costos[a[0]] for a in self.acciones]
+
+        self._heuristica = heuristica
+
+        # Tablas de nombres por índice para generar sucesores sin despacho por texto
+        n = self.numero_jarras
+        self._nombres_llenar = self.nombres_acciones[:n]
+        self._nombres_vaciar = self.nombres_acciones[n:2 * n]
+        self._nombres_transferir = [[None] * n for _ in range(n)]
+        for indice in range(2 * n, len(self.acciones)):
+            _tipo, i, j = self.acciones[indice]
+            self._nombres_transferir[i][j] = self.nombres_acciones[indice]
+        self._compilar_sucesores()
+
+    def _compilar_sucesores(self):
+        # Función de sucesores generada para esta configuración (ver
+        # sucesores_compilados.py); en la instancia reemplaza al método genérico
+        compilada = sucesores_compilados.compilar_sucesores(
+            self.capacidades, self._nombres_llenar, self._nombres_vaciar, self._nombres_transferir,
+            (self.costos[LLENAR], self.costos[VACIAR], self.costos[TRANSFERIR]),
+        )
+        if compilada is not None:
+            self.sucesores = compilada
+
+    def __getstate__(self):
+        # La función generada no se serializa: se vuelve a generar al cargar
+        estado = dict(self.__dict__)
+        estado.pop("sucesores", None)
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._compilar_sucesores()
+
+    def con_heuristica(self, heuristica):
+        """
+        Devuelve una copia del problema (mismos datos y nombres de acciones)
+        con otra heurística.
+        """
+        return ProblemaJarras(self.capacidades, self.estado_inicial, self.objetivo, self.costos,
+                              self.nombres_acciones, heuristica)
+
+    def con_peso(self, peso):
+        """
+        Devuelve una copia del problema con la heurística ponderada w·h(n)
+        (A* ponderado: f = g + w·h). Con peso 1 devuelve el mismo problema.
+        """
+        if peso < 0:
+            raise ValueError(f"El peso de la heurística no puede ser negativo: {peso}")
+        if peso == 1:
+            return self
+        base = self.funcion_heuristica
+        nombre = cache_soluciones.nombre_heuristica(self)
+
+        def heuristica_ponderada(estado):
+            valor = base(estado)
+            return valor if valor == float("inf") else peso * valor
+
+        # Nombre estable (lo usa la clave del caché de soluciones)
+        if nombre is not None:
+            heuristica_ponderada.__qualname__ = f"{nombre}*{float(peso)}"
+        return self.con_heuristica(heuristica_ponderada)
+
+    def _validar_estado(self, estado):
+        if len(estado) != self.numero_jarras:
+            raise ValueError(f"El estado {estado} no tiene {self.numero_jarras} jarras.")
+        for litros, capacidad in zip(estado, self.capacidades):
+            if not 0 <= litros <= capacidad:
+                raise ValueError(f"Estado fuera de rango: {estado}")
+
+    # Estado inicial y final
+
+    def obtener_estado_inicial(self):
+        return self.estado_inicial
+
+    def es_estado_final(self, estado):
+        for j, litros in self.objetivo.items():
+            if estado[j] != litros:
+                return False
+        return True
+
+    # Heurística
+
+    def funcion_heuristica(self, estado):
+        if self._heuristica is not None:
+            return self._heuristica(estado)
+        return sum(abs(estado[j] - litros) for j, litros in self.objetivo.items())
+
+    # Acciones, transición y costo
+
+    def obtener_acciones_posibles(self, estado):
+        """
+        Retorna el conjunto de nombres de acciones aplicables en 'estado'.
+        """
+        return {nombre for nombre, _sucesor, _costo in self.sucesores(estado)}
+
+    def aplicar_accion(self, estado, nombre_accion):
+        """
+        Aplica la acción (por nombre) y retorna el nuevo estado.
+        """
+        if nombre_accion not in self.indice_por_nombre:
+            raise ValueError(f"Acción desconocida: {nombre_accion}")
+        tipo, origen, destino = self.acciones[self.indice_por_nombre[nombre_accion]]
+        nuevo = list(estado)
+        if tipo == LLENAR:
+            nuevo[destino] = self.capacidades[destino]
+        elif tipo == VACIAR:
+            nuevo[origen] = 0
+        else:
+            cantidad_transferida = min(estado[origen], self.capacidades[destino] - estado[destino])
+            nuevo[origen] -= cantidad_transferida
+            nuevo[destino] += cantidad_transferida
+        return tuple(nuevo)
+
+    def obtener_costo_de_accion(self, nombre_accion):
+        if nombre_accion not in self.indice_por_nombre:
+            raise ValueError(f"Acción desconocida: {nombre_accion}")
+        return self.costos_acciones[self.indice_por_nombre[nombre_accion]]
+
+    def sucesores(self, estado):
+        """
+        Devuelve la lista de (nombre_accion, sucesor, costo) aplicables en 'estado',
+        en el orden determinista de las acciones. Cuesta O(jarras²) por estado.
+        Es la versión genérica: las instancias la reemplazan por la función
+        generada para su configuración (sucesores_compilados.py) si se puede.
+        """
+        capacidades = self.capacidades
+        rango = range(self.numero_jarras)
+        costo_llenar = self.costos[LLENAR]
+        costo_vaciar = self.costos[VACIAR]
+        costo_transferir = self.costos[TRANSFERIR]
+        resultado = []
+
+        for j in rango:
+            if estado[j] < capacidades[j]:
+                nuevo = list(estado)
+                nuevo[j] = capacidades[j]
+                resultado.append((self._nombres_llenar[j], tuple(nuevo), costo_llenar))
+        for i in rango:
+            if estado[i] > 0:
+                nuevo = list(estado)
+                nuevo[i] = 0
+                resultado.append((self._nombres_vaciar[i], tuple(nuevo), costo_vaciar))
+        for i in rango:
+            litros_origen = estado[i]
+            if litros_origen == 0:
+                continue
+            nombres_i = self._nombres_transferir[i]
+            for j in rango:
+                if i == j:
+                    continue
+                espacio_en_destino = capacidades[j] - estado[j]
+                if espacio_en_destino == 0:
+                    continue
+                cantidad_transferida = min(litros_origen, espacio_en_destino)
+                nuevo = list(estado)
+                nuevo[i] -= cantidad_transferida
+                nuevo[j] += cantidad_transferida
+                resultado.append((nombres_i[j], tuple(nuevo), costo_transferir))
+        return resultado
+
+
+# 3) Búsqueda Best-First (prioridad = h(n))
+
+def _clave_frontera_best_first(t):
+    return (t[0], str(t[1]))
+
+def _clave_frontera_estrella(t):
+    return (t[0], str(t[3]))
+
+@perfilado.con_estadisticas
+def iterar_best_first(problema, estado_inicial=None, empaquetado=False, grafo=None,
+                      nivel_traza=traza.COMPLETA, k_frontera=traza.K_FRONTERA_POR_DEFECTO,
+                      frontera_diferida=False, tipo_frontera=fronteras.AUTOMATICA,
+                      ancho_haz=None, ampliar_haz=False, estadisticas=None):
+    """
+    Búsqueda Best-First sobre 'problema' como generador:
+    - La prioridad en la cola es sólo la heurística h(n)
+    - Produce (traza.EXPANSION, registro) por cada expansión (mismo formato de logs
+      que jarras.busqueda_best_first) y al final
+      (traza.RESULTADO, (estado_objetivo, diccionario_padre, diccionario_accion)).
+    - Los registros no se acumulan: quien consume decide si guardarlos.
+      Con frontera_diferida=True la frontera completa se lee de la bitácora
+      (útil si se guardan todos los registros, ver busqueda_best_first).
+    - Con empaquetado=True los estados se codifican como enteros y las tablas
+      se indexan por código (ver estados_empaquetados.py).
+    - Con 'grafo' (GrafoCSR de grafo_csr.py) los sucesores se leen del grafo
+      precompilado en lugar de calcularse.
+    - 'nivel_traza' (ver traza.py) controla cuánto se guarda en cada registro;
+      con traza.NINGUNA no se produce ningún registro de expansión.
+    - 'tipo_frontera' (ver fronteras.py) elige la cola de prioridad; el orden
+      de expansión es el mismo con cualquiera. Por defecto (AUTOMATICA) se usan
+      cubetas si las prioridades son enteras y heapq si no.
+    - Con 'ancho_haz' es búsqueda en haz: a lo sumo 'ancho_haz' estados por capa
+      y memoria acotada por ancho · profundidad (ver busqueda_haz.py); con
+      ampliar_haz=True se reintenta con un haz más ancho si se queda sin salida.
+    - Con 'estadisticas' (perfilado.EstadisticasBusqueda) se miden tiempos por
+      fase y contadores de la frontera; con empaquetado o haz sólo el tiempo total.
+    - Si el oráculo del mcd (solucion_analitica.py) descarta el objetivo, se
+      devuelve el resultado sin solución sin explorar, con cualquier opción y
+      nivel de traza (sin registros de expansión).
+    """
+    traza.validar_nivel(nivel_traza)
+    if empaquetado and ancho_haz is not None:
+        raise ValueError("'empaquetado' y 'ancho_haz' no se pueden combinar.")
+    if empaquetado and grafo is not None:
+        raise ValueError("'empaquetado' y 'grafo' no se pueden combinar.")
+    inalcanzable = solucion_analitica.resultado_inalcanzable(problema, estado_inicial)
+    if inalcanzable is not None:
+        yield traza.RESULTADO, inalcanzable
+        return
+    if ancho_haz is not None:
+        yield from busqueda_haz.iterar_haz(
+            problema, estado_inicial, ancho=ancho_haz, ampliar=ampliar_haz, grafo=grafo,
+            nivel_traza=nivel_traza, k_frontera=k_frontera,
+        )
+        return
+    if empaquetado:
+        yield from estados_empaquetados.iterar_best_first_empaquetada(
+            problema, estado_inicial, nivel_traza=nivel_traza, k_frontera=k_frontera,
+            frontera_diferida=frontera_diferida, tipo_frontera=tipo_frontera,
+        )
+        return
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    funcion_heuristica = problema.funcion_heuristica
+    es_estado_final = problema.es_estado_final
+    sucesores = problema.sucesores if grafo is None else grafo.generador_sucesores(problema)
+    con_logs = traza.con_logs(nivel_traza)
+    con_detalle = traza.con_detalle(nivel_traza)
+    frontera_para_log = traza.frontera_para_log
+    if estadisticas is not None:
+        funcion_heuristica = estadisticas.medir_heuristica(funcion_heuristica)
+        sucesores = estadisticas.medir_sucesores(sucesores)
+        frontera_para_log = estadisticas.medir_logs(frontera_para_log)
+
+    def convertir(t):
+        return (t[0], t[2])
+
+    bitacora = traza.crear_bitacora(nivel_traza, lambda h, _g, s: (h, s), _clave_frontera_best_first,
+                                    diferida=frontera_diferida)
+
+    # Cola de prioridad: (h, id_incremental, estado)
+    id_incremental = 0
+    h_inicial = funcion_heuristica(estado_inicial)
+    frontera = fronteras.crear_frontera(tipo_frontera, (), h_inicial)
+    if estadisticas is not None:
+        frontera = estadisticas.medir_frontera(frontera)
+        bitacora = estadisticas.medir_bitacora(bitacora)
+    frontera.push(h_inicial, id_incremental, estado_inicial)
+    if bitacora is not None:
+        bitacora.push(id_incremental, h_inicial, 0, estado_inicial)
+
+    visitados = set()
+    diccionario_padre = {estado_inicial: None}
+    diccionario_accion = {estado_inicial: None}
+
+    total_descubiertos = 1  # incluye el estado inicial
+    total_expandidos = 0
+    indice_expansion = 0
+
+    while frontera:
+        valor_heuristico, identificador, estado_actual = frontera.pop()
+        if bitacora is not None:
+            bitacora.pop(identificador)
+
+        if estado_actual in visitados:
+            continue
+
+        if es_estado_final(estado_actual):
+            if con_logs:
+                yield traza.EXPANSION, traza.registro_best_first(
+                    indice_expansion, estado_actual, valor_heuristico,
+                    diccionario_accion.get(estado_actual), [], [],
+                    frontera_para_log(frontera, nivel_traza, k_frontera, convertir, _clave_frontera_best_first, bitacora),
+                    0, 0, total_descubiertos, total_expandidos, True, len(frontera),
+                )
+            yield traza.RESULTADO, (estado_actual, diccionario_padre, diccionario_accion)
+            return
+
+        visitados.add(estado_actual)
+        total_expandidos += 1
+
+        # Los sucesores se generan una sola vez y se reutilizan para el log
+        lista_sucesores = []
+        nuevos_descubiertos = 0
+        for accion, sucesor, _costo in sucesores(estado_actual):
+            h_suc = funcion_heuristica(sucesor)
+            if con_detalle:
+                lista_sucesores.append((sucesor, accion, h_suc))
+            if sucesor not in diccionario_padre:
+                diccionario_padre[sucesor] = estado_actual
+                diccionario_accion[sucesor] = accion
+                id_incremental += 1
+                frontera.push(h_suc, id_incremental, sucesor)
+                if bitacora is not None:
+                    bitacora.push(id_incremental, h_suc, 0, sucesor)
+                nuevos_descubiertos += 1
+
+        if not con_logs:
+            indice_expansion += 1
+            continue
+
+        lista_sucesores_anadidos = [
+            (h_suc, suc) for (suc, _acc, h_suc) in lista_sucesores
+            if diccionario_padre.get(suc) == estado_actual
+        ]
+        if con_detalle:
+            nuevos_descubiertos = len(lista_sucesores_anadidos)
+        total_descubiertos += nuevos_descubiertos
+
+        yield traza.EXPANSION, traza.registro_best_first(
+            indice_expansion, estado_actual, valor_heuristico,
+            diccionario_accion.get(estado_actual), lista_sucesores, lista_sucesores_anadidos,
+            frontera_para_log(frontera, nivel_traza, k_frontera, convertir, _clave_frontera_best_first, bitacora),
+            nuevos_descubiertos, 1, total_descubiertos, total_expandidos, False, len(frontera),
+        )
+
+        indice_expansion += 1
+
+    yield traza.RESULTADO, (None, diccionario_padre, diccionario_accion)
+
+
+def busqueda_best_first(problema, estado_inicial=None, cache=None, **opciones):
+    """
+    Realiza la búsqueda Best-First sobre 'problema' y devuelve
+    (estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado).
+    Acepta las mismas opciones que iterar_best_first (empaquetado, grafo,
+    nivel_traza, k_frontera, tipo_frontera, ancho_haz, ampliar_haz); la frontera completa se guarda como bitácora.
+    Con 'cache' (cache_soluciones.CacheSoluciones) y nivel_traza=traza.NINGUNA
+    se consulta primero el caché (ver resolver).
+    """
+    if cache is not None and opciones.get("nivel_traza") == traza.NINGUNA:
+        return _resultado_desde_solucion(resolver(problema, BEST_FIRST, estado_inicial, cache, **opciones)[0])
+    return traza.recolectar_logs(
+        iterar_best_first(problema, estado_inicial, frontera_diferida=True, **opciones)
+    )
+
+
+# 4) Búsqueda A* (prioridad = g(n) + h(n))
+
+@perfilado.con_estadisticas
+def iterar_a_estrella(problema, estado_inicial=None, empaquetado=False, grafo=None,
+                      nivel_traza=traza.COMPLETA, k_frontera=traza.K_FRONTERA_POR_DEFECTO,
+                      frontera_diferida=False, tipo_frontera=fronteras.AUTOMATICA, peso=1,
+                      estadisticas=None, reducir_simetrias=True):
+    """
+    Búsqueda A* sobre 'problema' como generador:
+    - La prioridad en la cola es f(n) = g(n) + h(n)
+    - Produce (traza.EXPANSION, registro) por cada expansión (mismo formato de logs
+      que jarras_a_estrella.busqueda_a_estrella) y al final
+      (traza.RESULTADO, (estado_objetivo, diccionario_padre, diccionario_accion)).
+    - Los registros no se acumulan: quien consume decide si guardarlos.
+      Con frontera_diferida=True la frontera completa se lee de la bitácora
+      (útil si se guardan todos los registros, ver busqueda_a_estrella).
+    - Con empaquetado=True los estados se codifican como enteros y padre, acción
+      y g se indexan por código (ver estados_empaquetados.py).
+    - Con 'grafo' (GrafoCSR de grafo_csr.py) los sucesores se leen del grafo
+      precompilado en lugar de calcularse.
+    - 'nivel_traza' (ver traza.py) controla cuánto se guarda en cada registro;
+      con traza.NINGUNA no se produce ningún registro de expansión.
+    - 'tipo_frontera' (ver fronteras.py) elige la cola de prioridad; el orden
+      de expansión es el mismo con cualquiera. Por defecto (AUTOMATICA) se usan
+      cubetas si las prioridades son enteras y heapq si no.
+    - Con 'peso' distinto de 1 es A* ponderado: f(n) = g(n) + peso·h(n) (ver
+      ProblemaJarras.con_peso); el costo queda a lo sumo 'peso' veces el óptimo
+      si h es admisible. En los logs, h y f son los valores ponderados.
+    - Con 'estadisticas' (perfilado.EstadisticasBusqueda) se miden tiempos por
+      fase y contadores de la frontera; con empaquetado sólo el tiempo total.
+    - Si el oráculo del mcd (solucion_analitica.py) descarta el objetivo, se
+      devuelve el resultado sin solución sin explorar, con cualquier opción y
+      nivel de traza (sin registros de expansión).
+    - Con traza.NINGUNA, sin empaquetado ni grafo y una heurística declarada
+      admisible, dos jarras vacías con el objetivo en una se resuelven sin
+      buscar (solucion_analitica.solucion_directa): mismo costo óptimo,
+      padre/acción sólo con el camino.
+    - Con reducir_simetrias=True (por defecto), si hay jarras de igual capacidad
+      que el objetivo no distingue y la heurística es la de por defecto, se
+      busca sobre estados canónicos (ver simetrias.py): los registros muestran
+      estados canónicos y padre/acción del resultado incluyen el camino real.
+      No se aplica con empaquetado ni con 'grafo'.
+    """
+    traza.validar_nivel(nivel_traza)
+    if empaquetado and grafo is not None:
+        raise ValueError("'empaquetado' y 'grafo' no se pueden combinar.")
+    simetria = None
+    if reducir_simetrias and not empaquetado and grafo is None and problema._heuristica is None:
+        # Con 'grafo' no: sólo tiene los estados alcanzables desde el inicial real
+        simetria = simetrias.detectar(problema.capacidades, problema.objetivo)
+    problema = problema.con_peso(peso)
+    inalcanzable = solucion_analitica.resultado_inalcanzable(problema, estado_inicial)
+    if inalcanzable is not None:
+        yield traza.RESULTADO, inalcanzable
+        return
+    if nivel_traza == traza.NINGUNA and not empaquetado and grafo is None:
+        directa = solucion_analitica.solucion_directa(problema, estado_inicial)
+        if directa is not None:
+            yield traza.RESULTADO, directa
+            return
+    if empaquetado:
+        yield from estados_empaquetados.iterar_a_estrella_empaquetada(
+            problema, estado_inicial, nivel_traza=nivel_traza, k_frontera=k_frontera,
+            frontera_diferida=frontera_diferida, tipo_frontera=tipo_frontera,
+        )
+        return
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    funcion_heuristica = problema.funcion_heuristica
+    es_estado_final = problema.es_estado_final
+    sucesores = problema.sucesores if grafo is None else grafo.generador_sucesores(problema)
+    estado_inicial_real = estado_inicial
+    if simetria is not None:
+        estado_inicial = simetria.canonica(estado_inicial)
+        sucesores = simetria.sucesores_canonicos(sucesores)
+    con_logs = traza.con_logs(nivel_traza)
+    con_detalle = traza.con_detalle(nivel_traza)
+    frontera_para_log = traza.frontera_para_log
+    if estadisticas is not None:
+        funcion_heuristica = estadisticas.medir_heuristica(funcion_heuristica)
+        sucesores = estadisticas.medir_sucesores(sucesores)
+        frontera_para_log = estadisticas.medir_logs(frontera_para_log)
+
+    bitacora = traza.crear_bitacora(nivel_traza, lambda f, g, s: (f, g, f - g, s), _clave_frontera_estrella,
+                                    diferida=frontera_diferida)
+
+    id_incremental = 0
+    f_inicial = funcion_heuristica(estado_inicial)
+    # Cola de prioridad: (f, id_incremental, estado)
+    frontera = fronteras.crear_frontera(tipo_frontera, problema.costos_acciones, f_inicial)
+    if estadisticas is not None:
+        frontera = estadisticas.medir_frontera(frontera)
+        bitacora = estadisticas.medir_bitacora(bitacora)
+    frontera.push(f_inicial, id_incremental, estado_inicial)
+    if bitacora is not None:
+        bitacora.push(id_incremental, f_inicial, 0, estado_inicial)
+
+    diccionario_padre = {estado_inicial: None}
+    diccionario_accion = {estado_inicial: None}
+    diccionario_costo_acumulado = {estado_inicial: 0}  # g(n)
+
+    def convertir(t):
+        f, _id, s = t
+        g = diccionario_costo_acumulado.get(s)
+        if g is None:
+            return (f, INFINITO, f, s)
+        return (f, g, f - g, s)
+
+    total_descubiertos = 1  # incluye el inicial
+    total_expandidos = 0
+    indice_expansion = 0
+
+    visitados = set()
+
+    while frontera:
+        _valor_funcion_f, identificador, estado_actual = frontera.pop()
+        if bitacora is not None:
+            bitacora.pop(identificador)
+
+        if estado_actual in visitados:
+            continue
+
+        costo_acumulado_actual = diccionario_costo_acumulado[estado_actual]
+
+        if es_estado_final(estado_actual):
+            if con_logs:
+                yield traza.EXPANSION, traza.registro_a_estrella(
+                    indice_expansion, estado_actual, costo_acumulado_actual,
+                    funcion_heuristica(estado_actual), diccionario_accion.get(estado_actual), [], [],
+                    frontera_para_log(frontera, nivel_traza, k_frontera, convertir, _clave_frontera_estrella, bitacora),
+                    0, 0, total_descubiertos, total_expandidos, True, len(frontera),
+                )
+            if simetria is not None:
+                yield traza.RESULTADO, simetria.camino_real(
+                    problema.sucesores, estado_inicial_real, estado_actual, diccionario_padre, diccionario_accion
+                )
+                return
+            yield traza.RESULTADO, (estado_actual, diccionario_padre, diccionario_accion)
+            return
+
+        visitados.add(estado_actual)
+        total_expandidos += 1
+
+        lista_sucesores = []
+        lista_sucesores_anadidos = []
+        descubiertos_este_paso = 0
+
+        for nombre_accion, estado_sucesor, costo_de_accion in sucesores(estado_actual):
+            costo_acumulado_sucesor = costo_acumulado_actual + costo_de_accion
+            heuristica_sucesor = funcion_heuristica(estado_sucesor)
+            valor_funcion_f_sucesor = costo_acumulado_sucesor + heuristica_sucesor
+
+            if con_detalle:
+                lista_sucesores.append((
+                    estado_sucesor,
+                    nombre_accion,
+                    costo_de_accion,
+                    costo_acumulado_sucesor,
+                    heuristica_sucesor,
+                    valor_funcion_f_sucesor
+                ))
+
+            # Si nunca visto o mejora costo g, actualizar y empujar a frontera
+            costo_previo = diccionario_costo_acumulado.get(estado_sucesor)
+            if costo_previo is None or costo_acumulado_sucesor < costo_previo:
+                diccionario_costo_acumulado[estado_sucesor] = costo_acumulado_sucesor
+                diccionario_padre[estado_sucesor] = estado_actual
+                diccionario_accion[estado_sucesor] = nombre_accion
+                id_incremental += 1
+                reemplazado = frontera.push(valor_funcion_f_sucesor, id_incremental, estado_sucesor)
+                if bitacora is not None:
+                    if reemplazado is not None:
+                        bitacora.pop(reemplazado)
+                    bitacora.push(id_incremental, valor_funcion_f_sucesor, costo_acumulado_sucesor,
+                                  estado_sucesor, mejora=costo_previo is not None)
+                if con_detalle:
+                    lista_sucesores_anadidos.append((valor_funcion_f_sucesor, costo_acumulado_sucesor, heuristica_sucesor, estado_sucesor))
+                descubiertos_este_paso += 1
+
+        total_descubiertos += descubiertos_este_paso
+
+        if con_logs:
+            yield traza.EXPANSION, traza.registro_a_estrella(
+                indice_expansion, estado_actual, costo_acumulado_actual,
+                funcion_heuristica(estado_actual), diccionario_accion.get(estado_actual),
+                lista_sucesores, lista_sucesores_anadidos,
+                frontera_para_log(frontera, nivel_traza, k_frontera, convertir, _clave_frontera_estrella, bitacora),
+                descubiertos_este_paso, 1, total_descubiertos, total_expandidos, False, len(frontera),
+            )
+
+        indice_expansion += 1
+
+    yield traza.RESULTADO, (None, diccionario_padre, diccionario_accion)
+
+
+def busqueda_a_estrella(problema, estado_inicial=None, cache=None, **opciones):
+    """
+    Realiza la búsqueda A* sobre 'problema' y devuelve
+    (estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado).
+    Acepta las mismas opciones que iterar_a_estrella (empaquetado, grafo,
+    nivel_traza, k_frontera, tipo_frontera, peso); la frontera completa se guarda como bitácora.
+    Con 'cache' (cache_soluciones.CacheSoluciones) y nivel_traza=traza.NINGUNA
+    se consulta primero el caché (ver resolver).
+    """
+    if cache is not None and opciones.get("nivel_traza") == traza.NINGUNA:
+        return _resultado_desde_solucion(resolver(problema, A_ESTRELLA, estado_inicial, cache, **opciones)[0])
+    return traza.recolectar_logs(
+        iterar_a_estrella(problema, estado_inicial, frontera_diferida=True, **opciones)
+    )
+
+
+# 5) Reconstrucción de la solución
+
+def reconstruir_camino(estado_final, diccionario_padre, diccionario_accion):
+    """
+    Reconstruye la secuencia de (estado, acción_de_entrada) desde el inicial hasta el final.
+    La primera tupla tiene accion_entrada = None.
+    """
+    if estado_final is None:
+        return []
+
+    camino = []
+    estado = estado_final
+    while estado is not None:
+        accion_entrada = diccionario_accion.get(estado)
+        camino.append((estado, accion_entrada))
+        estado = diccionario_padre.get(estado)
+    camino.reverse()
+    return camino
+
+
+# 6) Resolución con caché de soluciones
+
+def resolver(problema, algoritmo=A_ESTRELLA, estado_inicial=None, cache=None, **opciones):
+    """
+    Resuelve 'problema' con 'algoritmo' (A_ESTRELLA o BEST_FIRST) y devuelve
+    (solucion, desde_cache), donde solucion es una cache_soluciones.Solucion
+    (camino, costo, expandidos, descubiertos).
+    - Con 'cache' se busca primero la clave canónica del problema; si no está,
+      se ejecuta la búsqueda y se guarda el resultado.
+    - 'opciones' se pasan a la búsqueda (empaquetado, grafo, tipo_frontera); el nivel de
+      traza se fija en 'resumen' para contar expansiones sin guardar logs.
+    - 'peso' (sólo A_ESTRELLA) pondera la heurística y forma parte de la clave,
+      igual que el resto de las opciones (con sus valores por defecto).
+    - Si la heurística no tiene nombre estable (lambda o función local, ver
+      cache_soluciones.nombre_heuristica) no se usa el caché.
+    - Con A_ESTRELLA se usa la solución directa de dos jarras en los mismos
+      casos que en iterar_a_estrella con traza.NINGUNA (0 expandidos).
+    """
+    if algoritmo not in ITERADORES:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo} (use uno de {', '.join(ITERADORES)})")
+    opciones = dict(opciones)
+    problema = problema.con_peso(opciones.pop("peso", 1))
+    opciones["nivel_traza"] = traza.RESUMEN
+    opciones.pop("k_frontera", None)
+    clave = None
+    if cache is not None:
+        clave = cache_soluciones.clave_problema(problema, algoritmo, estado_inicial,
+                                                _opciones_de_busqueda(ITERADORES[algoritmo], opciones))
+    if clave is not None:
+        solucion = cache.buscar(problema, clave)
+        if solucion is not None:
+            return solucion, True
+
+    expandidos = 0
+    estado_objetivo, diccionario_padre, diccionario_accion = None, {}, {}
+    directa = None
+    if algoritmo == A_ESTRELLA and not opciones.get("empaquetado") and opciones.get("grafo") is None:
+        directa = solucion_analitica.solucion_directa(problema, estado_inicial)
+    if directa is not None:
+        estado_objetivo, diccionario_padre, diccionario_accion = directa
+    else:
+        for tipo, datos in ITERADORES[algoritmo](problema, estado_inicial, **opciones):
+            if tipo == traza.RESULTADO:
+                estado_objetivo, diccionario_padre, diccionario_accion = datos
+            else:
+                expandidos = datos["totales"]["expandidos"]
+
+    camino = reconstruir_camino(estado_objetivo, diccionario_padre, diccionario_accion)
+    costo = sum(problema.obtener_costo_de_accion(accion) for _estado, accion in camino[1:]) if camino else None
+    solucion = cache_soluciones.Solucion(camino, costo, expandidos, len(diccionario_padre))
+    if clave is not None:
+        cache.guardar(problema, clave, solucion)
+    return solucion, False
+
+
+def _opciones_de_busqueda(iterar, opciones):
+    """
+    Opciones de 'iterar' para la clave del caché: los valores por defecto de
+    su firma actualizados con 'opciones' (salvo el nivel de traza, que
+    resolver fija), así que pasar un valor por defecto da la misma clave.
+    """
+    completas = {
+        nombre: parametro.default for nombre, parametro in inspect.signature(iterar).parameters.items()
+        if parametro.default is not inspect.Parameter.empty and nombre != "estado_inicial"
+    }
+    completas.update(opciones)
+    completas.pop("nivel_traza", None)
+    return completas
+
+
+def _resultado_desde_solucion(solucion):
+    """
+    Tupla de busqueda_* armada desde una Solucion: padre y acción sólo
+    contienen los estados del camino y no hay logs.
+    """
+    diccionario_padre = {}
+    diccionario_accion = {}
+    anterior = None
+    for estado, accion in solucion.camino:
+        diccionario_padre[estado] = anterior
+        diccionario_accion[estado] = accion
+        anterior = estado
+    return anterior, diccionario_padre, diccionario_accion, {}
+
+
+ITERADORES = {A_ESTRELLA: iterar_a_estrella, BEST_FIRST: iterar_best_first}
@@ -0,0 +1,252 @@
+# perfilado.py
+# --------------------------------------------------------
+# Contadores y cronómetros por fase de las búsquedas del motor.
+#
+# Fases (segundos de reloj monótono, time.perf_counter):
+#   sucesores : generación de sucesores (acciones posibles + aplicar)
+#   heuristica: evaluaciones de h(n)
+#   frontera  : push / pop / primero de la cola de prioridad
+#   logs      : armado de la frontera de cada registro y bitácora
+#   otros     : el resto del bucle (diccionarios, visitados, registros)
+#   total     : tiempo dentro de la búsqueda (suma de los next() del
+#               iterador, sin contar lo que hace quien la consume)
+#
+# Contadores: pushes, pops, pops descartados (estados ya expandidos,
+# borrado perezoso), reaperturas (push de un estado que ya salió de
+# la frontera), llamadas a la heurística, expandidos y tamaño máximo
+# de la frontera.
+#
+# Costo nulo si no se pide: la búsqueda reemplaza sus funciones y su
+# frontera por versiones medidas sólo cuando recibe 'estadisticas';
+# sin ellas el bucle usa las originales y no hace ninguna comprobación.
+# --------------------------------------------------------
+
+import functools
+from time import perf_counter
+
+import traza
+
+FASES = ("sucesores", "heuristica", "frontera", "logs")
+
+
+class EstadisticasBusqueda:
+    """
+    Estadísticas de una búsqueda (se completan mientras se consume el iterador).
+    - segundos: {fase: segundos} para FASES, más 'otros' y 'total'
+    - pushes, pops, pops_descartados, reaperturas, llamadas_heuristica,
+      expandidos, frontera_maxima, encontrado
+    - por_fase: False si la búsqueda sólo midió el tiempo total (p. ej. con
+      empaquetado, haz o bidireccional)
+    """
+
+    def __init__(self):
+        self.segundos = dict.fromkeys(FASES, 0.0)
+        self.segundos_total = 0.0
+        self.pushes = 0
+        self.pops = 0
+        self.reaperturas = 0
+        self.llamadas_heuristica = 0
+        self.expandidos = 0
+        self.frontera_maxima = 0
+        self.encontrado = False
+        self.por_fase = False
+        self._extraidos = set()
+
+    @property
+    def pops_descartados(self):
+        # Cada pop expande un estado, es el objetivo o se descarta
+        if not self.por_fase:
+            return 0
+        return self.pops - self.expandidos - (1 if self.encontrado else 0)
+
+    def como_diccionario(self):
+        segundos = dict(self.segundos)
+        segundos["otros"] = max(0.0, self.segundos_total - sum(self.segundos.values()))
+        segundos["total"] = self.segundos_total
+        return {
+            "segundos": segundos,
+            "pushes": self.pushes,
+            "pops": self.pops,
+            "pops_descartados": self.pops_descartados,
+            "reaperturas": self.reaperturas,
+            "llamadas_heuristica": self.llamadas_heuristica,
+            "expandidos": self.expandidos,
+            "frontera_maxima": self.frontera_maxima,
+            "encontrado": self.encontrado,
+        }
+
+    def resumen(self):
+        datos = self.como_diccionario()
+        total = datos["segundos"]["total"]
+        if not self.por_fase:
+            return f"Tiempo total: {total * 1000:.2f} ms (sin detalle por fase para esta búsqueda)"
+        fases = " | ".join(
+            f"{fase}: {segundos * 1000:.2f} ms ({segundos / total:.0%})" if total > 0 else f"{fase}: 0 ms"
+            for fase, segundos in datos["segundos"].items() if fase != "total"
+        )
+        return (
+            f"Tiempo total: {total * 1000:.2f} ms | {fases}\n"
+            f"Expandidos: {self.expandidos} | Pushes: {self.pushes} | Pops: {self.pops} "
+            f"(descartados: {self.pops_descartados}) | Reaperturas: {self.reaperturas} | "
+            f"Llamadas a h: {self.llamadas_heuristica} | Frontera máxima: {self.frontera_maxima}"
+        )
+
+    # 1) Versiones medidas de las piezas de la búsqueda
+
+    def medir_sucesores(self, sucesores):
+        segundos = self.segundos
+        self.por_fase = True
+
+        def sucesores_medidos(estado):
+            inicio = perf_counter()
+            resultado = sucesores(estado)
+            segundos["sucesores"] += perf_counter() - inicio
+            self.expandidos += 1
+            return resultado
+
+        return sucesores_medidos
+
+    def medir_heuristica(self, funcion_heuristica):
+        segundos = self.segundos
+
+        def heuristica_medida(estado):
+            inicio = perf_counter()
+            valor = funcion_heuristica(estado)
+            segundos["heuristica"] += perf_counter() - inicio
+            self.llamadas_heuristica += 1
+            return valor
+
+        return heuristica_medida
+
+    def medir_frontera(self, frontera):
+        return _FronteraMedida(frontera, self)
+
+    def medir_logs(self, funcion):
+        """
+        Envuelve una función de armado de logs (p. ej. traza.frontera_para_log).
+        """
+        segundos = self.segundos
+
+        @functools.wraps(funcion)
+        def medida(*args, **kwargs):
+            inicio = perf_counter()
+            resultado = funcion(*args, **kwargs)
+            segundos["logs"] += perf_counter() - inicio
+            return resultado
+
+        return medida
+
+    def medir_bitacora(self, bitacora):
+        return None if bitacora is None else _BitacoraMedida(bitacora, self.segundos)
+
+    # 2) Tiempo total
+
+    def medir_iterador(self, iterador):
+        """
+        Generador que reproduce 'iterador' sumando en 'total' el tiempo de
+        cada next() y marcando 'encontrado' con el resultado final.
+        """
+        while True:
+            inicio = perf_counter()
+            try:
+                tipo, datos = next(iterador)
+            except StopIteration:
+                self.segundos_total += perf_counter() - inicio
+                return
+            self.segundos_total += perf_counter() - inicio
+            if tipo == traza.RESULTADO:
+                self.encontrado = datos[0] is not None
+            yield tipo, datos
+
+
+class _FronteraMedida:
+    """
+    Frontera (ver fronteras.py) que cuenta y cronometra sus operaciones.
+    """
+
+    __slots__ = ("frontera", "estadisticas", "segundos")
+
+    def __init__(self, frontera, estadisticas):
+        self.frontera = frontera
+        self.estadisticas = estadisticas
+        self.segundos = estadisticas.segundos
+
+    def push(self, prioridad, identificador, estado):
+        inicio = perf_counter()
+        reemplazado = self.frontera.push(prioridad, identificador, estado)
+        self.segundos["frontera"] += perf_counter() - inicio
+        estadisticas = self.estadisticas
+        estadisticas.pushes += 1
+        if estado in estadisticas._extraidos:
+            estadisticas.reaperturas += 1
+        tamano = len(self.frontera)
+        if tamano > estadisticas.frontera_maxima:
+            estadisticas.frontera_maxima = tamano
+        return reemplazado
+
+    def pop(self):
+        inicio = perf_counter()
+        elemento = self.frontera.pop()
+        self.segundos["frontera"] += perf_counter() - inicio
+        self.estadisticas.pops += 1
+        self.estadisticas._extraidos.add(elemento[2])
+        return elemento
+
+    def primero(self):
+        inicio = perf_counter()
+        elemento = self.frontera.primero()
+        self.segundos["frontera"] += perf_counter() - inicio
+        return elemento
+
+    def __len__(self):
+        return len(self.frontera)
+
+    def __bool__(self):
+        return bool(self.frontera)
+
+    def __iter__(self):
+        return iter(self.frontera)
+
+
+class _BitacoraMedida:
+    """
+    Bitácora (ver bitacora.py) cuyo push/pop se cuenta como tiempo de logs.
+    """
+
+    __slots__ = ("bitacora", "segundos")
+
+    def __init__(self, bitacora, segundos):
+        self.bitacora = bitacora
+        self.segundos = segundos
+
+    def push(self, *args, **kwargs):
+        inicio = perf_counter()
+        self.bitacora.push(*args, **kwargs)
+        self.segundos["logs"] += perf_counter() - inicio
+
+    def pop(self, identificador):
+        inicio = perf_counter()
+        self.bitacora.pop(identificador)
+        self.segundos["logs"] += perf_counter() - inicio
+
+    def __getattr__(self, nombre):
+        return getattr(self.bitacora, nombre)
+
+    def __len__(self):
+        return len(self.bitacora)
+
+
+def con_estadisticas(iterar):
+    """
+    Decorador de los iterar_* del motor: si se pasa estadisticas=..., el
+    iterador se envuelve con medir_iterador para medir el tiempo total.
+    Sin estadísticas devuelve el iterador original tal cual.
+    """
+    @functools.wraps(iterar)
+    def envoltura(*args, estadisticas=None, **opciones):
+        iterador = iterar(*args, estadisticas=estadisticas, **opciones)
+        if estadisticas is None:
+            return iterador
+        return estadisticas.medir_iterador(iterador)
+
+    return envoltura
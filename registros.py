@@ -0,0 +1,273 @@
+# registros.py
+# --------------------------------------------------------
+# Registros de expansión compactos (logs_por_estado).
+#
+# RegistroAEstrella / RegistroBestFirst: objetos con __slots__ en
+# lugar de un diccionario de 12-14 claves (más el subdiccionario
+# 'totales') por expansión. Se leen como un diccionario de sólo
+# lectura (registro["estado"], .get, in, items, dict(registro)) con
+# las mismas claves y en el mismo orden que antes; 'valor_funcion_f'
+# y 'totales' se calculan al leerlos. Las claves que agregan algunas
+# búsquedas ('direccion', 'ancho_haz') van a un diccionario de extras
+# que sólo existe si se usa.
+#
+# LogsColumnares: logs_por_estado guardado por columnas paralelas.
+# Los campos enteros (índice, g, h, contadores) van en array('q') y
+# es_objetivo en array('b'): 8 y 1 bytes por expansión, sin un objeto
+# int por valor. Si una columna recibe un valor que no es entero
+# (h infinita, g con costos reales) pasa a ser una lista. Estados,
+# acciones, sucesores y frontera quedan en listas. Cada registro se
+# arma recién al leerlo.
+# --------------------------------------------------------
+
+from array import array
+from collections.abc import Mapping
+
+
+# 1) Registros con __slots__
+
+class _Registro(Mapping):
+    """
+    Base de los registros: vista de diccionario de sólo lectura sobre los slots.
+    - CLAVES: claves del registro, en el orden del diccionario original
+    - CAMPOS: slots guardados, en el orden del constructor
+    - ENTEROS / BOOLEANOS: campos que LogsColumnares guarda en arrays
+    """
+
+    __slots__ = ("_extras",)
+
+    CLAVES = ()
+    CAMPOS = ()
+    ENTEROS = ()
+    BOOLEANOS = ()
+
+    def __getitem__(self, clave):
+        if clave in self._CONJUNTO_CLAVES:
+            return getattr(self, clave)
+        if self._extras is not None and clave in self._extras:
+            return self._extras[clave]
+        raise KeyError(clave)
+
+    def __setitem__(self, clave, valor):
+        if clave in self._CONJUNTO_CAMPOS:
+            setattr(self, clave, valor)
+        elif clave in self._CONJUNTO_CLAVES:
+            raise TypeError(f"'{clave}' se calcula a partir de otros campos del registro")
+        else:
+            if self._extras is None:
+                self._extras = {}
+            self._extras[clave] = valor
+
+    def __iter__(self):
+        yield from self.CLAVES
+        if self._extras is not None:
+            yield from self._extras
+
+    def __len__(self):
+        return len(self.CLAVES) + (0 if self._extras is None else len(self._extras))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        valores = tuple(getattr(self, campo) for campo in self.CAMPOS)
+        return _reconstruir, (type(self), valores, self._extras)
+
+    def __init_subclass__(cls, **opciones):
+        super().__init_subclass__(**opciones)
+        cls._CONJUNTO_CLAVES = frozenset(cls.CLAVES)
+        cls._CONJUNTO_CAMPOS = frozenset(cls.CAMPOS)
+
+
+def _reconstruir(clase, valores, extras):
+    registro = clase(*valores)
+    registro._extras = extras
+    return registro
+
+
+class RegistroBestFirst(_Registro):
+    """
+    Registro de una expansión de Best-First (claves de traza.registro_best_first).
+    """
+
+    __slots__ = ("expansion_index", "estado", "heuristica", "accion_entrada", "sucesores",
+                 "sucesores_anadidos", "frontera_total", "nuevos_descubiertos", "expandidos_este_paso",
+                 "total_descubiertos", "total_expandidos", "es_objetivo", "tamano_frontera")
+
+    CLAVES = ("expansion_index", "estado", "heuristica", "accion_entrada", "sucesores", "sucesores_anadidos",
+              "frontera_total", "nuevos_descubiertos", "expandidos_este_paso", "totales", "es_objetivo",
+              "tamano_frontera")
+    CAMPOS = __slots__
+    ENTEROS = ("expansion_index", "heuristica", "nuevos_descubiertos", "expandidos_este_paso",
+               "total_descubiertos", "total_expandidos", "tamano_frontera")
+    BOOLEANOS = ("es_objetivo",)
+
+    def __init__(self, expansion_index, estado, heuristica, accion_entrada, sucesores, sucesores_anadidos,
+                 frontera_total, nuevos_descubiertos, expandidos_este_paso, total_descubiertos,
+                 total_expandidos, es_objetivo, tamano_frontera):
+        self.expansion_index = expansion_index
+        self.estado = estado
+        self.heuristica = heuristica
+        self.accion_entrada = accion_entrada
+        self.sucesores = sucesores
+        self.sucesores_anadidos = sucesores_anadidos
+        self.frontera_total = frontera_total
+        self.nuevos_descubiertos = nuevos_descubiertos
+        self.expandidos_este_paso = expandidos_este_paso
+        self.total_descubiertos = total_descubiertos
+        self.total_expandidos = total_expandidos
+        self.es_objetivo = es_objetivo
+        self.tamano_frontera = tamano_frontera
+        self._extras = None
+
+    @property
+    def totales(self):
+        return {"descubiertos": self.total_descubiertos, "expandidos": self.total_expandidos}
+
+
+class RegistroAEstrella(_Registro):
+    """
+    Registro de una expansión de A* (claves de traza.registro_a_estrella).
+    """
+
+    __slots__ = ("indice_de_expansion", "estado", "costo_acumulado_g", "heuristica_h", "accion_entrada",
+                 "sucesores", "sucesores_anadidos", "frontera_total", "nuevos_descubiertos",
+                 "expandidos_este_paso", "total_descubiertos", "total_expandidos", "es_objetivo",
+                 "tamano_frontera")
+
+    CLAVES = ("indice_de_expansion", "estado", "costo_acumulado_g", "heuristica_h", "valor_funcion_f",
+              "accion_entrada", "sucesores", "sucesores_anadidos", "frontera_total", "nuevos_descubiertos",
+              "expandidos_este_paso", "totales", "es_objetivo", "tamano_frontera")
+    CAMPOS = __slots__
+    ENTEROS = ("indice_de_expansion", "costo_acumulado_g", "heuristica_h", "nuevos_descubiertos",
+               "expandidos_este_paso", "total_descubiertos", "total_expandidos", "tamano_frontera")
+    BOOLEANOS = ("es_objetivo",)
+
+    def __init__(self, indice_de_expansion, estado, costo_acumulado_g, heuristica_h, accion_entrada,
+                 sucesores, sucesores_anadidos, frontera_total, nuevos_descubiertos, expandidos_este_paso,
+                 total_descubiertos, total_expandidos, es_objetivo, tamano_frontera):
+        self.indice_de_expansion = indice_de_expansion
+        self.estado = estado
+        self.costo_acumulado_g = costo_acumulado_g
+        self.heuristica_h = heuristica_h
+        self.accion_entrada = accion_entrada
+        self.sucesores = sucesores                      # (estado, accion, costo_accion, g, h, f)
+        self.sucesores_anadidos = sucesores_anadidos    # (f, g, h, estado)
+        self.frontera_total = frontera_total            # (f, g, h, estado)
+        self.nuevos_descubiertos = nuevos_descubiertos
+        self.expandidos_este_paso = expandidos_este_paso
+        self.total_descubiertos = total_descubiertos
+        self.total_expandidos = total_expandidos
+        self.es_objetivo = es_objetivo
+        self.tamano_frontera = tamano_frontera
+        self._extras = None
+
+    @property
+    def valor_funcion_f(self):
+        return self.costo_acumulado_g + self.heuristica_h
+
+    @property
+    def totales(self):
+        return {"descubiertos": self.total_descubiertos, "expandidos": self.total_expandidos}
+
+
+# 2) logs_por_estado por columnas
+
+def _agregar(columnas, campo, valor, tipo):
+    """
+    Agrega 'valor' a la columna 'campo'; si no entra en el array, la columna pasa a lista.
+    """
+    columna = columnas[campo]
+    if type(columna) is array:
+        if type(valor) is tipo:
+            try:
+                columna.append(valor)
+                return
+            except OverflowError:
+                pass
+        columna = [bool(v) for v in columna] if tipo is bool else columna.tolist()
+        columnas[campo] = columna
+    columna.append(valor)
+
+
+class LogsColumnares(Mapping):
+    """
+    logs_por_estado de sólo lectura (clave -> registro) guardado en columnas
+    paralelas; cada registro se reconstruye al leerlo. Si una clave se repite,
+    vale el último registro (igual que en un diccionario). Los registros que
+    no son del tipo del primero (p. ej. diccionarios) se guardan tal cual.
+    """
+
+    def __init__(self):
+        self._filas = {}
+        self._clase = None
+        self._columnas = None
+        self._extras = []
+        self._sueltos = {}
+
+    def agregar(self, clave, registro):
+        clase = type(registro)
+        if self._clase is None and isinstance(registro, _Registro):
+            self._clase = clase
+            self._columnas = {}
+            for campo in clase.CAMPOS:
+                if campo in clase.ENTEROS:
+                    self._columnas[campo] = array("q")
+                elif campo in clase.BOOLEANOS:
+                    self._columnas[campo] = array("b")
+                else:
+                    self._columnas[campo] = []
+        if clase is not self._clase:
+            self._filas.pop(clave, None)
+            self._sueltos[clave] = registro
+            return
+
+        columnas = self._columnas
+        enteros = clase.ENTEROS
+        booleanos = clase.BOOLEANOS
+        for campo in clase.CAMPOS:
+            valor = getattr(registro, campo)
+            if campo in enteros:
+                _agregar(columnas, campo, valor, int)
+            elif campo in booleanos:
+                _agregar(columnas, campo, valor, bool)
+            else:
+                columnas[campo].append(valor)
+        self._extras.append(registro._extras)
+        self._sueltos.pop(clave, None)
+        self._filas[clave] = len(self._extras) - 1
+
+    def _registro(self, fila):
+        columnas = self._columnas
+        booleanos = self._clase.BOOLEANOS
+        valores = []
+        for campo in self._clase.CAMPOS:
+            columna = columnas[campo]
+            valor = columna[fila]
+            if campo in booleanos and type(columna) is array:
+                valor = bool(valor)
+            valores.append(valor)
+        registro = self._clase(*valores)
+        extras = self._extras[fila]
+        if extras is not None:
+            registro._extras = dict(extras)
+        return registro
+
+    def __getitem__(self, clave):
+        fila = self._filas.get(clave)
+        if fila is not None:
+            return self._registro(fila)
+        return self._sueltos[clave]
+
+    def __contains__(self, clave):
+        return clave in self._filas or clave in self._sueltos
+
+    def __iter__(self):
+        yield from self._filas
+        yield from self._sueltos
+
+    def __len__(self):
+        return len(self._filas) + len(self._sueltos)
+
+    def __repr__(self):
+        return f"LogsColumnares({len(self)} registros)"
@@ -6,8 +6,14 @@
 # - Incluye un modo "paso a paso" interactivo opcional.
 # ------------------------------------------------------
 import argparse
+import sys
 import time
 import jarras as problema_jarras
+import cache_soluciones
+import fronteras
+import perfilado
+import salida_estructurada
+import traza
 
 
 def mostrar_camino_solucion(camino_solucion, pausa_segundos=0.0, modo_interactivo=False):
@@ -58,16 +64,100 @@ def _tabla_ascii_frontera(frontera_total):
     return "\n".join([primera, separador, segunda])
 
 
-def imprimir_logs_formateados(camino_solucion, logs_por_estado, pausa_segundos=0.0, modo_interactivo=False):
+def _imprimir_detalle_expansion(log):
+    """
+    Imprime sucesores, añadidos y frontera de un log de expansión.
+    """
+    print("  Sucesores descubiertos (estado, acción, h):")
+    for (suc, acc, h_suc) in log["sucesores"]:
+        print(f"    - {suc}  <- {problema_jarras.descripcion_de_accion(acc)}  [h={h_suc}]")
+
+    if log["sucesores_anadidos"]:
+        añadidos_str = ", ".join([f"h={h}:{s}" for (h, s) in log["sucesores_anadidos"]])
+    else:
+        añadidos_str = ""
+    print(f"  Sucesores añadidos: [{añadidos_str}]")
+
+    if log["frontera_total"]:
+        frontera_str = ", ".join([f"h={h}:{s}" for (h, s) in log["frontera_total"]])
+    else:
+        frontera_str = ""
+    print(f"  Frontera total: [{frontera_str}]")
+    omitidos = log.get("tamano_frontera", 0) - len(log["frontera_total"])
+    if omitidos > 0:
+        print(f"  ... y {omitidos} elementos más en la frontera")
+
+    # También mostrar la cola como tabla ASCII (estados/posición)
+    if log["frontera_total"]:
+        print("  Cola (formato tabla):")
+        print(_tabla_ascii_frontera(log["frontera_total"]))
+
+
+ENCABEZADO = "Solución Solución Best-First con heurística |J5-2|:\n\n"
+
+
+def _imprimir_expansion(idx, log, nivel_traza=traza.COMPLETA):
+    """
+    Imprime el bloque de una expansión (paso 'idx' en orden real).
+    """
+    estado = log["estado"]
+    accion_entrada = log.get("accion_entrada")
+    descripcion = problema_jarras.descripcion_de_accion(accion_entrada)
+
+    print(f"- Paso {idx:02d} | Estado {estado} <- {descripcion}")
+    print(f"  Expansión #{log['expansion_index']:02d} (orden real) | h={log['heuristica']}")
+    if traza.con_detalle(nivel_traza):
+        _imprimir_detalle_expansion(log)
+
+    print(
+        f"  Nuevos   | Descubiertos únicos: {log['nuevos_descubiertos']}  |  Expandidos: {log['expandidos_este_paso']}"
+    )
+    print(
+        f"  Totales  | Descubiertos: {log['totales']['descubiertos']}  |  Expandidos: {log['totales']['expandidos']}"
+    )
+    if idx == 0:
+        print("  Nota: 'Descubiertos' totales incluyen el estado inicial.")
+        print(
+            "  Nota: El contador de descubiertos incluye solo sucesores realmente nuevos (únicos) agregados a la frontera; los ya vistos no incrementan el total."
+        )
+    print("")
+
+
+def _imprimir_objetivo(numero_paso, obj):
+    """
+    Imprime el bloque del estado objetivo (detectado, no expandido).
+    """
+    estado = obj["estado"]
+    print(f"- Paso {numero_paso:02d} | Estado {estado} <- {problema_jarras.descripcion_de_accion(obj.get('accion_entrada'))}")
+    print("  [Objetivo detectado: no se expandió]")
+    print("  Nuevos   | Descubiertos únicos: 0  |  Expandidos: 0")
+    print("")
+    print(f"Estado final alcanzado: {estado}")
+
+
+def _esperar_entre_pasos(pausa_segundos, modo_interactivo, hay_siguiente):
+    """
+    Interacción / pausa entre pasos: ENTER si hay un paso siguiente en modo
+    interactivo; si no, la pausa indicada.
+    """
+    if modo_interactivo and hay_siguiente:
+        input("Presiona ENTER para continuar...")
+    elif pausa_segundos > 0:
+        time.sleep(pausa_segundos)
+
+
+def imprimir_logs_formateados(camino_solucion, logs_por_estado, pausa_segundos=0.0, modo_interactivo=False,
+                              nivel_traza=traza.COMPLETA):
     """
     Imprime los logs de expansión de acuerdo al formato solicitado por el usuario.
     Se asume que 'camino_solucion' y 'logs_por_estado' provienen de la misma ejecución.
+    Con nivel_traza=traza.RESUMEN sólo se imprimen los contadores de cada expansión.
     """
     if not camino_solucion:
         return
 
     # Encabezado global
-    print("Solución Solución Best-First con heurística |J5-2|:\n\n")
+    print(ENCABEZADO)
 
     # Mostrar TODAS las expansiones en orden real (orden de extracción de la frontera)
     # Ordenamos por 'expansion_index' los logs que no sean objetivo y que se hayan expandido.
@@ -75,72 +165,79 @@ def imprimir_logs_formateados(camino_solucion, logs_por_estado, pausa_segundos=0
     logs_expandidos.sort(key=lambda x: x["expansion_index"])
 
     for idx, log in enumerate(logs_expandidos):
-        estado = log["estado"]
-        accion_entrada = log.get("accion_entrada")
-        descripcion = problema_jarras.descripcion_de_accion(accion_entrada)
-
-        print(f"- Paso {idx:02d} | Estado {estado} <- {descripcion}")
-        print(f"  Expansión #{log['expansion_index']:02d} (orden real) | h={log['heuristica']}")
-        print("  Sucesores descubiertos (estado, acción, h):")
-        for (suc, acc, h_suc) in log["sucesores"]:
-            print(f"    - {suc}  <- {problema_jarras.descripcion_de_accion(acc)}  [h={h_suc}]")
-
-        if log["sucesores_anadidos"]:
-            añadidos_str = ", ".join([f"h={h}:{s}" for (h, s) in log["sucesores_anadidos"]])
-        else:
-            añadidos_str = ""
-        print(f"  Sucesores añadidos: [{añadidos_str}]")
-
-        if log["frontera_total"]:
-            frontera_str = ", ".join([f"h={h}:{s}" for (h, s) in log["frontera_total"]])
-        else:
-            frontera_str = ""
-        print(f"  Frontera total: [{frontera_str}]")
-
-        # También mostrar la cola como tabla ASCII (estados/posición)
-        if log["frontera_total"]:
-            print("  Cola (formato tabla):")
-            print(_tabla_ascii_frontera(log["frontera_total"]))
-
-        print(
-            f"  Nuevos   | Descubiertos únicos: {log['nuevos_descubiertos']}  |  Expandidos: {log['expandidos_este_paso']}"
-        )
-        print(
-            f"  Totales  | Descubiertos: {log['totales']['descubiertos']}  |  Expandidos: {log['totales']['expandidos']}"
-        )
-        if idx == 0:
-            print("  Nota: 'Descubiertos' totales incluyen el estado inicial.")
-            print(
-                "  Nota: El contador de descubiertos incluye solo sucesores realmente nuevos (únicos) agregados a la frontera; los ya vistos no incrementan el total."
-            )
-        print("")
-
-        # Interacción / pausa entre pasos
-        if modo_interactivo and idx < len(logs_expandidos) - 1:
-            input("Presiona ENTER para continuar...")
-        elif pausa_segundos > 0:
-            time.sleep(pausa_segundos)
+        _imprimir_expansion(idx, log, nivel_traza)
+        _esperar_entre_pasos(pausa_segundos, modo_interactivo, idx < len(logs_expandidos) - 1)
 
     # Imprimir el objetivo si está en logs y no fue expandido
     objetivos = [v for v in logs_por_estado.values() if v.get("es_objetivo")]
     if objetivos:
-        obj = objetivos[0]
-        estado = obj["estado"]
-        print(f"- Paso {len(logs_expandidos):02d} | Estado {estado} <- {problema_jarras.descripcion_de_accion(obj.get('accion_entrada'))}")
-        print("  [Objetivo detectado: no se expandió]")
-        print("  Nuevos   | Descubiertos únicos: 0  |  Expandidos: 0")
-        print("")
-        print(f"Estado final alcanzado: {estado}")
+        _imprimir_objetivo(len(logs_expandidos), objetivos[0])
 
 
-def ejecutar_busqueda_y_mostrar(pausa_segundos=0.0, modo_interactivo=False):
+def imprimir_logs_en_vivo(iterador, pausa_segundos=0.0, modo_interactivo=False, nivel_traza=traza.COMPLETA):
+    """
+    Imprime cada expansión apenas la produce 'iterador' (jarras.iterar_best_first),
+    sin esperar a que termine la búsqueda ni guardar los logs.
+    Devuelve (estado_objetivo, diccionario_padre, diccionario_accion).
+    """
+    resultado = (None, {}, {})
+    expandidos = 0
+    pendiente = False  # hay una expansión impresa que aún no tuvo su pausa
+    ancho_haz = None   # búsqueda en haz: cambia si se reintenta con un haz más ancho
+    for tipo, datos in iterador:
+        if tipo == traza.RESULTADO:
+            resultado = datos
+            continue
+        if ancho_haz is not None and datos.get("ancho_haz") != ancho_haz:
+            print(f"\nEl haz se quedó sin salida; se reintenta con ancho {datos['ancho_haz']}.\n")
+        ancho_haz = datos.get("ancho_haz")
+        if pendiente:
+            _esperar_entre_pasos(pausa_segundos, modo_interactivo, not datos["es_objetivo"])
+            pendiente = False
+        elif expandidos == 0:
+            print(ENCABEZADO)
+        if datos["es_objetivo"]:
+            _imprimir_objetivo(expandidos, datos)
+            continue
+        _imprimir_expansion(expandidos, datos, nivel_traza)
+        expandidos += 1
+        pendiente = True
+    if pendiente:
+        _esperar_entre_pasos(pausa_segundos, modo_interactivo, False)
+    return resultado
+
+
+def ejecutar_busqueda_y_mostrar(pausa_segundos=0.0, modo_interactivo=False, nivel_traza=traza.COMPLETA,
+                                k_frontera=traza.K_FRONTERA_POR_DEFECTO, cache=None, tipo_frontera=fronteras.AUTOMATICA,
+                                ancho_haz=None, ampliar_haz=False, estadisticas=False):
     """
     Ejecuta la búsqueda Best-First del módulo 'jarras' y muestra el resultado.
+    Las expansiones se imprimen a medida que la búsqueda las produce.
     Además imprime estadísticas simples del recorrido.
+    Con nivel_traza=traza.NINGUNA no se generan logs y sólo se muestra el camino;
+    en ese caso, si se pasa 'cache' (cache_soluciones.CacheSoluciones), la
+    solución se toma del caché cuando ya fue resuelta.
+    'tipo_frontera' elige la cola de prioridad (ver fronteras.py).
+    Con 'ancho_haz' es búsqueda en haz (ver busqueda_haz.py); con ampliar_haz=True
+    se reintenta con un haz más ancho si se queda sin salida.
+    Con estadisticas=True imprime al final los tiempos por fase y los contadores
+    de la búsqueda (perfilado.py); no cuentan el tiempo de impresión.
     """
-    # 1) Ejecutar búsqueda
-    estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado = problema_jarras.busqueda_best_first(
-        problema_jarras.obtener_estado_inicial()
+    if cache is not None and not traza.con_logs(nivel_traza):
+        _mostrar_solucion_con_cache(cache, pausa_segundos, modo_interactivo, ancho_haz, ampliar_haz)
+        return
+
+    # 1) Ejecutar búsqueda e imprimir cada expansión al vuelo
+    medicion = perfilado.EstadisticasBusqueda() if estadisticas else None
+    iterador = problema_jarras.iterar_best_first(
+        problema_jarras.obtener_estado_inicial(), nivel_traza=nivel_traza, k_frontera=k_frontera,
+        tipo_frontera=tipo_frontera, ancho_haz=ancho_haz, ampliar_haz=ampliar_haz, estadisticas=medicion
+    )
+    estado_objetivo, diccionario_padre, diccionario_accion = imprimir_logs_en_vivo(
+        iterador,
+        pausa_segundos=pausa_segundos,
+        modo_interactivo=modo_interactivo,
+        nivel_traza=nivel_traza,
     )
 
     # 2) Reconstruir el camino solución
@@ -148,22 +245,57 @@ def ejecutar_busqueda_y_mostrar(pausa_segundos=0.0, modo_interactivo=False):
         estado_objetivo, diccionario_padre, diccionario_accion
     )
 
-    # 3) Mostrar logs detallados
-    imprimir_logs_formateados(
-        camino_solucion,
-        logs_por_estado,
-        pausa_segundos=pausa_segundos,
-        modo_interactivo=modo_interactivo,
+    # 3) Sin traza: mostrar sólo el camino
+    if not traza.con_logs(nivel_traza):
+        print("Solución Solución Best-First con heurística |J5-2|:\n")
+        mostrar_camino_solucion(camino_solucion, pausa_segundos, modo_interactivo)
+
+    _imprimir_resumen(camino_solucion, len(diccionario_padre))
+    if medicion is not None:
+        print(f"\nEstadísticas de la búsqueda:\n{medicion.resumen()}")
+
+
+def ejecutar_busqueda_y_volcar(formato, ruta_salida=None, nivel_traza=traza.COMPLETA,
+                               k_frontera=traza.K_FRONTERA_POR_DEFECTO, tipo_frontera=fronteras.AUTOMATICA,
+                               ancho_haz=None, ampliar_haz=False, estadisticas=False):
+    """
+    Ejecuta la búsqueda Best-First y escribe cada registro de expansión y el
+    resultado en 'formato' (json, ndjson o csv, ver salida_estructurada.py)
+    en 'ruta_salida' (gzip si termina en '.gz') o en la salida estándar.
+    Con estadisticas=True el resumen de perfilado va a la salida de errores.
+    """
+    medicion = perfilado.EstadisticasBusqueda() if estadisticas else None
+    iterador = problema_jarras.iterar_best_first(
+        problema_jarras.obtener_estado_inicial(), nivel_traza=nivel_traza, k_frontera=k_frontera,
+        tipo_frontera=tipo_frontera, ancho_haz=ancho_haz, ampliar_haz=ampliar_haz, estadisticas=medicion
     )
+    salida_estructurada.volcar_a(ruta_salida, iterador, formato, problema_jarras.PROBLEMA.obtener_costo_de_accion)
+    if medicion is not None:
+        print(f"Estadísticas de la búsqueda:\n{medicion.resumen()}", file=sys.stderr)
+
+
+def _mostrar_solucion_con_cache(cache, pausa_segundos=0.0, modo_interactivo=False, ancho_haz=None,
+                                ampliar_haz=False):
+    """
+    Muestra sólo el camino (sin traza), tomándolo del caché si ya fue resuelto.
+    """
+    solucion, _desde_cache = problema_jarras.resolver(cache=cache, ancho_haz=ancho_haz, ampliar_haz=ampliar_haz)
+    print("Solución Solución Best-First con heurística |J5-2|:\n")
+    mostrar_camino_solucion(solucion.camino, pausa_segundos, modo_interactivo)
+    _imprimir_resumen(solucion.camino, solucion.descubiertos)
 
+
+def _imprimir_resumen(camino_solucion, total_estados_explorados):
+    """
+    Imprime el largo del camino, el estado final y las métricas simples.
+    """
     # Línea adicional requerida por el ejemplo
     print(f"Camino solución reconstruido con {len(camino_solucion)} pasos")
     if camino_solucion:
         print(f"Estado final alcanzado: {camino_solucion[-1][0]}\n")
 
-    # 4) Métricas simples
+    # Métricas simples
     total_pasos = max(len(camino_solucion) - 1, 0)  # acciones ejecutadas
-    total_estados_explorados = len(diccionario_padre)
     print(f"\nResumen:")
     print(f"- Acciones ejecutadas: {total_pasos}")
     print(f"- Estados descubiertos (nodos generados): {total_estados_explorados}")
@@ -187,6 +319,61 @@ def construir_argumentos():
         action="store_true",
         help="Muestra los pasos en modo interactivo (ENTER para avanzar)."
     )
+    parser.add_argument(
+        "--traza",
+        choices=traza.NIVELES,
+        default=traza.COMPLETA,
+        help="Nivel de traza: ninguna (sólo el camino), resumen (contadores), topk (frontera recortada) o completa."
+    )
+    parser.add_argument(
+        "--k-frontera",
+        type=int,
+        default=traza.K_FRONTERA_POR_DEFECTO,
+        help="Elementos de la frontera a mostrar con --traza topk. Ejemplo: --k-frontera 5"
+    )
+    parser.add_argument(
+        "--frontera",
+        choices=fronteras.TIPOS,
+        default=fronteras.AUTOMATICA,
+        help="Cola de prioridad: automatica (cubetas si las prioridades son enteras), heap (borrado perezoso), indexada (decrease-key) o cubetas (Dial)."
+    )
+    parser.add_argument(
+        "--haz",
+        type=int,
+        default=None,
+        help="Búsqueda en haz: a lo sumo N estados por capa (memoria acotada). Ejemplo: --haz 2"
+    )
+    parser.add_argument(
+        "--ampliar-haz",
+        action="store_true",
+        help="Con --haz, si el haz se queda sin salida se reintenta con el doble de ancho."
+    )
+    parser.add_argument(
+        "--formato",
+        choices=salida_estructurada.FORMATOS,
+        default=salida_estructurada.TEXTO,
+        help="Formato de salida: texto (legible) o json, ndjson y csv (un registro por expansión, para procesar)."
+    )
+    parser.add_argument(
+        "--salida",
+        default=None,
+        help="Con --formato json/ndjson/csv, archivo de salida (comprimido con gzip si termina en .gz; por defecto, stdout)."
+    )
+    parser.add_argument(
+        "--estadisticas",
+        action="store_true",
+        help="Imprime tiempos por fase (sucesores, heurística, frontera, logs) y contadores de la búsqueda."
+    )
+    parser.add_argument(
+        "--cache",
+        default=None,
+        help="Archivo del caché de soluciones usado con --traza ninguna (por defecto $JARRAS_CACHE o ~/.cache/jarras/soluciones.bin)."
+    )
+    parser.add_argument(
+        "--sin-cache",
+        action="store_true",
+        help="No consulta ni actualiza el caché de soluciones."
+    )
     return parser
 
 
@@ -199,10 +386,49 @@ def main():
         print("El valor de --pausa no puede ser negativo. Se usará 0.0.")
         argumentos.pausa = 0.0
 
-    ejecutar_busqueda_y_mostrar(
-        pausa_segundos=argumentos.pausa,
-        modo_interactivo=argumentos.interactivo
-    )
+    if argumentos.k_frontera < 1:
+        print("El valor de --k-frontera debe ser al menos 1. Se usará 1.")
+        argumentos.k_frontera = 1
+
+    if argumentos.haz is not None and argumentos.haz < 1:
+        print("El valor de --haz debe ser al menos 1. Se usará 1.")
+        argumentos.haz = 1
+
+    if argumentos.formato != salida_estructurada.TEXTO:
+        ejecutar_busqueda_y_volcar(
+            argumentos.formato,
+            ruta_salida=argumentos.salida,
+            nivel_traza=argumentos.traza,
+            k_frontera=argumentos.k_frontera,
+            tipo_frontera=argumentos.frontera,
+            ancho_haz=argumentos.haz,
+            ampliar_haz=argumentos.ampliar_haz,
+            estadisticas=argumentos.estadisticas,
+        )
+        return
+    if argumentos.salida is not None:
+        parser.error("--salida sólo se usa con --formato json, ndjson o csv.")
+
+    # El caché sólo se usa sin traza (con traza hace falta recorrer la búsqueda)
+    cache = None
+    if not argumentos.sin_cache and not argumentos.estadisticas and not traza.con_logs(argumentos.traza):
+        cache = cache_soluciones.CacheSoluciones(argumentos.cache)
+
+    try:
+        ejecutar_busqueda_y_mostrar(
+            pausa_segundos=argumentos.pausa,
+            modo_interactivo=argumentos.interactivo,
+            nivel_traza=argumentos.traza,
+            k_frontera=argumentos.k_frontera,
+            cache=cache,
+            tipo_frontera=argumentos.frontera,
+            ancho_haz=argumentos.haz,
+            ampliar_haz=argumentos.ampliar_haz,
+            estadisticas=argumentos.estadisticas,
+        )
+    finally:
+        if cache is not None:
+            cache.cerrar()
 
 
 if __name__ == "__main__":
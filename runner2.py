@@ -7,8 +7,18 @@
 # - Incluye un modo "paso a paso" interactivo opcional.
 # ------------------------------------------------------
 import argparse
+import math
+import sys
 import time
+from itertools import islice
 import jarras_a_estrella as problema_jarras
+import ara_estrella
+import cache_soluciones
+import fronteras
+import ida_estrella
+import perfilado
+import salida_estructurada
+import traza
 
 # Ayudado con gpt porque son demasiados prints 
 
@@ -75,119 +85,345 @@ def _tabla_ascii_vertical(headers, filas):
     return "\n".join(lineas)
 
 
-def imprimir_logs_formateados_estrella(camino_solucion, logs_por_estado, pausa_segundos=0.0, modo_interactivo=False):
+class PaginaFrontera:
+    """
+    Página de la frontera a imprimir (--max-filas / --pagina): las filas
+    [(pagina-1)·max_filas, pagina·max_filas) en el orden de la frontera.
+    - k_frontera: cuántos menores tiene que seleccionar la búsqueda (traza
+      'topk', nsmallest) para cubrir la página, sin ordenar toda la frontera
+    - anchos: anchos de columna cacheados entre pasos; parten de cotas
+      precalculadas (último índice de la página, estado con las capacidades)
+      y sólo crecen con las filas impresas, nunca se recorre la frontera entera
+    """
+
+    ENCABEZADOS = ("Idx", "Estado", "g", "h", "f")
+
+    def __init__(self, max_filas, pagina=1, capacidades=problema_jarras.PROBLEMA.capacidades):
+        self.max_filas = max_filas
+        self.pagina = pagina
+        self.desde = (pagina - 1) * max_filas
+        self.k_frontera = pagina * max_filas
+        self.anchos = [len(encabezado) for encabezado in self.ENCABEZADOS]
+        self.anchos[0] = max(self.anchos[0], len(str(self.k_frontera - 1)))
+        self.anchos[1] = max(self.anchos[1], len(str(tuple(capacidades))))
+
+    def tabla(self, frontera_total):
+        """
+        Tabla ASCII (Idx, Estado, g, h, f) de las filas de la página
+        ('frontera_total' ya viene ordenada); "" si la página quedó vacía.
+        """
+        anchos = self.anchos
+        filas = []
+        for idx, (f, g, h, s) in enumerate(islice(frontera_total, self.desde, self.k_frontera), self.desde):
+            fila = (str(idx), str(s), str(g), str(h), f"{f:.0f}")
+            for i, celda in enumerate(fila):
+                if len(celda) > anchos[i]:
+                    anchos[i] = len(celda)
+            filas.append(fila)
+        if not filas:
+            return ""
+
+        separador = "+" + "+".join("-" * (ancho + 2) for ancho in anchos) + "+"
+        formato = "| " + " | ".join(f"{{:<{ancho}}}" for ancho in anchos) + " |"
+        lineas = [separador, formato.format(*self.ENCABEZADOS), separador]
+        lineas.extend(formato.format(*fila) for fila in filas)
+        lineas.append(separador)
+        return "\n".join(lineas)
+
+    def linea_omitidos(self, tamano_frontera):
+        """
+        Línea con la cantidad de elementos de la frontera fuera de la página
+        ("" si se mostraron todos).
+        """
+        mostrados = max(0, min(self.k_frontera, tamano_frontera) - self.desde)
+        omitidos = tamano_frontera - mostrados
+        if omitidos <= 0:
+            return ""
+        paginas = max(1, math.ceil(tamano_frontera / self.max_filas))
+        return (
+            f"  ... {omitidos} elementos de la frontera no mostrados "
+            f"(página {self.pagina} de {paginas}, {self.max_filas} filas por página)"
+        )
+
+
+def _imprimir_frontera_paginada(log, pagina):
+    """
+    Imprime sólo la página pedida de la frontera y la cantidad de elementos omitidos.
+    """
+    tabla = pagina.tabla(log["frontera_total"])
+    print(f"  Frontera total (tabla, página {pagina.pagina}):")
+    print(tabla if tabla else "  (sin elementos en esta página)")
+    omitidos = pagina.linea_omitidos(log.get("tamano_frontera", len(log["frontera_total"])))
+    if omitidos:
+        print(omitidos)
+
+
+def _imprimir_detalle_expansion_estrella(log, pagina=None):
+    """
+    Imprime las tablas de sucesores, añadidos, frontera y cola de un log A*.
+    Con 'pagina' (PaginaFrontera) la frontera se imprime una sola vez y
+    sólo las filas de esa página.
+    """
+    # Sucesores como tabla vertical
+    filas_sucesores = []
+    for i, (suc, acc, cacc, g_suc, h_suc, f_suc) in enumerate(log["sucesores"]):
+        filas_sucesores.append([
+            str(i),
+            str(suc),
+            problema_jarras.descripcion_de_accion(acc),
+            str(cacc),
+            str(g_suc),
+            str(h_suc),
+            f"{f_suc:.0f}",
+        ])
+    if not filas_sucesores:
+        filas_sucesores = [["-", "(sin sucesores)", "-", "-", "-", "-", "-"]]
+    print("  Sucesores (tabla):")
+    print(
+        _tabla_ascii_vertical(
+            ["Idx", "Estado", "Acción", "c", "g", "h", "f"], filas_sucesores
+        )
+    )
+    print("")
+
+    # Sucesores añadidos como tabla vertical
+    filas_anadidos = []
+    for i, (f, g, h, s) in enumerate(log["sucesores_anadidos"]):
+        filas_anadidos.append([str(i), str(s), str(g), str(h), f"{f:.0f}"])
+    if not filas_anadidos:
+        filas_anadidos = [["-", "(ninguno)", "-", "-", "-"]]
+    print("  Sucesores añadidos (tabla):")
+    print(_tabla_ascii_vertical(["Idx", "Estado", "g", "h", "f"], filas_anadidos))
+    print("")
+
+    if pagina is not None:
+        _imprimir_frontera_paginada(log, pagina)
+        return
+
+    # Frontera total como tabla vertical
+    filas_frontera = []
+    for i, (f, g, h, s) in enumerate(log["frontera_total"]):
+        filas_frontera.append([str(i), str(s), str(g), str(h), f"{f:.0f}"])
+    if not filas_frontera:
+        filas_frontera = [["-", "(vacía)", "-", "-", "-"]]
+    print("  Frontera total (tabla):")
+    print(_tabla_ascii_vertical(["Idx", "Estado", "g", "h", "f"], filas_frontera))
+    print("")
+
+    omitidos = log.get("tamano_frontera", 0) - len(log["frontera_total"])
+    if omitidos > 0:
+        print(f"  ... y {omitidos} elementos más en la frontera")
+
+    # También mostrar la cola como tabla ASCII (estados/posición)
+    if log["frontera_total"]:
+        print("  Cola (formato tabla):")
+        print(_tabla_ascii_frontera_estrella(log["frontera_total"]))
+
+
+def mostrar_camino_solucion(camino_solucion, pausa_segundos=0.0, modo_interactivo=False):
+    """
+    Imprime sólo la secuencia de estados y acciones de la solución
+    (se usa cuando la búsqueda corre sin traza).
+    """
+    if not camino_solucion:
+        print("No se encontró una solución.")
+        return
+
+    for indice, (estado, nombre_accion) in enumerate(camino_solucion):
+        descripcion = problema_jarras.descripcion_de_accion(nombre_accion)
+        print(f"Paso {indice:02d}: Estado {str(estado):>10}  <- {descripcion}")
+        if modo_interactivo and indice < len(camino_solucion) - 1:
+            input("Presiona ENTER para continuar...")
+        elif pausa_segundos > 0:
+            time.sleep(pausa_segundos)
+    print("")
+
+
+ENCABEZADO = "Solución A* con heurística |jarra2-6| y costos L=1, V=3, T=2:\n"
+ENCABEZADO_PDB = "Solución A* con heurística PDB (máximo de patrones) y costos L=1, V=3, T=2:\n"
+ENCABEZADO_IDA = "Solución IDA* con heurística |jarra2-6| y costos L=1, V=3, T=2:\n"
+ENCABEZADO_IDA_PDB = "Solución IDA* con heurística PDB (máximo de patrones) y costos L=1, V=3, T=2:\n"
+ENCABEZADO_BIDIRECCIONAL = "Solución A* bidireccional con heurísticas admisibles y costos L=1, V=3, T=2:\n"
+ENCABEZADO_BIDIRECCIONAL_PDB = ("Solución A* bidireccional con heurística PDB hacia adelante y costos "
+                                "L=1, V=3, T=2:\n")
+
+
+def _imprimir_expansion_estrella(idx, log, nivel_traza=traza.COMPLETA, pagina=None):
+    """
+    Imprime el bloque de una expansión A* (paso 'idx' en orden real).
+    'pagina' (PaginaFrontera) limita las filas de la frontera impresas.
+    """
+    estado = log["estado"]
+    accion_entrada = log.get("accion_entrada")
+    descripcion = problema_jarras.descripcion_de_accion(accion_entrada)
+
+    print(f"- Paso {idx:02d} | Estado {estado} <- {descripcion}")
+    print(
+        f"  Expansión #{log['indice_de_expansion']:02d} (orden real) | g={log['costo_acumulado_g']}  h={log['heuristica_h']}  f={log['valor_funcion_f']}"
+    )
+    if "direccion" in log:
+        print(f"  Dirección: {log['direccion']}")
+    if traza.con_detalle(nivel_traza):
+        _imprimir_detalle_expansion_estrella(log, pagina)
+
+    print(
+        f"  Nuevos   | Descubiertos únicos: {log['nuevos_descubiertos']}  |  Expandidos: {log['expandidos_este_paso']}"
+    )
+    print(
+        f"  Totales  | Descubiertos: {log['totales']['descubiertos']}  |  Expandidos: {log['totales']['expandidos']}"
+    )
+    if idx == 0:
+        print("  Nota: 'Descubiertos' totales incluyen el estado inicial.")
+        print(
+            "  Nota: El contador de descubiertos incluye solo sucesores realmente nuevos (únicos) agregados a la frontera; los ya vistos no incrementan el total."
+        )
+    print("")
+
+
+def _imprimir_objetivo_estrella(numero_paso, obj):
+    """
+    Imprime el bloque del estado objetivo (detectado, no expandido).
+    """
+    estado = obj["estado"]
+    print(
+        f"- Paso {numero_paso:02d} | Estado {estado} <- {problema_jarras.descripcion_de_accion(obj.get('accion_entrada'))}"
+    )
+    print("  [Objetivo detectado: no se expandió]")
+    print(
+        f"  Nuevos   | Descubiertos únicos: {obj['nuevos_descubiertos']}  |  Expandidos: {obj['expandidos_este_paso']}"
+    )
+    print("")
+    print(f"Estado final alcanzado: {estado}")
+
+
+def _esperar_entre_pasos(pausa_segundos, modo_interactivo, hay_siguiente):
+    """
+    Interacción / pausa entre pasos: ENTER si hay un paso siguiente en modo
+    interactivo; si no, la pausa indicada.
+    """
+    if modo_interactivo and hay_siguiente:
+        input("Presiona ENTER para continuar...")
+    elif pausa_segundos > 0:
+        time.sleep(pausa_segundos)
+
+
+def imprimir_logs_formateados_estrella(camino_solucion, logs_por_estado, pausa_segundos=0.0, modo_interactivo=False,
+                                       nivel_traza=traza.COMPLETA, pagina=None):
     """
     Imprime los logs de expansión A* de acuerdo al formato de runner.py,
     mostrando TODAS las expansiones en orden real (no solo el camino).
+    Con nivel_traza=traza.RESUMEN sólo se imprimen g, h, f y los contadores.
+    Con 'pagina' (PaginaFrontera) sólo se imprime esa página de cada frontera.
     """
     if not logs_por_estado:
         return
 
-    print("Solución A* con heurística |jarra2-6| y costos L=1, V=3, T=2:\n")
+    print(ENCABEZADO)
 
     # Mostrar TODAS las expansiones en orden real (orden de extracción de la frontera)
     logs_expandidos = [v for v in logs_por_estado.values() if not v.get("es_objetivo") and ("indice_de_expansion" in v)]
     logs_expandidos.sort(key=lambda x: x["indice_de_expansion"])
 
     for idx, log in enumerate(logs_expandidos):
-        estado = log["estado"]
-        accion_entrada = log.get("accion_entrada")
-        descripcion = problema_jarras.descripcion_de_accion(accion_entrada)
-
-        print(f"- Paso {idx:02d} | Estado {estado} <- {descripcion}")
-        print(
-            f"  Expansión #{log['indice_de_expansion']:02d} (orden real) | g={log['costo_acumulado_g']}  h={log['heuristica_h']}  f={log['valor_funcion_f']}"
-        )
-        # Sucesores como tabla vertical
-        filas_sucesores = []
-        for i, (suc, acc, cacc, g_suc, h_suc, f_suc) in enumerate(log["sucesores"]):
-            filas_sucesores.append([
-                str(i),
-                str(suc),
-                problema_jarras.descripcion_de_accion(acc),
-                str(cacc),
-                str(g_suc),
-                str(h_suc),
-                f"{f_suc:.0f}",
-            ])
-        if not filas_sucesores:
-            filas_sucesores = [["-", "(sin sucesores)", "-", "-", "-", "-", "-"]]
-        print("  Sucesores (tabla):")
-        print(
-            _tabla_ascii_vertical(
-                ["Idx", "Estado", "Acción", "c", "g", "h", "f"], filas_sucesores
-            )
-        )
-        print("")
-
-        # Sucesores añadidos como tabla vertical
-        filas_anadidos = []
-        for i, (f, g, h, s) in enumerate(log["sucesores_anadidos"]):
-            filas_anadidos.append([str(i), str(s), str(g), str(h), f"{f:.0f}"])
-        if not filas_anadidos:
-            filas_anadidos = [["-", "(ninguno)", "-", "-", "-"]]
-        print("  Sucesores añadidos (tabla):")
-        print(_tabla_ascii_vertical(["Idx", "Estado", "g", "h", "f"], filas_anadidos))
-        print("")
-
-        # Frontera total como tabla vertical
-        filas_frontera = []
-        for i, (f, g, h, s) in enumerate(log["frontera_total"]):
-            filas_frontera.append([str(i), str(s), str(g), str(h), f"{f:.0f}"])
-        if not filas_frontera:
-            filas_frontera = [["-", "(vacía)", "-", "-", "-"]]
-        print("  Frontera total (tabla):")
-        print(_tabla_ascii_vertical(["Idx", "Estado", "g", "h", "f"], filas_frontera))
-        print("")
-
-        # También mostrar la cola como tabla ASCII (estados/posición)
-        if log["frontera_total"]:
-            print("  Cola (formato tabla):")
-            print(_tabla_ascii_frontera_estrella(log["frontera_total"]))
-
-        print(
-            f"  Nuevos   | Descubiertos únicos: {log['nuevos_descubiertos']}  |  Expandidos: {log['expandidos_este_paso']}"
-        )
-        print(
-            f"  Totales  | Descubiertos: {log['totales']['descubiertos']}  |  Expandidos: {log['totales']['expandidos']}"
-        )
-        if idx == 0:
-            print("  Nota: 'Descubiertos' totales incluyen el estado inicial.")
-            print(
-                "  Nota: El contador de descubiertos incluye solo sucesores realmente nuevos (únicos) agregados a la frontera; los ya vistos no incrementan el total."
-            )
-        print("")
-
-        # Interacción / pausa entre pasos
-        if modo_interactivo and idx < len(logs_expandidos) - 1:
-            input("Presiona ENTER para continuar...")
-        elif pausa_segundos > 0:
-            time.sleep(pausa_segundos)
+        _imprimir_expansion_estrella(idx, log, nivel_traza, pagina)
+        _esperar_entre_pasos(pausa_segundos, modo_interactivo, idx < len(logs_expandidos) - 1)
 
     # Imprimir el objetivo si está en logs y no fue expandido
     objetivos = [v for v in logs_por_estado.values() if v.get("es_objetivo")]
     if objetivos:
-        obj = objetivos[0]
-        estado = obj["estado"]
-        print(
-            f"- Paso {len(logs_expandidos):02d} | Estado {estado} <- {problema_jarras.descripcion_de_accion(obj.get('accion_entrada'))}"
-        )
-        print("  [Objetivo detectado: no se expandió]")
-        print(
-            f"  Nuevos   | Descubiertos únicos: {obj['nuevos_descubiertos']}  |  Expandidos: {obj['expandidos_este_paso']}"
-        )
-        print("")
-        print(f"Estado final alcanzado: {estado}")
+        _imprimir_objetivo_estrella(len(logs_expandidos), objetivos[0])
 
 
-def ejecutar_busqueda_y_mostrar(pausa_segundos=0.0, modo_interactivo=False):
+def imprimir_logs_en_vivo_estrella(iterador, pausa_segundos=0.0, modo_interactivo=False, nivel_traza=traza.COMPLETA,
+                                   encabezado=ENCABEZADO, pagina=None):
+    """
+    Imprime cada expansión apenas la produce 'iterador' (jarras_a_estrella.iterar_a_estrella),
+    sin esperar a que termine la búsqueda ni guardar los logs.
+    'pagina' (PaginaFrontera) limita las filas de la frontera impresas.
+    Devuelve (estado_objetivo, diccionario_padre, diccionario_accion).
+    """
+    resultado = (None, {}, {})
+    expandidos = 0
+    pendiente = False  # hay una expansión impresa que aún no tuvo su pausa
+    for tipo, datos in iterador:
+        if tipo == traza.RESULTADO:
+            resultado = datos
+            continue
+        if pendiente:
+            _esperar_entre_pasos(pausa_segundos, modo_interactivo, not datos["es_objetivo"])
+            pendiente = False
+        elif expandidos == 0:
+            print(encabezado)
+        if datos["es_objetivo"]:
+            _imprimir_objetivo_estrella(expandidos, datos)
+            continue
+        _imprimir_expansion_estrella(expandidos, datos, nivel_traza, pagina)
+        expandidos += 1
+        pendiente = True
+    if pendiente:
+        _esperar_entre_pasos(pausa_segundos, modo_interactivo, False)
+    return resultado
+
+
+def ejecutar_busqueda_y_mostrar(pausa_segundos=0.0, modo_interactivo=False, nivel_traza=traza.COMPLETA,
+                                k_frontera=traza.K_FRONTERA_POR_DEFECTO, cache=None, bidireccional=False,
+                                heuristica=problema_jarras.HEURISTICA_JARRA2, tipo_frontera=fronteras.AUTOMATICA,
+                                peso=1.0, estadisticas=False, max_filas=None, pagina=1):
     """
     Ejecuta la búsqueda A* del módulo 'jarras_a_estrella' y muestra el resultado.
+    Las expansiones se imprimen a medida que la búsqueda las produce.
     Además imprime estadísticas simples del recorrido.
+    Con nivel_traza=traza.NINGUNA no se generan logs y sólo se muestra el camino;
+    en ese caso, si se pasa 'cache' (cache_soluciones.CacheSoluciones), la
+    solución se toma del caché cuando ya fue resuelta.
+    Con bidireccional=True se usa A* bidireccional (no consulta el caché).
+    'heuristica' elige h(n) entre jarras_a_estrella.HEURISTICAS; con
+    bidireccional, None (las admisibles por defecto) o la PDB.
+    'tipo_frontera' elige la cola de prioridad de A* (ver fronteras.py).
+    Con 'peso' distinto de 1 es A* ponderado: f(n) = g(n) + peso·h(n).
+    Con estadisticas=True imprime al final los tiempos por fase y los contadores
+    de la búsqueda (perfilado.py); con bidireccional, sólo el tiempo total.
+    Con 'max_filas', de cada frontera sólo se imprime la página 'pagina' de
+    'max_filas' filas: la búsqueda corre con traza 'topk' y selecciona los
+    pagina·max_filas menores en lugar de ordenar la frontera completa.
     """
-    # 1) Ejecutar búsqueda
-    estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado = problema_jarras.busqueda_a_estrella(
-        problema_jarras.obtener_estado_inicial()
+    if bidireccional:
+        encabezado = (ENCABEZADO_BIDIRECCIONAL_PDB if heuristica == problema_jarras.HEURISTICA_PDB
+                      else ENCABEZADO_BIDIRECCIONAL)
+    else:
+        encabezado = ENCABEZADO_PDB if heuristica == problema_jarras.HEURISTICA_PDB else ENCABEZADO
+    if peso != 1 and not bidireccional:
+        print(f"A* ponderado: f(n) = g(n) + {peso}·h(n) (costo a lo sumo {peso} veces el óptimo con h admisible)\n")
+    if cache is not None and not bidireccional and not traza.con_logs(nivel_traza):
+        _mostrar_solucion_con_cache(cache, pausa_segundos, modo_interactivo, heuristica, encabezado, peso)
+        return
+
+    pagina_frontera = None
+    if max_filas is not None and traza.con_detalle(nivel_traza):
+        pagina_frontera = PaginaFrontera(max_filas, pagina)
+        nivel_traza, k_frontera = traza.TOPK, pagina_frontera.k_frontera
+
+    # 1) Ejecutar búsqueda e imprimir cada expansión al vuelo
+    medicion = perfilado.EstadisticasBusqueda() if estadisticas else None
+    if bidireccional:
+        iterador = problema_jarras.iterar_a_estrella_bidireccional(
+            problema_jarras.obtener_estado_inicial(), heuristica=heuristica, nivel_traza=nivel_traza,
+            k_frontera=k_frontera,
+        )
+        if medicion is not None:
+            iterador = medicion.medir_iterador(iterador)
+    else:
+        iterador = problema_jarras.iterar_a_estrella(
+            problema_jarras.obtener_estado_inicial(), heuristica=heuristica, nivel_traza=nivel_traza,
+            k_frontera=k_frontera, tipo_frontera=tipo_frontera, peso=peso, estadisticas=medicion
+        )
+    estado_objetivo, diccionario_padre, diccionario_accion = imprimir_logs_en_vivo_estrella(
+        iterador,
+        pausa_segundos=pausa_segundos,
+        modo_interactivo=modo_interactivo,
+        nivel_traza=nivel_traza,
+        encabezado=encabezado,
+        pagina=pagina_frontera,
     )
 
     # 2) Reconstruir el camino solución
@@ -195,22 +431,171 @@ def ejecutar_busqueda_y_mostrar(pausa_segundos=0.0, modo_interactivo=False):
         estado_objetivo, diccionario_padre, diccionario_accion
     )
 
-    # 3) Mostrar logs detallados de TODAS las expansiones
-    imprimir_logs_formateados_estrella(
-        camino_solucion,
-        logs_por_estado,
-        pausa_segundos=pausa_segundos,
-        modo_interactivo=modo_interactivo,
+    # 3) Sin traza: mostrar sólo el camino
+    if not traza.con_logs(nivel_traza):
+        print(encabezado)
+        mostrar_camino_solucion(camino_solucion, pausa_segundos, modo_interactivo)
+
+    _imprimir_resumen(camino_solucion, len(diccionario_padre))
+    if medicion is not None:
+        print(f"\nEstadísticas de la búsqueda:\n{medicion.resumen()}")
+
+
+def ejecutar_busqueda_y_volcar(formato, ruta_salida=None, nivel_traza=traza.COMPLETA,
+                               k_frontera=traza.K_FRONTERA_POR_DEFECTO, bidireccional=False,
+                               heuristica=problema_jarras.HEURISTICA_JARRA2, tipo_frontera=fronteras.AUTOMATICA,
+                               peso=1.0, estadisticas=False):
+    """
+    Ejecuta A* (o A* bidireccional) y escribe cada registro de expansión y el
+    resultado en 'formato' (json, ndjson o csv, ver salida_estructurada.py)
+    en 'ruta_salida' (gzip si termina en '.gz') o en la salida estándar.
+    Con estadisticas=True el resumen de perfilado va a la salida de errores.
+    """
+    medicion = perfilado.EstadisticasBusqueda() if estadisticas else None
+    if bidireccional:
+        iterador = problema_jarras.iterar_a_estrella_bidireccional(
+            problema_jarras.obtener_estado_inicial(), heuristica=heuristica, nivel_traza=nivel_traza,
+            k_frontera=k_frontera,
+        )
+        if medicion is not None:
+            iterador = medicion.medir_iterador(iterador)
+    else:
+        iterador = problema_jarras.iterar_a_estrella(
+            problema_jarras.obtener_estado_inicial(), heuristica=heuristica, nivel_traza=nivel_traza,
+            k_frontera=k_frontera, tipo_frontera=tipo_frontera, peso=peso, estadisticas=medicion
+        )
+    salida_estructurada.volcar_a(ruta_salida, iterador, formato, problema_jarras.obtener_costo_de_accion)
+    if medicion is not None:
+        print(f"Estadísticas de la búsqueda:\n{medicion.resumen()}", file=sys.stderr)
+
+
+def ejecutar_ida_y_mostrar(pausa_segundos=0.0, modo_interactivo=False,
+                           heuristica=problema_jarras.HEURISTICA_JARRA2, capacidad_transposiciones=0,
+                           max_iteraciones=ida_estrella.MAX_ITERACIONES_POR_DEFECTO,
+                           max_expandidos=ida_estrella.MAX_EXPANDIDOS_POR_DEFECTO):
+    """
+    Ejecuta IDA* (memoria lineal en la profundidad) y muestra, al terminar
+    cada iteración, su umbral y los nodos expandidos y generados; luego
+    imprime el camino solución y el resumen. Si se corta por límite lo
+    informa como sin solución dentro del límite.
+    """
+    iterador = problema_jarras.iterar_ida_estrella(
+        problema_jarras.obtener_estado_inicial(), heuristica=heuristica,
+        capacidad_transposiciones=capacidad_transposiciones,
+        max_iteraciones=max_iteraciones, max_expandidos=max_expandidos,
     )
+    resultado = (None, {}, {})
+    total_generados = 0
+    limite = None
+    for tipo, datos in iterador:
+        if tipo == traza.RESULTADO:
+            resultado = datos
+            continue
+        total_generados = datos["totales"]["generados"]
+        if datos["limite_alcanzado"]:
+            limite = (datos["iteracion"] + 1, datos["totales"]["expandidos"])
+        print(
+            f"Iteración {datos['iteracion']:02d}: umbral={datos['umbral']} | "
+            f"expandidos={datos['expandidos']} | generados={datos['generados']} | "
+            f"profundidad máxima={datos['profundidad_maxima']} | "
+            f"transposiciones={datos['transposiciones']} | "
+            f"{'solución encontrada' if datos['encontrado'] else 'siguiente umbral=' + str(datos['siguiente_umbral'])}"
+        )
+    if limite is not None:
+        print(f"Sin solución dentro del límite ({limite[0]} iteraciones, {limite[1]} expandidos; "
+              f"ver --max-iteraciones y --max-expandidos).")
+    print("")
+
+    camino_solucion = problema_jarras.reconstruir_camino(*resultado)
+    print(ENCABEZADO_IDA_PDB if heuristica == problema_jarras.HEURISTICA_PDB else ENCABEZADO_IDA)
+    mostrar_camino_solucion(camino_solucion, pausa_segundos, modo_interactivo)
+    _imprimir_resumen(camino_solucion, total_generados)
+
+
+def ejecutar_ara_y_mostrar(pausa_segundos=0.0, modo_interactivo=False,
+                           heuristica=problema_jarras.HEURISTICA_JARRA2,
+                           peso_inicial=ara_estrella.PESO_INICIAL_POR_DEFECTO,
+                           decremento=ara_estrella.DECREMENTO_POR_DEFECTO):
+    """
+    Ejecuta ARA* (A* anytime) e imprime cada solución mejorada con su peso,
+    su cota de suboptimalidad y su costo a medida que aparece; al final
+    muestra el mejor camino y el resumen. La cota sólo vale con h admisible:
+    se verifica la heurística antes y, si no lo es, no se muestra.
+    """
+    admisible = problema_jarras.verificar_heuristica(heuristica).admisible
+    if not admisible:
+        print(f"La heurística '{heuristica}' no es admisible: no hay cota de suboptimalidad "
+              f"(use --heuristica {problema_jarras.HEURISTICA_PDB} para tenerla).\n")
+    iterador = problema_jarras.iterar_ara_estrella(
+        problema_jarras.obtener_estado_inicial(), heuristica=heuristica,
+        peso_inicial=peso_inicial, decremento=decremento,
+    )
+    resultado = (None, {}, {})
+    for tipo, datos in iterador:
+        if tipo == traza.RESULTADO:
+            resultado = datos
+            continue
+        cota = f"{datos['cota']:.3f}" if admisible else "n/d"
+        print(
+            f"Mejora en la ronda {datos['ronda']:02d}: peso={datos['peso']} | cota={cota} | "
+            f"costo={datos['costo']} | acciones={len(datos['camino']) - 1} | "
+            f"expandidos={datos['expandidos']} (total {datos['totales']['expandidos']})"
+        )
+    print("")
+
+    estado_objetivo, diccionario_padre, diccionario_accion = resultado
+    camino_solucion = problema_jarras.reconstruir_camino(estado_objetivo, diccionario_padre, diccionario_accion)
+    print(ENCABEZADO_PDB if heuristica == problema_jarras.HEURISTICA_PDB else ENCABEZADO)
+    mostrar_camino_solucion(camino_solucion, pausa_segundos, modo_interactivo)
+    _imprimir_resumen(camino_solucion, len(diccionario_padre))
+
+
+def ejecutar_distribuida_y_mostrar(pausa_segundos=0.0, modo_interactivo=False,
+                                   heuristica=problema_jarras.HEURISTICA_JARRA2, procesos=None):
+    """
+    Ejecuta A* distribuido por hash (HDA*) con 'procesos' procesos e imprime
+    los nodos expandidos por cada uno y la tasa de expansiones; luego el
+    camino solución y el resumen.
+    """
+    estado_objetivo, diccionario_padre, diccionario_accion, estadisticas = (
+        problema_jarras.busqueda_a_estrella_distribuida(
+            problema_jarras.obtener_estado_inicial(), heuristica=heuristica, procesos=procesos,
+        )
+    )
+    print(
+        f"HDA* con {estadisticas['procesos']} procesos: expandidos={estadisticas['expandidos']} "
+        f"{estadisticas['expandidos_por_proceso']} | {estadisticas['segundos']:.3f} s | "
+        f"{estadisticas['expansiones_por_segundo']:.0f} expansiones/s\n"
+    )
+
+    camino_solucion = problema_jarras.reconstruir_camino(estado_objetivo, diccionario_padre, diccionario_accion)
+    print(ENCABEZADO_PDB if heuristica == problema_jarras.HEURISTICA_PDB else ENCABEZADO)
+    mostrar_camino_solucion(camino_solucion, pausa_segundos, modo_interactivo)
+    _imprimir_resumen(camino_solucion, len(diccionario_padre))
+
+
+def _mostrar_solucion_con_cache(cache, pausa_segundos=0.0, modo_interactivo=False,
+                                heuristica=problema_jarras.HEURISTICA_JARRA2, encabezado=ENCABEZADO, peso=1.0):
+    """
+    Muestra sólo el camino (sin traza), tomándolo del caché si ya fue resuelto.
+    """
+    solucion, _desde_cache = problema_jarras.resolver(cache=cache, heuristica=heuristica, peso=peso)
+    print(encabezado)
+    mostrar_camino_solucion(solucion.camino, pausa_segundos, modo_interactivo)
+    _imprimir_resumen(solucion.camino, solucion.descubiertos)
 
+
+def _imprimir_resumen(camino_solucion, total_estados_explorados):
+    """
+    Imprime el largo del camino, el estado final y las métricas simples.
+    """
     # Línea adicional similar al runner original
     print(f"Camino solución reconstruido con {len(camino_solucion)} pasos")
     if camino_solucion:
         print(f"Estado final alcanzado: {camino_solucion[-1][0]}\n")
 
-    # 4) Métricas simples
+    # Métricas simples
     total_pasos = max(len(camino_solucion) - 1, 0)  # acciones ejecutadas
-    total_estados_explorados = len(diccionario_padre)
     print(f"\nResumen:")
     print(f"- Acciones ejecutadas: {total_pasos}")
     print(f"- Estados descubiertos (nodos generados): {total_estados_explorados}")
@@ -234,6 +619,125 @@ def construir_argumentos():
         action="store_true",
         help="Muestra los pasos en modo interactivo (ENTER para avanzar).",
     )
+    parser.add_argument(
+        "--traza",
+        choices=traza.NIVELES,
+        default=traza.COMPLETA,
+        help="Nivel de traza: ninguna (sólo el camino), resumen (contadores), topk (frontera recortada) o completa.",
+    )
+    parser.add_argument(
+        "--k-frontera",
+        type=int,
+        default=traza.K_FRONTERA_POR_DEFECTO,
+        help="Elementos de la frontera a mostrar con --traza topk. Ejemplo: --k-frontera 5",
+    )
+    parser.add_argument(
+        "--max-filas",
+        type=int,
+        default=None,
+        help="Filas de la frontera a mostrar por expansión (top-k, sin ordenarla entera); por defecto, todas. Ejemplo: --max-filas 20",
+    )
+    parser.add_argument(
+        "--pagina",
+        type=int,
+        default=1,
+        help="Con --max-filas, página de la frontera a mostrar (1 = las max-filas mejores). Ejemplo: --pagina 2",
+    )
+    parser.add_argument(
+        "--heuristica",
+        choices=problema_jarras.HEURISTICAS,
+        default=None,
+        help="Heurística de A*: jarra2 (|jarra2-6|, no admisible, por defecto) o pdb (bases de patrones, "
+             "admisible). Con --bidireccional sólo pdb (hacia adelante); sin ella, las admisibles por defecto.",
+    )
+    parser.add_argument(
+        "--verificar-heuristica",
+        action="store_true",
+        help="Antes de buscar, verifica admisibilidad y consistencia de la heurística elegida.",
+    )
+    parser.add_argument(
+        "--bidireccional",
+        action="store_true",
+        help="Usa A* bidireccional (desde el inicial y desde todos los estados objetivo).",
+    )
+    parser.add_argument(
+        "--peso",
+        type=float,
+        default=1.0,
+        help="Peso w de la heurística (A* ponderado, f = g + w·h); con --anytime, peso inicial. Ejemplo: --peso 2",
+    )
+    parser.add_argument(
+        "--anytime",
+        action="store_true",
+        help="Usa ARA*: primera solución rápida con peso alto, mejorada bajando el peso hasta 1.",
+    )
+    parser.add_argument(
+        "--decremento-peso",
+        type=float,
+        default=ara_estrella.DECREMENTO_POR_DEFECTO,
+        help="Con --anytime, cuánto baja el peso en cada ronda. Ejemplo: --decremento-peso 0.5",
+    )
+    parser.add_argument(
+        "--ida",
+        action="store_true",
+        help="Usa IDA* (profundización iterativa, memoria lineal) e informa cada umbral.",
+    )
+    parser.add_argument(
+        "--tabla-transposiciones",
+        type=int,
+        default=0,
+        help="Con --ida, capacidad de la tabla de transposiciones (0 = sin tabla). Ejemplo: --tabla-transposiciones 100000",
+    )
+    parser.add_argument(
+        "--max-iteraciones",
+        type=int,
+        default=ida_estrella.MAX_ITERACIONES_POR_DEFECTO,
+        help="Con --ida, iteraciones (umbrales) antes de cortar sin solución. Ejemplo: --max-iteraciones 30",
+    )
+    parser.add_argument(
+        "--max-expandidos",
+        type=int,
+        default=ida_estrella.MAX_EXPANDIDOS_POR_DEFECTO,
+        help="Con --ida, nodos expandidos en total desde los que no se empieza otra iteración. Ejemplo: --max-expandidos 5000000",
+    )
+    parser.add_argument(
+        "--procesos",
+        type=int,
+        default=0,
+        help="Usa A* distribuido por hash (HDA*) con N procesos (0 = sin distribuir). Ejemplo: --procesos 4",
+    )
+    parser.add_argument(
+        "--frontera",
+        choices=fronteras.TIPOS,
+        default=fronteras.AUTOMATICA,
+        help="Cola de prioridad de A*: automatica (cubetas si las prioridades son enteras), heap (borrado perezoso), indexada (decrease-key) o cubetas (Dial).",
+    )
+    parser.add_argument(
+        "--formato",
+        choices=salida_estructurada.FORMATOS,
+        default=salida_estructurada.TEXTO,
+        help="Formato de salida: texto (legible) o json, ndjson y csv (un registro por expansión, para procesar).",
+    )
+    parser.add_argument(
+        "--salida",
+        default=None,
+        help="Con --formato json/ndjson/csv, archivo de salida (comprimido con gzip si termina en .gz; por defecto, stdout).",
+    )
+    parser.add_argument(
+        "--estadisticas",
+        action="store_true",
+        help="Imprime tiempos por fase (sucesores, heurística, frontera, logs) y contadores de A*.",
+    )
+    parser.add_argument(
+        "--cache",
+        default=None,
+        help="Archivo del caché de soluciones usado con --traza ninguna (por defecto $JARRAS_CACHE o ~/.cache/jarras/soluciones.bin).",
+    )
+    parser.add_argument(
+        "--sin-cache",
+        action="store_true",
+        help="No consulta ni actualiza el caché de soluciones.",
+    )
     return parser
 
 
@@ -246,9 +750,139 @@ def main():
         print("El valor de --pausa no puede ser negativo. Se usará 0.0.")
         argumentos.pausa = 0.0
 
-    ejecutar_busqueda_y_mostrar(
-        pausa_segundos=argumentos.pausa, modo_interactivo=argumentos.interactivo
-    )
+    if argumentos.k_frontera < 1:
+        print("El valor de --k-frontera debe ser al menos 1. Se usará 1.")
+        argumentos.k_frontera = 1
+
+    if argumentos.max_filas is not None and argumentos.max_filas < 1:
+        print("El valor de --max-filas debe ser al menos 1. Se usará 1.")
+        argumentos.max_filas = 1
+
+    if argumentos.pagina < 1:
+        print("El valor de --pagina debe ser al menos 1. Se usará 1.")
+        argumentos.pagina = 1
+    if argumentos.pagina > 1 and argumentos.max_filas is None:
+        parser.error("--pagina sólo se usa con --max-filas.")
+
+    # El caché sólo se usa sin traza (con traza hace falta recorrer la búsqueda)
+    cache = None
+    if argumentos.peso < 0:
+        print("El valor de --peso no puede ser negativo. Se usará 1.0.")
+        argumentos.peso = 1.0
+
+    if argumentos.decremento_peso <= 0:
+        print(f"El valor de --decremento-peso debe ser positivo. Se usará {ara_estrella.DECREMENTO_POR_DEFECTO}.")
+        argumentos.decremento_peso = ara_estrella.DECREMENTO_POR_DEFECTO
+
+    if argumentos.tabla_transposiciones < 0:
+        print("El valor de --tabla-transposiciones no puede ser negativo. Se usará 0.")
+        argumentos.tabla_transposiciones = 0
+
+    if argumentos.max_iteraciones < 1:
+        print(f"El valor de --max-iteraciones debe ser al menos 1. Se usará {ida_estrella.MAX_ITERACIONES_POR_DEFECTO}.")
+        argumentos.max_iteraciones = ida_estrella.MAX_ITERACIONES_POR_DEFECTO
+
+    if argumentos.max_expandidos < 1:
+        print(f"El valor de --max-expandidos debe ser al menos 1. Se usará {ida_estrella.MAX_EXPANDIDOS_POR_DEFECTO}.")
+        argumentos.max_expandidos = ida_estrella.MAX_EXPANDIDOS_POR_DEFECTO
+
+    if argumentos.procesos < 0:
+        print("El valor de --procesos no puede ser negativo. Se usará 0.")
+        argumentos.procesos = 0
+
+    # A* bidireccional: corte óptimo sólo con h admisible, sin peso ni otra frontera
+    if argumentos.bidireccional:
+        if argumentos.anytime or argumentos.ida or argumentos.procesos:
+            parser.error("--bidireccional no se combina con --anytime, --ida ni --procesos.")
+        if argumentos.heuristica == problema_jarras.HEURISTICA_JARRA2:
+            parser.error("--bidireccional necesita una heurística admisible: use --heuristica pdb o ninguna.")
+        if argumentos.peso != 1:
+            parser.error("--peso no se usa con --bidireccional.")
+        if argumentos.frontera != fronteras.AUTOMATICA:
+            parser.error("--frontera no se usa con --bidireccional (usa su propio heap por dirección).")
+        if argumentos.verificar_heuristica and argumentos.heuristica is None:
+            parser.error("--verificar-heuristica con --bidireccional necesita --heuristica pdb.")
+    elif argumentos.heuristica is None:
+        argumentos.heuristica = problema_jarras.HEURISTICA_JARRA2
+
+    if argumentos.formato != salida_estructurada.TEXTO:
+        if argumentos.anytime or argumentos.ida or argumentos.procesos:
+            parser.error("--formato json/ndjson/csv sólo se usa con A* (o --bidireccional).")
+        if argumentos.verificar_heuristica:
+            informe = problema_jarras.verificar_heuristica(argumentos.heuristica)
+            print(f"Verificación de la heurística '{argumentos.heuristica}': {informe.resumen()}", file=sys.stderr)
+        ejecutar_busqueda_y_volcar(
+            argumentos.formato,
+            ruta_salida=argumentos.salida,
+            nivel_traza=argumentos.traza,
+            k_frontera=argumentos.k_frontera,
+            bidireccional=argumentos.bidireccional,
+            heuristica=argumentos.heuristica,
+            tipo_frontera=argumentos.frontera,
+            peso=argumentos.peso,
+            estadisticas=argumentos.estadisticas,
+        )
+        return
+    if argumentos.salida is not None:
+        parser.error("--salida sólo se usa con --formato json, ndjson o csv.")
+
+    if (not argumentos.sin_cache and not argumentos.bidireccional and not argumentos.ida
+            and not argumentos.anytime and not argumentos.procesos and not argumentos.estadisticas
+            and not traza.con_logs(argumentos.traza)):
+        cache = cache_soluciones.CacheSoluciones(argumentos.cache)
+
+    if argumentos.verificar_heuristica:
+        informe = problema_jarras.verificar_heuristica(argumentos.heuristica)
+        print(f"Verificación de la heurística '{argumentos.heuristica}': {informe.resumen()}\n")
+
+    if argumentos.anytime:
+        ejecutar_ara_y_mostrar(
+            pausa_segundos=argumentos.pausa,
+            modo_interactivo=argumentos.interactivo,
+            heuristica=argumentos.heuristica,
+            peso_inicial=argumentos.peso if argumentos.peso > 1 else ara_estrella.PESO_INICIAL_POR_DEFECTO,
+            decremento=argumentos.decremento_peso,
+        )
+        return
+
+    if argumentos.procesos:
+        ejecutar_distribuida_y_mostrar(
+            pausa_segundos=argumentos.pausa,
+            modo_interactivo=argumentos.interactivo,
+            heuristica=argumentos.heuristica,
+            procesos=argumentos.procesos,
+        )
+        return
+
+    if argumentos.ida:
+        ejecutar_ida_y_mostrar(
+            pausa_segundos=argumentos.pausa,
+            modo_interactivo=argumentos.interactivo,
+            heuristica=argumentos.heuristica,
+            capacidad_transposiciones=argumentos.tabla_transposiciones,
+            max_iteraciones=argumentos.max_iteraciones,
+            max_expandidos=argumentos.max_expandidos,
+        )
+        return
+
+    try:
+        ejecutar_busqueda_y_mostrar(
+            pausa_segundos=argumentos.pausa,
+            modo_interactivo=argumentos.interactivo,
+            nivel_traza=argumentos.traza,
+            k_frontera=argumentos.k_frontera,
+            cache=cache,
+            bidireccional=argumentos.bidireccional,
+            heuristica=argumentos.heuristica,
+            tipo_frontera=argumentos.frontera,
+            peso=argumentos.peso,
+            estadisticas=argumentos.estadisticas,
+            max_filas=argumentos.max_filas,
+            pagina=argumentos.pagina,
+        )
+    finally:
+        if cache is not None:
+            cache.cerrar()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,189 @@
+# salida_estructurada.py
+# --------------------------------------------------------
+# Salida legible por máquina de los runners (--formato).
+#
+#   texto : impresión habitual de los runners (no pasa por aquí)
+#   json  : un único documento {"registros": [...], "resultado": {...}}
+#           escrito de a un registro (nunca se arma entero en memoria)
+#   ndjson: un objeto JSON por línea: {"tipo": "expansion", ...} por
+#           registro y {"tipo": "resultado", ...} al final
+#   csv   : una fila por registro con sus campos escalares; los
+#           diccionarios se aplanan (totales_expandidos, ...), las
+#           listas (sucesores, frontera) se informan por su largo y la
+#           última fila (tipo=resultado) trae el camino y el costo
+#
+# Los registros se serializan tal como los produce el iterador de la
+# búsqueda (mismo contenido que logs_por_estado) y todo pasa por un
+# único escritor con búfer grande: a un archivo (gzip si termina en
+# '.gz') o a la salida estándar.
+# --------------------------------------------------------
+
+import csv
+import gzip
+import io
+import json
+import sys
+from collections.abc import Mapping
+
+import traza
+
+TEXTO = "texto"
+JSON = "json"
+NDJSON = "ndjson"
+CSV = "csv"
+FORMATOS = (TEXTO, JSON, NDJSON, CSV)
+
+TAMANO_BUFFER = 1 << 20
+
+# Listas de los registros que en CSV se informan por su largo
+CAMPOS_LISTA = ("sucesores", "sucesores_anadidos", "frontera_total")
+COLUMNAS_RESULTADO = ("estado", "acciones", "costo", "descubiertos", "camino")
+
+
+# 1) Escritor con búfer
+
+def abrir_escritor(ruta=None):
+    """
+    Devuelve un archivo de texto con búfer de TAMANO_BUFFER bytes: 'ruta'
+    (comprimido con gzip si termina en '.gz') o la salida estándar si es
+    None o '-'. Hay que cerrarlo con cerrar_escritor.
+    """
+    if ruta is None or ruta == "-":
+        sys.stdout.flush()
+        try:
+            salida = io.FileIO(sys.stdout.fileno(), "w", closefd=False)
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return sys.stdout  # salida estándar reemplazada (sin descriptor)
+        return io.TextIOWrapper(io.BufferedWriter(salida, TAMANO_BUFFER), encoding="utf-8", newline="")
+    if ruta.endswith(".gz"):
+        return io.TextIOWrapper(io.BufferedWriter(gzip.GzipFile(ruta, "wb"), TAMANO_BUFFER),
+                                encoding="utf-8", newline="")
+    return open(ruta, "w", encoding="utf-8", newline="", buffering=TAMANO_BUFFER)
+
+
+def cerrar_escritor(escritor):
+    """
+    Vacía el búfer y cierra el escritor (la salida estándar sólo se vacía).
+    """
+    if escritor is sys.stdout:
+        escritor.flush()
+    else:
+        escritor.close()  # sobre la salida estándar no cierra el descriptor (closefd=False)
+
+
+# 2) Conversión de registros
+
+def _serializable(valor):
+    # Registros (registros.py) -> diccionarios; vistas de la bitácora y otras secuencias -> listas
+    if isinstance(valor, Mapping):
+        return dict(valor)
+    return list(valor)
+
+
+def _json(valor):
+    return json.dumps(valor, ensure_ascii=False, separators=(",", ":"), default=_serializable)
+
+
+def registro_resultado(resultado, costo_de_accion=None):
+    """
+    Diccionario del resultado final: estado objetivo, camino [[estado, accion], ...],
+    cantidad de acciones, costo (si se pasa costo_de_accion) y descubiertos.
+    """
+    estado_objetivo, diccionario_padre, diccionario_accion = resultado
+    camino = []
+    estado = estado_objetivo
+    while estado is not None:
+        camino.append((estado, diccionario_accion.get(estado)))
+        estado = diccionario_padre.get(estado)
+    camino.reverse()
+    costo = None
+    if camino and costo_de_accion is not None:
+        costo = sum(costo_de_accion(accion) for _estado, accion in camino[1:])
+    return {
+        "estado": estado_objetivo,
+        "acciones": max(len(camino) - 1, 0),
+        "costo": costo,
+        "descubiertos": len(diccionario_padre),
+        "camino": camino,
+    }
+
+
+def _fila_csv(registro):
+    """
+    Aplana un registro a {columna: valor escalar} para CSV.
+    """
+    fila = {}
+    for clave, valor in registro.items():
+        if isinstance(valor, Mapping):
+            for subclave, subvalor in valor.items():
+                fila[f"{clave}_{subclave}"] = subvalor
+        elif clave in CAMPOS_LISTA:
+            fila[clave] = len(valor)
+        elif isinstance(valor, (tuple, list)):
+            fila[clave] = str(tuple(valor))
+        else:
+            fila[clave] = valor
+    return fila
+
+
+# 3) Volcado de una búsqueda
+
+def volcar(iterador, formato, escritor, costo_de_accion=None):
+    """
+    Consume 'iterador' (protocolo de iterar_*: (tipo, datos) y al final
+    (traza.RESULTADO, (estado_objetivo, padre, accion))) y escribe cada
+    registro en 'escritor' con 'formato' (JSON, NDJSON o CSV).
+    Devuelve el diccionario del resultado (ver registro_resultado).
+    """
+    if formato not in (JSON, NDJSON, CSV):
+        raise ValueError(f"Formato estructurado desconocido: {formato} (use json, ndjson o csv)")
+    escribir = escritor.write
+    resultado = registro_resultado((None, {}, {}), costo_de_accion)
+    tabla = None
+    primero = True
+    if formato == JSON:
+        escribir('{"registros":[')
+
+    for tipo, datos in iterador:
+        if tipo == traza.RESULTADO:
+            resultado = registro_resultado(datos, costo_de_accion)
+            continue
+        if formato == NDJSON:
+            escribir('{"tipo":"' + tipo + '",' + _json(datos)[1:] + "\n")
+        elif formato == JSON:
+            escribir(("\n" if primero else ",\n") + '{"tipo":"' + tipo + '",' + _json(datos)[1:])
+        else:
+            fila = _fila_csv(datos)
+            fila["tipo"] = tipo
+            if tabla is None:
+                columnas = ["tipo"] + [c for c in fila if c != "tipo"]
+                columnas += [c for c in COLUMNAS_RESULTADO if c not in columnas]
+                tabla = csv.DictWriter(escritor, columnas, extrasaction="ignore")
+                tabla.writeheader()
+            tabla.writerow(fila)
+        primero = False
+
+    if formato == NDJSON:
+        escribir('{"tipo":"' + traza.RESULTADO + '",' + _json(resultado)[1:] + "\n")
+    elif formato == JSON:
+        escribir('],\n"resultado":' + _json(resultado) + "}\n")
+    else:
+        if tabla is None:
+            tabla = csv.DictWriter(escritor, ("tipo",) + COLUMNAS_RESULTADO, extrasaction="ignore")
+            tabla.writeheader()
+        fila = dict(resultado, tipo=traza.RESULTADO)
+        fila["estado"] = None if resultado["estado"] is None else str(tuple(resultado["estado"]))
+        fila["camino"] = " ".join(str(accion) for _estado, accion in resultado["camino"][1:])
+        tabla.writerow(fila)
+    return resultado
+
+
+def volcar_a(ruta, iterador, formato, costo_de_accion=None):
+    """
+    volcar() sobre un escritor abierto con abrir_escritor(ruta) y cerrado al final.
+    """
+    escritor = abrir_escritor(ruta)
+    try:
+        return volcar(iterador, formato, escritor, costo_de_accion)
+    finally:
+        cerrar_escritor(escritor)
@@ -0,0 +1,136 @@
+# simetrias.py
+# --------------------------------------------------------
+# Reducción por simetría para jarras de igual capacidad.
+#
+# Dos jarras son intercambiables si tienen la misma capacidad y el
+# objetivo no las distingue (ninguna aparece en el objetivo, o las
+# dos piden los mismos litros). Los costos son por tipo de acción, así
+# que permutar jarras intercambiables no cambia costos ni objetivo:
+# los estados que difieren sólo en esa permutación son equivalentes.
+#
+# Forma canónica: dentro de cada grupo de jarras intercambiables los
+# litros se ordenan de mayor a menor. La búsqueda trabaja sobre estados
+# canónicos (un solo estado por órbita, hasta k! menos con k jarras
+# iguales) y al encontrar el objetivo se rehace el camino real desde
+# el estado inicial verdadero: en cada paso se elige la acción real
+# cuyo sucesor tiene la forma canónica del paso y el mismo costo.
+#
+# La heurística también tiene que ser simétrica (lo es la heurística
+# por defecto de ProblemaJarras); el motor sólo reduce en ese caso.
+# --------------------------------------------------------
+
+
+class Simetria:
+    """
+    Grupos de jarras intercambiables (tuplas de índices, de a dos o más).
+    """
+
+    def __init__(self, grupos):
+        self.grupos = tuple(tuple(grupo) for grupo in grupos)
+
+    def canonica(self, estado):
+        """
+        Representante de la órbita de 'estado': litros de cada grupo de mayor a menor.
+        """
+        nuevo = list(estado)
+        for grupo in self.grupos:
+            for indice, litros in zip(grupo, sorted([estado[i] for i in grupo], reverse=True)):
+                nuevo[indice] = litros
+        return tuple(nuevo)
+
+    def sucesores_canonicos(self, sucesores):
+        """
+        Envuelve sucesores(estado) para devolver sucesores canónicos, sin
+        repetir el mismo sucesor canónico con el mismo costo (se queda la
+        primera acción, en el orden determinista).
+        """
+        canonica = self.canonica
+
+        def sucesores_reducidos(estado):
+            resultado = []
+            vistos = set()
+            for nombre_accion, sucesor, costo in sucesores(estado):
+                sucesor = canonica(sucesor)
+                if (sucesor, costo) in vistos:
+                    continue
+                vistos.add((sucesor, costo))
+                resultado.append((nombre_accion, sucesor, costo))
+            return resultado
+
+        return sucesores_reducidos
+
+    def camino_real(self, sucesores, estado_inicial, estado_objetivo, diccionario_padre, diccionario_accion):
+        """
+        Rehace el camino canónico hasta 'estado_objetivo' desde el estado
+        inicial real con las acciones reales ('sucesores' sin reducir).
+        Devuelve (objetivo_real, padre, accion): copias de los diccionarios
+        canónicos con los estados del camino real agregados, así que sirven
+        para reconstruir_camino.
+        """
+        canonicos = []
+        estado = estado_objetivo
+        while estado is not None:
+            canonicos.append(estado)
+            estado = diccionario_padre.get(estado)
+        canonicos.reverse()
+
+        diccionario_padre = dict(diccionario_padre)
+        diccionario_accion = dict(diccionario_accion)
+        real = tuple(estado_inicial)
+        diccionario_padre[real] = None
+        diccionario_accion[real] = None
+        canonica = self.canonica
+        for anterior, estado in zip(canonicos, canonicos[1:]):
+            costo_paso = next(
+                costo for nombre, sucesor, costo in sucesores(anterior)
+                if nombre == diccionario_accion[estado] and canonica(sucesor) == estado
+            )
+            for nombre, sucesor, costo in sucesores(real):
+                if costo == costo_paso and canonica(sucesor) == estado:
+                    break
+            else:
+                raise RuntimeError(f"No hay acción real equivalente para llegar a {estado} desde {real}.")
+            diccionario_padre[sucesor] = real
+            diccionario_accion[sucesor] = nombre
+            real = sucesor
+        return real, diccionario_padre, diccionario_accion
+
+
+def detectar(capacidades, objetivo):
+    """
+    Devuelve la Simetria de las capacidades y el objetivo ({jarra: litros}),
+    o None si no hay dos jarras intercambiables.
+    """
+    por_clase = {}
+    for j, capacidad in enumerate(capacidades):
+        por_clase.setdefault((capacidad, objetivo.get(j)), []).append(j)
+    grupos = [grupo for grupo in por_clase.values() if len(grupo) > 1]
+    return Simetria(grupos) if grupos else None
+
+
+# Comprobación rápida: python3 simetrias.py
+# Compara A* con y sin reducción (y con grafo precompilado) en casos
+# con jarras iguales e inicial no canónico: mismo costo, camino real válido.
+if __name__ == "__main__":
+    import grafo_csr
+    import motor_jarras
+    import traza
+
+    casos = [
+        ((3, 3, 3), (1, 2, 2), {2: 1}),
+        ((6, 7, 5, 6), (1, 4, 4, 4), {1: 5}),
+        ((4, 4, 4, 4, 9), None, {4: 1}),
+    ]
+    for capacidades, estado_inicial, objetivo in casos:
+        problema = motor_jarras.ProblemaJarras(capacidades, estado_inicial=estado_inicial, objetivo=objetivo)
+        costos = []
+        for opciones in ({}, {"reducir_simetrias": False}, {"grafo": grafo_csr.construir_grafo_csr(problema)}):
+            resultado = motor_jarras.busqueda_a_estrella(problema, nivel_traza=traza.RESUMEN, **opciones)
+            camino = motor_jarras.reconstruir_camino(*resultado[:3])
+            assert camino[0][0] == problema.obtener_estado_inicial(), camino
+            for (estado, _accion), (sucesor, accion) in zip(camino, camino[1:]):
+                assert problema.aplicar_accion(estado, accion) == sucesor, camino
+            assert problema.es_estado_final(camino[-1][0]), camino
+            costos.append(sum(problema.obtener_costo_de_accion(a) for _estado, a in camino[1:]))
+        assert len(set(costos)) == 1, (capacidades, costos)
+        print(f"{capacidades} desde {problema.obtener_estado_inicial()}: costo {costos[0]} (OK)")
@@ -0,0 +1,230 @@
+# solucion_analitica.py
+# --------------------------------------------------------
+# Atajos sin búsqueda para el problema de las jarras.
+#
+# Oráculo de factibilidad (N jarras, O(jarras)):
+#   - g = mcd de las capacidades. Llenar deja la capacidad, vaciar
+#     deja 0 y transferir mueve min(origen, espacio): si todas las
+#     jarras empiezan con múltiplos de g, siempre tienen múltiplos de
+#     g. Un objetivo con litros que no son múltiplo de g (o que superan
+#     la capacidad de su jarra) es inalcanzable.
+#   - Es una condición necesaria: si no rechaza, puede que igual no
+#     haya solución (p. ej. varios objetivos a la vez).
+#
+# Solución constructiva (2 jarras vacías, objetivo en una jarra):
+#   Con dos jarras todo camino útil sigue uno de los dos ciclos de
+#   trasvase (identidad de Bézout, algoritmo de Euclides extendido):
+#     origen -> destino: si el origen está vacío se llena; si el
+#     destino está lleno se vacía; si no, se transfiere al destino.
+#   Se simulan ambos sentidos hasta que la jarra objetivo tiene los
+#   litros pedidos (O((a + b) / g) pasos, sin búsqueda) y se elige el
+#   de menor costo. 'python solucion_analitica.py' lo compara con
+#   búsqueda de costo uniforme sobre todas las instancias de hasta
+#   12 L y cientos al azar de hasta 40 L, con costos L/V/T enteros,
+#   fraccionarios y nulos: da siempre el costo óptimo.
+#   A* del motor la usa en lugar de buscar (solucion_directa) sólo si
+#   el resultado sería el mismo: traza 'ninguna' (o resolver), sin
+#   empaquetado ni grafo, y heurística declarada admisible (A* también
+#   da el costo óptimo; el camino puede ser otro de igual costo).
+#   Best-First y el haz no: su camino no es el óptimo.
+# --------------------------------------------------------
+
+import math
+
+
+# 1) Oráculo de factibilidad
+
+def mcd_capacidades(capacidades):
+    return math.gcd(*capacidades)
+
+
+def motivo_inalcanzable(problema, estado_inicial=None):
+    """
+    Devuelve un texto con el motivo si el objetivo de 'problema' es
+    inalcanzable desde 'estado_inicial' según el mcd de las capacidades,
+    o None si el oráculo no puede descartarlo.
+    """
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    capacidades = problema.capacidades
+    for j, litros in problema.objetivo.items():
+        if not 0 <= litros <= capacidades[j]:
+            return f"{litros} L no entran en la jarra {j + 1} de {capacidades[j]} L"
+    mcd = mcd_capacidades(capacidades)
+    if all(litros % mcd == 0 for litros in estado_inicial):
+        for j, litros in problema.objetivo.items():
+            if litros % mcd != 0:
+                return f"{litros} L no es múltiplo de {mcd}, el mcd de las capacidades {capacidades}"
+    return None
+
+
+# 2) Solución constructiva para dos jarras
+
+def _acciones_dos_jarras(problema):
+    """
+    {('L', j) | ('V', i) | ('T', i, j): (nombre, costo)} a partir de problema.acciones
+    (llenar tiene origen None, vaciar destino None y transferir ambos).
+    """
+    acciones = {}
+    for (_tipo, origen, destino), nombre, costo in zip(problema.acciones, problema.nombres_acciones,
+                                                       problema.costos_acciones):
+        if origen is None:
+            acciones[("L", destino)] = (nombre, costo)
+        elif destino is None:
+            acciones[("V", origen)] = (nombre, costo)
+        else:
+            acciones[("T", origen, destino)] = (nombre, costo)
+    return acciones
+
+
+def _simular_trasvase(capacidades, jarra, litros, origen, acciones):
+    """
+    Ciclo de trasvase desde 'origen' hasta que 'jarra' tenga 'litros'.
+    Devuelve (costo, [(estado, nombre_accion), ...]) o None si no llega
+    dentro del largo de un ciclo (o repite un estado).
+    """
+    destino = 1 - origen
+    estado = [0, 0]
+    camino = [((0, 0), None)]
+    vistos = {(0, 0)}
+    costo = 0
+    limite = 2 * (capacidades[0] + capacidades[1]) // mcd_capacidades(capacidades) + 4
+    while estado[jarra] != litros:
+        if len(camino) > limite:
+            return None
+        if estado[origen] == 0:
+            estado[origen] = capacidades[origen]
+            nombre, costo_accion = acciones[("L", origen)]
+        elif estado[destino] == capacidades[destino]:
+            estado[destino] = 0
+            nombre, costo_accion = acciones[("V", destino)]
+        else:
+            cantidad = min(estado[origen], capacidades[destino] - estado[destino])
+            estado[origen] -= cantidad
+            estado[destino] += cantidad
+            nombre, costo_accion = acciones[("T", origen, destino)]
+        sucesor = tuple(estado)
+        if sucesor in vistos:
+            return None
+        vistos.add(sucesor)
+        costo += costo_accion
+        camino.append((sucesor, nombre))
+    return costo, camino
+
+
+def resolver_dos_jarras(problema, estado_inicial=None):
+    """
+    Solución de costo mínimo sin búsqueda para dos jarras vacías con el
+    objetivo en una sola jarra. Devuelve (estado_objetivo, diccionario_padre,
+    diccionario_accion) con sólo los estados del camino, (None, ...) si es
+    inalcanzable, o None si el atajo no se aplica al problema.
+    """
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    estado_inicial = tuple(estado_inicial)
+    if problema.numero_jarras != 2 or estado_inicial != (0, 0) or len(problema.objetivo) != 1:
+        return None
+    if any(not isinstance(costo, (int, float)) or costo < 0 for costo in problema.costos_acciones):
+        return None
+    if motivo_inalcanzable(problema, estado_inicial) is not None:
+        return None, {estado_inicial: None}, {estado_inicial: None}
+
+    (jarra, litros), = problema.objetivo.items()
+    acciones = _acciones_dos_jarras(problema)
+    candidatos = []
+    for origen in (0, 1):
+        simulacion = _simular_trasvase(problema.capacidades, jarra, litros, origen, acciones)
+        if simulacion is not None:
+            costo, camino = simulacion
+            candidatos.append((costo, len(camino), origen, camino))
+    if not candidatos:
+        return None  # no debería pasar: que decida la búsqueda
+
+    _costo, _largo, _origen, camino = min(candidatos)
+    diccionario_padre = {estado_inicial: None}
+    diccionario_accion = {estado_inicial: None}
+    for (anterior, _accion_anterior), (estado, nombre) in zip(camino, camino[1:]):
+        diccionario_padre[estado] = anterior
+        diccionario_accion[estado] = nombre
+    return camino[-1][0], diccionario_padre, diccionario_accion
+
+
+# 3) Atajo para las búsquedas
+
+def resultado_inalcanzable(problema, estado_inicial=None):
+    """
+    Resultado sin solución (None, diccionario_padre, diccionario_accion) sin
+    explorar el grafo si el oráculo descarta el objetivo; None si hace falta
+    buscar. Lo usan los iterar_* del motor con cualquier opción y nivel de
+    traza.
+    """
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    estado_inicial = tuple(estado_inicial)
+    if motivo_inalcanzable(problema, estado_inicial) is not None:
+        return None, {estado_inicial: None}, {estado_inicial: None}
+    return None
+
+
+def solucion_directa(problema, estado_inicial=None):
+    """
+    Resultado de resolver_dos_jarras para A* si la heurística de 'problema'
+    se declara admisible (atributo 'admisible', ver heuristicas.heuristica_pdb):
+    entonces A* también da el costo óptimo y el atajo no cambia el resultado.
+    None si no se aplica y hace falta buscar.
+    """
+    if not getattr(problema._heuristica, "admisible", False):
+        return None
+    return resolver_dos_jarras(problema, estado_inicial)
+
+
+if __name__ == "__main__":
+    import itertools
+    import random
+
+    import motor_jarras
+    import traza
+
+    def costo_uniforme(_estado):
+        return 0
+
+    def costo_del_camino(problema, resultado):
+        camino = motor_jarras.reconstruir_camino(*resultado[:3])
+        assert camino[0][0] == (0, 0), camino
+        for (estado, _accion), (sucesor, accion) in zip(camino, camino[1:]):
+            assert problema.aplicar_accion(estado, accion) == sucesor, camino
+        assert problema.es_estado_final(camino[-1][0]), camino
+        return sum(problema.obtener_costo_de_accion(a) for _estado, a in camino[1:])
+
+    L, V, T = motor_jarras.LLENAR, motor_jarras.VACIAR, motor_jarras.TRANSFERIR
+    juegos_de_costos = [{}, {L: 2}, {V: 3}, {T: 2}, {L: 0.5, V: 0, T: 1.5}, {L: 5, V: 1, T: 0}]
+    casos = [
+        (capacidades, jarra, litros, costos)
+        for capacidades in itertools.product(range(1, 13), repeat=2)
+        for jarra in (0, 1)
+        for litros in range(capacidades[jarra] + 1)
+        for costos in juegos_de_costos
+    ]
+    azar = random.Random(0)
+    for _ in range(500):
+        capacidades = (azar.randint(1, 40), azar.randint(1, 40))
+        jarra = azar.randint(0, 1)
+        costos = {tipo: azar.choice([0, 0.5, 1, 2, 3, 7]) for tipo in (L, V, T)}
+        casos.append((capacidades, jarra, azar.randint(0, capacidades[jarra]), costos))
+
+    resueltos = 0
+    for capacidades, jarra, litros, costos in casos:
+        problema = motor_jarras.ProblemaJarras(capacidades, objetivo={jarra: litros}, costos=costos)
+        directa = resolver_dos_jarras(problema)
+        assert directa is not None, (capacidades, jarra, litros)
+        busqueda = motor_jarras.busqueda_a_estrella(problema.con_heuristica(costo_uniforme),
+                                                    nivel_traza=traza.NINGUNA)
+        if busqueda[0] is None:
+            assert directa[0] is None, (capacidades, jarra, litros, costos)
+            continue
+        assert directa[0] is not None, (capacidades, jarra, litros, costos)
+        optimo = costo_del_camino(problema, busqueda)
+        costo = costo_del_camino(problema, directa)
+        assert math.isclose(costo, optimo), (capacidades, jarra, litros, costos, costo, optimo)
+        resueltos += 1
+    print(f"{len(casos)} instancias ({resueltos} con solución): mismo costo que costo uniforme (OK)")
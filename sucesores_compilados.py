@@ -0,0 +1,121 @@
+# sucesores_compilados.py
+# --------------------------------------------------------
+# Funciones de sucesores generadas por configuración de jarras.
+#
+# Para unas capacidades, nombres de acciones y costos dados se
+# escribe el código de una función sucesores(estado) sin bucles:
+# las jarras se desempaquetan en variables locales (x0, x1, ...),
+# las capacidades, los nombres y los costos van como constantes y
+# cada acción es un 'if' con su sucesor armado como tupla literal,
+# en el mismo orden determinista que motor_jarras.generar_acciones.
+#
+# Ejemplo (2 jarras de 5 L y 4 L, costo 1), primeras líneas:
+#   def sucesores(estado):
+#       x0, x1 = estado
+#       resultado = []
+#       agregar = resultado.append
+#       if x0 < 5:
+#           agregar(('L5', (5, x1), 1))
+#       ...
+#
+# Las funciones se cachean por configuración, así que las copias del
+# problema (con_heuristica, con_peso) comparten la misma. Con más de
+# LIMITE_JARRAS jarras no se genera (el código crece como jarras²) y
+# se usa el bucle genérico de ProblemaJarras.sucesores.
+# --------------------------------------------------------
+
+import math
+
+LIMITE_JARRAS = 12
+
+_CACHE = {}
+
+
+# 1) Generación del código
+
+class Constantes:
+    """
+    Traduce valores a literales del código; los que no tienen literal
+    exacto (p. ej. costos infinitos) van como nombres del espacio global.
+    """
+
+    def __init__(self):
+        self.espacio = {}
+
+    def literal(self, valor):
+        if type(valor) in (int, str) or (type(valor) is float and math.isfinite(valor)):
+            return repr(valor)
+        nombre = f"_k{len(self.espacio)}"
+        self.espacio[nombre] = valor
+        return nombre
+
+
+def _tupla(elementos):
+    return "(" + ", ".join(elementos) + ("," if len(elementos) == 1 else "") + ")"
+
+
+def generar_codigo(capacidades, nombres_llenar, nombres_vaciar, nombres_transferir, costos):
+    """
+    Devuelve (codigo, espacio_global) de la función 'sucesores' para la
+    configuración dada. 'nombres_transferir' es la matriz [i][j] de nombres
+    y 'costos' la terna (llenar, vaciar, transferir).
+    """
+    constantes = Constantes()
+    costo_llenar, costo_vaciar, costo_transferir = (constantes.literal(c) for c in costos)
+    n = len(capacidades)
+    variables = [f"x{j}" for j in range(n)]
+
+    def sucesor(cambios):
+        return _tupla([cambios.get(j, variables[j]) for j in range(n)])
+
+    lineas = [
+        "def sucesores(estado):",
+        f"    {', '.join(variables)}{',' if n == 1 else ''} = estado",
+        "    resultado = []",
+        "    agregar = resultado.append",
+    ]
+    for j, capacidad in enumerate(capacidades):
+        lineas.append(f"    if x{j} < {capacidad}:")
+        lineas.append(f"        agregar(({constantes.literal(nombres_llenar[j])}, "
+                      f"{sucesor({j: repr(capacidad)})}, {costo_llenar}))")
+    for i in range(n):
+        lineas.append(f"    if x{i} > 0:")
+        lineas.append(f"        agregar(({constantes.literal(nombres_vaciar[i])}, {sucesor({i: '0'})}, {costo_vaciar}))")
+    for i in range(n):
+        destinos = [j for j in range(n) if j != i]
+        if not destinos:
+            continue
+        lineas.append(f"    if x{i} != 0:")
+        for j in destinos:
+            lineas.append(f"        espacio = {capacidades[j]} - x{j}")
+            lineas.append("        if espacio != 0:")
+            lineas.append(f"            cantidad = x{i} if x{i} < espacio else espacio")
+            lineas.append(f"            agregar(({constantes.literal(nombres_transferir[i][j])}, "
+                          f"{sucesor({i: f'x{i} - cantidad', j: f'x{j} + cantidad'})}, {costo_transferir}))")
+    lineas.append("    return resultado")
+    return "\n".join(lineas) + "\n", constantes.espacio
+
+
+# 2) Compilación con caché
+
+def compilar_sucesores(capacidades, nombres_llenar, nombres_vaciar, nombres_transferir, costos):
+    """
+    Devuelve la función sucesores(estado) -> [(nombre_accion, sucesor, costo), ...]
+    generada para la configuración (cacheada), o None si hay más de
+    LIMITE_JARRAS jarras o la configuración no se puede usar como clave.
+    """
+    if len(capacidades) > LIMITE_JARRAS:
+        return None
+    clave = (tuple(capacidades), tuple(nombres_llenar), tuple(nombres_vaciar),
+             tuple(tuple(fila) for fila in nombres_transferir), tuple(costos))
+    try:
+        funcion = _CACHE.get(clave)
+    except TypeError:  # nombres o costos no hashables
+        return None
+    if funcion is None:
+        codigo, espacio = generar_codigo(*clave)
+        exec(compile(codigo, f"<sucesores {clave[0]}>", "exec"), espacio)
+        funcion = espacio["sucesores"]
+        funcion.codigo_fuente = codigo
+        _CACHE[clave] = funcion
+    return funcion
@@ -0,0 +1,160 @@
+# tabla_costos.py
+# --------------------------------------------------------
+# Tabla de costos mínimos para todos los objetivos (jarra, litros).
+#
+# En lugar de una búsqueda A* por objetivo, se hace UN barrido de
+# Dijkstra desde el estado inicial sobre todo el espacio alcanzable
+# (con los costos de acción del problema) y se guarda:
+#   - el árbol de caminos mínimos (padre, acción y costo g por estado)
+#   - un índice (jarra, litros) -> estado más barato que lo cumple
+#
+# Dijkstra asienta los estados en orden de costo no decreciente, así
+# que el primer estado asentado con 'litros' en la jarra 'j' es el más
+# barato para ese objetivo. Cada consulta es una búsqueda O(1) en el
+# índice más la reconstrucción del camino.
+#
+# Desempates: la cola usa (g, id_incremental, estado), igual que las
+# búsquedas de motor_jarras, por lo que la tabla es determinista.
+# --------------------------------------------------------
+
+from heapq import heappush, heappop
+
+import motor_jarras
+
+# Tablas ya construidas en este proceso: (capacidades, costos, inicial) -> TablaCostos
+_TABLAS_EN_MEMORIA = {}
+
+
+# 1) Estructura de la tabla
+
+class TablaCostos:
+    """
+    Árbol de caminos mínimos desde 'estado_inicial' e índice de objetivos.
+    - costo[estado]: costo mínimo g desde el inicial
+    - padre[estado], accion[estado]: árbol de caminos mínimos
+    - mejor_estado[(jarra, litros)]: estado más barato con esos litros en la jarra
+    - orden: estados en el orden en que se asentaron (costo no decreciente)
+    """
+
+    def __init__(self, estado_inicial, costo, padre, accion, mejor_estado, orden):
+        self.estado_inicial = estado_inicial
+        self.costo = costo
+        self.padre = padre
+        self.accion = accion
+        self.mejor_estado = mejor_estado
+        self.orden = orden
+
+    def __len__(self):
+        return len(self.orden)
+
+    def objetivos(self):
+        """
+        Devuelve los pares (jarra, litros) alcanzables, ordenados.
+        """
+        return sorted(self.mejor_estado)
+
+    def estado_para(self, jarra, litros):
+        """
+        Estado más barato con 'litros' en 'jarra' (None si no es alcanzable).
+        """
+        return self.mejor_estado.get((jarra, litros))
+
+    def costo_para(self, jarra, litros):
+        """
+        Costo mínimo para tener 'litros' en 'jarra' (None si no es alcanzable).
+        """
+        estado = self.mejor_estado.get((jarra, litros))
+        return None if estado is None else self.costo[estado]
+
+    def camino_para(self, jarra, litros):
+        """
+        Camino [(estado, accion_entrada), ...] más barato para tener 'litros'
+        en 'jarra'; lista vacía si no es alcanzable.
+        """
+        return motor_jarras.reconstruir_camino(self.estado_para(jarra, litros), self.padre, self.accion)
+
+    def consultar(self, objetivo):
+        """
+        Responde un objetivo {jarra: litros} y devuelve (estado, costo, camino).
+        Con una sola jarra es una búsqueda O(1) en el índice; con varias se
+        recorre 'orden' hasta el primer estado (el más barato) que las cumple.
+        Si no es alcanzable devuelve (None, None, []).
+        """
+        objetivo = {int(j): int(x) for j, x in objetivo.items()}
+        if len(objetivo) == 1:
+            ((jarra, litros),) = objetivo.items()
+            estado = self.estado_para(jarra, litros)
+        else:
+            estado = next(
+                (e for e in self.orden if all(e[j] == x for j, x in objetivo.items())),
+                None,
+            )
+        if estado is None:
+            return None, None, []
+        return estado, self.costo[estado], motor_jarras.reconstruir_camino(estado, self.padre, self.accion)
+
+
+# 2) Construcción (Dijkstra sobre todo el espacio alcanzable)
+
+def construir_tabla_costos(problema, estado_inicial=None, grafo=None):
+    """
+    Barre con Dijkstra todo el espacio alcanzable desde 'estado_inicial'
+    (por defecto, el inicial del problema) y devuelve una TablaCostos.
+    Con 'grafo' (GrafoCSR de grafo_csr.py) los sucesores se leen del grafo.
+    El objetivo y la heurística del problema no se usan.
+    """
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    estado_inicial = tuple(estado_inicial)
+    sucesores = problema.sucesores if grafo is None else grafo.generador_sucesores(problema)
+
+    costo = {estado_inicial: 0}
+    padre = {estado_inicial: None}
+    accion = {estado_inicial: None}
+    mejor_estado = {}
+    orden = []
+    asentados = set()
+
+    # Cola de prioridad: (g, id_incremental, estado)
+    frontera = [(0, 0, estado_inicial)]
+    id_incremental = 0
+
+    while frontera:
+        g_actual, _identificador, estado_actual = heappop(frontera)
+        if estado_actual in asentados:
+            continue
+        asentados.add(estado_actual)
+        orden.append(estado_actual)
+
+        # El primer estado asentado con esos litros es el más barato
+        for jarra, litros in enumerate(estado_actual):
+            if (jarra, litros) not in mejor_estado:
+                mejor_estado[(jarra, litros)] = estado_actual
+
+        for nombre_accion, sucesor, costo_de_accion in sucesores(estado_actual):
+            g_sucesor = g_actual + costo_de_accion
+            costo_previo = costo.get(sucesor)
+            if costo_previo is None or g_sucesor < costo_previo:
+                costo[sucesor] = g_sucesor
+                padre[sucesor] = estado_actual
+                accion[sucesor] = nombre_accion
+                id_incremental += 1
+                heappush(frontera, (g_sucesor, id_incremental, sucesor))
+
+    return TablaCostos(estado_inicial, costo, padre, accion, mejor_estado, orden)
+
+
+def obtener_tabla_costos(problema, estado_inicial=None, grafo=None):
+    """
+    Devuelve la tabla del problema, construyéndola sólo la primera vez en este
+    proceso para cada combinación de capacidades, costos y estado inicial.
+    """
+    if estado_inicial is None:
+        estado_inicial = problema.obtener_estado_inicial()
+    clave = (tuple(problema.capacidades), tuple(problema.costos_acciones),
+             tuple(problema.nombres_acciones), tuple(estado_inicial))
+    tabla = _TABLAS_EN_MEMORIA.get(clave)
+    if tabla is None:
+        tabla = construir_tabla_costos(problema, estado_inicial, grafo=grafo)
+        _TABLAS_EN_MEMORIA[clave] = tabla
+    return tabla
@@ -0,0 +1,125 @@
+# traza.py
+# --------------------------------------------------------
+# Niveles de traza de las búsquedas y construcción de los
+# registros de logs_por_estado.
+#
+#   ninguna  : no se construye ningún log (sólo el camino)
+#   resumen  : un registro por expansión con contadores, sin
+#              listas de sucesores ni frontera
+#   topk     : como 'completa', pero la frontera se limita a
+#              los k mejores elementos (selección parcial)
+#   completa : frontera completa ordenada en cada expansión; se
+#              guarda como bitácora de eventos del heap (ver
+#              bitacora.py) y cada frontera se reconstruye al leerla
+#
+# Los registros son objetos con __slots__ que se leen como un
+# diccionario y recolectar_logs los guarda por columnas (ver
+# registros.py).
+# --------------------------------------------------------
+
+from heapq import nsmallest
+
+from bitacora import BitacoraExpansiones
+from registros import LogsColumnares, RegistroAEstrella, RegistroBestFirst
+
+NINGUNA = "ninguna"
+RESUMEN = "resumen"
+TOPK = "topk"
+COMPLETA = "completa"
+
+NIVELES = (NINGUNA, RESUMEN, TOPK, COMPLETA)
+
+K_FRONTERA_POR_DEFECTO = 10
+
+# Tipos de registro que producen los iteradores de búsqueda (iterar_*)
+EXPANSION = "expansion"    # datos: registro de logs_por_estado
+RESULTADO = "resultado"    # datos: (estado_objetivo, diccionario_padre, diccionario_accion)
+ITERACION = "iteracion"    # datos: resumen de una iteración (IDA*, ver ida_estrella.py)
+MEJORA = "mejora"          # datos: solución mejorada y su cota (ARA*, ver ara_estrella.py)
+
+
+def validar_nivel(nivel_traza):
+    if nivel_traza not in NIVELES:
+        raise ValueError(f"Nivel de traza desconocido: {nivel_traza} (use uno de {', '.join(NIVELES)})")
+    return nivel_traza
+
+
+def con_logs(nivel_traza):
+    return nivel_traza != NINGUNA
+
+
+def con_detalle(nivel_traza):
+    """
+    True si el nivel guarda sucesores y frontera en cada registro.
+    """
+    return nivel_traza in (TOPK, COMPLETA)
+
+
+def crear_bitacora(nivel_traza, convertir, clave_orden, diferida=True):
+    """
+    Devuelve la bitácora de eventos para el nivel 'completa' (None en otro caso).
+    - convertir(prioridad, g_actual, estado): tupla de la frontera para el log
+    - diferida=False: no se usa bitácora (los registros se consumen al vuelo y
+      la frontera se copia ordenada en cada uno)
+    """
+    if nivel_traza == COMPLETA and diferida:
+        return BitacoraExpansiones(convertir, clave_orden)
+    return None
+
+
+def frontera_para_log(frontera, nivel_traza, k_frontera, convertir, clave_orden, bitacora=None):
+    """
+    Devuelve la frontera para el log según el nivel de traza.
+    - frontera: heap con elementos (prioridad, id_incremental, estado)
+    - convertir: traduce un elemento del heap a la tupla del log
+    - clave_orden: clave de orden visual de las tuplas del log
+    - bitacora: si existe, la frontera completa se devuelve diferida desde ella
+    En 'topk' sólo se seleccionan los k menores según clave_orden (sin ordenar
+    todo): son las k primeras filas de la frontera completa, así que las
+    páginas consecutivas no se solapan ni pierden filas con empates en f.
+    """
+    if nivel_traza == COMPLETA:
+        if bitacora is not None:
+            return bitacora.frontera_diferida()
+        return sorted([convertir(t) for t in frontera], key=clave_orden)
+    if nivel_traza == TOPK:
+        return nsmallest(k_frontera, (convertir(t) for t in frontera), key=clave_orden)
+    return []
+
+
+def recolectar_logs(iterador):
+    """
+    Consume un iterador de búsqueda (iterar_*) y devuelve la tupla clásica
+    (estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado).
+    logs_por_estado es un registros.LogsColumnares (estado -> registro, de sólo lectura).
+    """
+    logs_por_estado = LogsColumnares()
+    estado_objetivo, diccionario_padre, diccionario_accion = None, {}, {}
+    for tipo, datos in iterador:
+        if tipo == EXPANSION:
+            logs_por_estado.agregar(datos["estado"], datos)
+        else:
+            estado_objetivo, diccionario_padre, diccionario_accion = datos
+    return estado_objetivo, diccionario_padre, diccionario_accion, logs_por_estado
+
+
+def registro_best_first(indice_expansion, estado, heuristica, accion_entrada, sucesores,
+                        sucesores_anadidos, frontera_total, nuevos_descubiertos,
+                        expandidos_este_paso, total_descubiertos, total_expandidos,
+                        es_objetivo, tamano_frontera):
+    return RegistroBestFirst(
+        indice_expansion, estado, heuristica, accion_entrada, sucesores, sucesores_anadidos,
+        frontera_total, nuevos_descubiertos, expandidos_este_paso, total_descubiertos,
+        total_expandidos, es_objetivo, tamano_frontera,
+    )
+
+
+def registro_a_estrella(indice_expansion, estado, costo_acumulado_g, heuristica_h, accion_entrada,
+                        sucesores, sucesores_anadidos, frontera_total, nuevos_descubiertos,
+                        expandidos_este_paso, total_descubiertos, total_expandidos,
+                        es_objetivo, tamano_frontera):
+    return RegistroAEstrella(
+        indice_expansion, estado, costo_acumulado_g, heuristica_h, accion_entrada,
+        sucesores, sucesores_anadidos, frontera_total, nuevos_descubiertos,
+        expandidos_este_paso, total_descubiertos, total_expandidos, es_objetivo, tamano_frontera,
+    )